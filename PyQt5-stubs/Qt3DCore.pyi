@@ -209,28 +209,7 @@ class QSceneChange(sip.simplewrapper):
     Nodes = ...  # type: QSceneChange.DeliveryFlag
     DeliverToAll = ...  # type: QSceneChange.DeliveryFlag
 
-    class DeliveryFlags(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QSceneChange.DeliveryFlags', 'QSceneChange.DeliveryFlag']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QSceneChange.DeliveryFlags') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QSceneChange.DeliveryFlags': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QSceneChange.DeliveryFlags', 'QSceneChange.DeliveryFlag', int]) -> 'QSceneChange.DeliveryFlags': ...
-        def __and__(self, other: typing.Union['QSceneChange.DeliveryFlags', 'QSceneChange.DeliveryFlag', int]) -> 'QSceneChange.DeliveryFlags': ...
-        def __xor__(self, other: typing.Union['QSceneChange.DeliveryFlags', 'QSceneChange.DeliveryFlag', int]) -> 'QSceneChange.DeliveryFlags': ...
-        def __ror__ (self, other: 'QSceneChange.DeliveryFlag') -> 'QSceneChange.DeliveryFlags': ...
-        def __rand__(self, other: 'QSceneChange.DeliveryFlag') -> 'QSceneChange.DeliveryFlags': ...
-        def __rxor__(self, other: 'QSceneChange.DeliveryFlag') -> 'QSceneChange.DeliveryFlags': ...
+    class DeliveryFlags(QtCore._QFlags['QSceneChange.DeliveryFlag']): ...
 
     def __init__(self, type: 'ChangeFlag', subjectId: 'QNodeId') -> None: ...
 
@@ -432,28 +411,7 @@ class QPropertyValueRemovedChange('QStaticPropertyValueRemovedChangeBase'):
     def removedValue(self) -> typing.Any: ...
     def setRemovedValue(self, value: typing.Any) -> None: ...
 
-class ChangeFlags(sip.simplewrapper):
-
-    @typing.overload
-    def __init__(self) -> None: ...
-    @typing.overload
-    def __init__(self, f: typing.Union['ChangeFlags', 'ChangeFlag']) -> None: ...
-    @typing.overload
-    def __init__(self, a0: 'ChangeFlags') -> None: ...
-    @typing.overload
-    def __init__(self, f: int) -> None: ...
-
-    def __hash__(self) -> int: ...
-    def __bool__(self) -> int: ...
-    def __invert__(self) -> 'ChangeFlags': ...
-    def __index__(self) -> int: ...
-    def __int__(self) -> int: ...
-    def __or__ (self, other: typing.Union['ChangeFlags', 'ChangeFlag', int]) -> 'ChangeFlags': ...
-    def __and__(self, other: typing.Union['ChangeFlags', 'ChangeFlag', int]) -> 'ChangeFlags': ...
-    def __xor__(self, other: typing.Union['ChangeFlags', 'ChangeFlag', int]) -> 'ChangeFlags': ...
-    def __ror__ (self, other: 'ChangeFlag') -> 'ChangeFlags': ...
-    def __rand__(self, other: 'ChangeFlag') -> 'ChangeFlags': ...
-    def __rxor__(self, other: 'ChangeFlag') -> 'ChangeFlags': ...
+class ChangeFlags(QtCore._QFlags['ChangeFlag']): ...
 
 class QSkeleton('QAbstractSkeleton'):
 
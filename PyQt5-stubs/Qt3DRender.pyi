@@ -979,28 +979,7 @@ class QClearBuffers('QFrameGraphNode'):
     ColorDepthStencilBuffer = ...  # type: QClearBuffers.BufferType
     AllBuffers = ...  # type: QClearBuffers.BufferType
 
-    class BufferTypeFlags(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QClearBuffers.BufferTypeFlags', 'QClearBuffers.BufferType']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QClearBuffers.BufferTypeFlags') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QClearBuffers.BufferTypeFlags': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QClearBuffers.BufferTypeFlags', 'QClearBuffers.BufferType', int]) -> 'QClearBuffers.BufferTypeFlags': ...
-        def __and__(self, other: typing.Union['QClearBuffers.BufferTypeFlags', 'QClearBuffers.BufferType', int]) -> 'QClearBuffers.BufferTypeFlags': ...
-        def __xor__(self, other: typing.Union['QClearBuffers.BufferTypeFlags', 'QClearBuffers.BufferType', int]) -> 'QClearBuffers.BufferTypeFlags': ...
-        def __ror__ (self, other: 'QClearBuffers.BufferType') -> 'QClearBuffers.BufferTypeFlags': ...
-        def __rand__(self, other: 'QClearBuffers.BufferType') -> 'QClearBuffers.BufferTypeFlags': ...
-        def __rxor__(self, other: 'QClearBuffers.BufferType') -> 'QClearBuffers.BufferTypeFlags': ...
+    class BufferTypeFlags(QtCore._QFlags['QClearBuffers.BufferType']): ...
 
     def __init__(self, parent: typing.Optional[Qt3DCore.QNode] = ...) -> None: ...
 
@@ -1483,28 +1462,7 @@ class QMemoryBarrier('QFrameGraphNode'):
     QueryBuffer = ...  # type: QMemoryBarrier.Operation
     All = ...  # type: QMemoryBarrier.Operation
 
-    class Operations(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QMemoryBarrier.Operations', 'QMemoryBarrier.Operation']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QMemoryBarrier.Operations') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QMemoryBarrier.Operations': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QMemoryBarrier.Operations', 'QMemoryBarrier.Operation', int]) -> 'QMemoryBarrier.Operations': ...
-        def __and__(self, other: typing.Union['QMemoryBarrier.Operations', 'QMemoryBarrier.Operation', int]) -> 'QMemoryBarrier.Operations': ...
-        def __xor__(self, other: typing.Union['QMemoryBarrier.Operations', 'QMemoryBarrier.Operation', int]) -> 'QMemoryBarrier.Operations': ...
-        def __ror__ (self, other: 'QMemoryBarrier.Operation') -> 'QMemoryBarrier.Operations': ...
-        def __rand__(self, other: 'QMemoryBarrier.Operation') -> 'QMemoryBarrier.Operations': ...
-        def __rxor__(self, other: 'QMemoryBarrier.Operation') -> 'QMemoryBarrier.Operations': ...
+    class Operations(QtCore._QFlags['QMemoryBarrier.Operation']): ...
 
     def __init__(self, parent: typing.Optional[Qt3DCore.QNode] = ...) -> None: ...
 
@@ -63,51 +63,9 @@ class QBluetooth(sip.simplewrapper):
     Encryption = ...  # type: QBluetooth.Security
     Secure = ...  # type: QBluetooth.Security
 
-    class SecurityFlags(sip.wrapper):
+    class SecurityFlags(QtCore._QFlags['QBluetooth.Security'], sip.wrapper): ...
 
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QBluetooth.SecurityFlags', 'QBluetooth.Security']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QBluetooth.SecurityFlags') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QBluetooth.SecurityFlags': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QBluetooth.SecurityFlags', 'QBluetooth.Security', int]) -> 'QBluetooth.SecurityFlags': ...
-        def __and__(self, other: typing.Union['QBluetooth.SecurityFlags', 'QBluetooth.Security', int]) -> 'QBluetooth.SecurityFlags': ...
-        def __xor__(self, other: typing.Union['QBluetooth.SecurityFlags', 'QBluetooth.Security', int]) -> 'QBluetooth.SecurityFlags': ...
-        def __ror__ (self, other: 'QBluetooth.Security') -> 'QBluetooth.SecurityFlags': ...
-        def __rand__(self, other: 'QBluetooth.Security') -> 'QBluetooth.SecurityFlags': ...
-        def __rxor__(self, other: 'QBluetooth.Security') -> 'QBluetooth.SecurityFlags': ...
-
-    class AttAccessConstraints(sip.wrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QBluetooth.AttAccessConstraints', 'QBluetooth.AttAccessConstraint']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QBluetooth.AttAccessConstraints') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QBluetooth.AttAccessConstraints': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QBluetooth.AttAccessConstraints', 'QBluetooth.AttAccessConstraint', int]) -> 'QBluetooth.AttAccessConstraints': ...
-        def __and__(self, other: typing.Union['QBluetooth.AttAccessConstraints', 'QBluetooth.AttAccessConstraint', int]) -> 'QBluetooth.AttAccessConstraints': ...
-        def __xor__(self, other: typing.Union['QBluetooth.AttAccessConstraints', 'QBluetooth.AttAccessConstraint', int]) -> 'QBluetooth.AttAccessConstraints': ...
-        def __ror__ (self, other: 'QBluetooth.AttAccessConstraint') -> 'QBluetooth.AttAccessConstraints': ...
-        def __rand__(self, other: 'QBluetooth.AttAccessConstraint') -> 'QBluetooth.AttAccessConstraints': ...
-        def __rxor__(self, other: 'QBluetooth.AttAccessConstraint') -> 'QBluetooth.AttAccessConstraints': ...
+    class AttAccessConstraints(QtCore._QFlags['QBluetooth.AttAccessConstraint'], sip.wrapper): ...
 
 
 class QBluetoothAddress(sip.wrapper):
@@ -470,74 +428,11 @@ class QBluetoothDeviceInfo(sip.wrapper):
     HealthDevice = ...  # type: QBluetoothDeviceInfo.MajorDeviceClass
     UncategorizedDevice = ...  # type: QBluetoothDeviceInfo.MajorDeviceClass
 
-    class ServiceClasses(sip.wrapper):
+    class ServiceClasses(QtCore._QFlags['QBluetoothDeviceInfo.ServiceClass'], sip.wrapper): ...
 
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QBluetoothDeviceInfo.ServiceClasses', 'QBluetoothDeviceInfo.ServiceClass']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QBluetoothDeviceInfo.ServiceClasses') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
+    class CoreConfigurations(QtCore._QFlags['QBluetoothDeviceInfo.CoreConfiguration'], sip.wrapper): ...
 
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QBluetoothDeviceInfo.ServiceClasses': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QBluetoothDeviceInfo.ServiceClasses', 'QBluetoothDeviceInfo.ServiceClass', int]) -> 'QBluetoothDeviceInfo.ServiceClasses': ...
-        def __and__(self, other: typing.Union['QBluetoothDeviceInfo.ServiceClasses', 'QBluetoothDeviceInfo.ServiceClass', int]) -> 'QBluetoothDeviceInfo.ServiceClasses': ...
-        def __xor__(self, other: typing.Union['QBluetoothDeviceInfo.ServiceClasses', 'QBluetoothDeviceInfo.ServiceClass', int]) -> 'QBluetoothDeviceInfo.ServiceClasses': ...
-        def __ror__ (self, other: 'QBluetoothDeviceInfo.ServiceClass') -> 'QBluetoothDeviceInfo.ServiceClasses': ...
-        def __rand__(self, other: 'QBluetoothDeviceInfo.ServiceClass') -> 'QBluetoothDeviceInfo.ServiceClasses': ...
-        def __rxor__(self, other: 'QBluetoothDeviceInfo.ServiceClass') -> 'QBluetoothDeviceInfo.ServiceClasses': ...
-
-    class CoreConfigurations(sip.wrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QBluetoothDeviceInfo.CoreConfigurations', 'QBluetoothDeviceInfo.CoreConfiguration']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QBluetoothDeviceInfo.CoreConfigurations') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QBluetoothDeviceInfo.CoreConfigurations': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QBluetoothDeviceInfo.CoreConfigurations', 'QBluetoothDeviceInfo.CoreConfiguration', int]) -> 'QBluetoothDeviceInfo.CoreConfigurations': ...
-        def __and__(self, other: typing.Union['QBluetoothDeviceInfo.CoreConfigurations', 'QBluetoothDeviceInfo.CoreConfiguration', int]) -> 'QBluetoothDeviceInfo.CoreConfigurations': ...
-        def __xor__(self, other: typing.Union['QBluetoothDeviceInfo.CoreConfigurations', 'QBluetoothDeviceInfo.CoreConfiguration', int]) -> 'QBluetoothDeviceInfo.CoreConfigurations': ...
-        def __ror__ (self, other: 'QBluetoothDeviceInfo.CoreConfiguration') -> 'QBluetoothDeviceInfo.CoreConfigurations': ...
-        def __rand__(self, other: 'QBluetoothDeviceInfo.CoreConfiguration') -> 'QBluetoothDeviceInfo.CoreConfigurations': ...
-        def __rxor__(self, other: 'QBluetoothDeviceInfo.CoreConfiguration') -> 'QBluetoothDeviceInfo.CoreConfigurations': ...
-
-    class Fields(sip.wrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QBluetoothDeviceInfo.Fields', 'QBluetoothDeviceInfo.Field']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QBluetoothDeviceInfo.Fields') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QBluetoothDeviceInfo.Fields': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QBluetoothDeviceInfo.Fields', 'QBluetoothDeviceInfo.Field', int]) -> 'QBluetoothDeviceInfo.Fields': ...
-        def __and__(self, other: typing.Union['QBluetoothDeviceInfo.Fields', 'QBluetoothDeviceInfo.Field', int]) -> 'QBluetoothDeviceInfo.Fields': ...
-        def __xor__(self, other: typing.Union['QBluetoothDeviceInfo.Fields', 'QBluetoothDeviceInfo.Field', int]) -> 'QBluetoothDeviceInfo.Fields': ...
-        def __ror__ (self, other: 'QBluetoothDeviceInfo.Field') -> 'QBluetoothDeviceInfo.Fields': ...
-        def __rand__(self, other: 'QBluetoothDeviceInfo.Field') -> 'QBluetoothDeviceInfo.Fields': ...
-        def __rxor__(self, other: 'QBluetoothDeviceInfo.Field') -> 'QBluetoothDeviceInfo.Fields': ...
+    class Fields(QtCore._QFlags['QBluetoothDeviceInfo.Field'], sip.wrapper): ...
 
     @typing.overload
     def __init__(self) -> None: ...
@@ -1651,28 +1546,7 @@ class QLowEnergyCharacteristic(sip.wrapper):
     WriteSigned = ...  # type: QLowEnergyCharacteristic.PropertyType
     ExtendedProperty = ...  # type: QLowEnergyCharacteristic.PropertyType
 
-    class PropertyTypes(sip.wrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QLowEnergyCharacteristic.PropertyTypes', 'QLowEnergyCharacteristic.PropertyType']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QLowEnergyCharacteristic.PropertyTypes') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QLowEnergyCharacteristic.PropertyTypes': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QLowEnergyCharacteristic.PropertyTypes', 'QLowEnergyCharacteristic.PropertyType', int]) -> 'QLowEnergyCharacteristic.PropertyTypes': ...
-        def __and__(self, other: typing.Union['QLowEnergyCharacteristic.PropertyTypes', 'QLowEnergyCharacteristic.PropertyType', int]) -> 'QLowEnergyCharacteristic.PropertyTypes': ...
-        def __xor__(self, other: typing.Union['QLowEnergyCharacteristic.PropertyTypes', 'QLowEnergyCharacteristic.PropertyType', int]) -> 'QLowEnergyCharacteristic.PropertyTypes': ...
-        def __ror__ (self, other: 'QLowEnergyCharacteristic.PropertyType') -> 'QLowEnergyCharacteristic.PropertyTypes': ...
-        def __rand__(self, other: 'QLowEnergyCharacteristic.PropertyType') -> 'QLowEnergyCharacteristic.PropertyTypes': ...
-        def __rxor__(self, other: 'QLowEnergyCharacteristic.PropertyType') -> 'QLowEnergyCharacteristic.PropertyTypes': ...
+    class PropertyTypes(QtCore._QFlags['QLowEnergyCharacteristic.PropertyType'], sip.wrapper): ...
 
     @typing.overload
     def __init__(self) -> None: ...
@@ -1918,28 +1792,7 @@ class QLowEnergyService(QtCore.QObject):
     PrimaryService = ...  # type: QLowEnergyService.ServiceType
     IncludedService = ...  # type: QLowEnergyService.ServiceType
 
-    class ServiceTypes(sip.wrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QLowEnergyService.ServiceTypes', 'QLowEnergyService.ServiceType']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QLowEnergyService.ServiceTypes') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QLowEnergyService.ServiceTypes': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QLowEnergyService.ServiceTypes', 'QLowEnergyService.ServiceType', int]) -> 'QLowEnergyService.ServiceTypes': ...
-        def __and__(self, other: typing.Union['QLowEnergyService.ServiceTypes', 'QLowEnergyService.ServiceType', int]) -> 'QLowEnergyService.ServiceTypes': ...
-        def __xor__(self, other: typing.Union['QLowEnergyService.ServiceTypes', 'QLowEnergyService.ServiceType', int]) -> 'QLowEnergyService.ServiceTypes': ...
-        def __ror__ (self, other: 'QLowEnergyService.ServiceType') -> 'QLowEnergyService.ServiceTypes': ...
-        def __rand__(self, other: 'QLowEnergyService.ServiceType') -> 'QLowEnergyService.ServiceTypes': ...
-        def __rxor__(self, other: 'QLowEnergyService.ServiceType') -> 'QLowEnergyService.ServiceTypes': ...
+    class ServiceTypes(QtCore._QFlags['QLowEnergyService.ServiceType'], sip.wrapper): ...
 
     descriptorRead: typing.ClassVar[QtCore.pyqtSignal]
     characteristicRead: typing.ClassVar[QtCore.pyqtSignal]
@@ -57,28 +57,7 @@ class QAbstractAxis(QtCore.QObject):
     AxisTypeDateTime = ...  # type: QAbstractAxis.AxisType
     AxisTypeLogValue = ...  # type: QAbstractAxis.AxisType
 
-    class AxisTypes(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QAbstractAxis.AxisTypes', 'QAbstractAxis.AxisType']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QAbstractAxis.AxisTypes') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QAbstractAxis.AxisTypes': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QAbstractAxis.AxisTypes', 'QAbstractAxis.AxisType', int]) -> 'QAbstractAxis.AxisTypes': ...
-        def __and__(self, other: typing.Union['QAbstractAxis.AxisTypes', 'QAbstractAxis.AxisType', int]) -> 'QAbstractAxis.AxisTypes': ...
-        def __xor__(self, other: typing.Union['QAbstractAxis.AxisTypes', 'QAbstractAxis.AxisType', int]) -> 'QAbstractAxis.AxisTypes': ...
-        def __ror__ (self, other: 'QAbstractAxis.AxisType') -> 'QAbstractAxis.AxisTypes': ...
-        def __rand__(self, other: 'QAbstractAxis.AxisType') -> 'QAbstractAxis.AxisTypes': ...
-        def __rxor__(self, other: 'QAbstractAxis.AxisType') -> 'QAbstractAxis.AxisTypes': ...
+    class AxisTypes(QtCore._QFlags['QAbstractAxis.AxisType']): ...
 
     labelsEditableChanged: typing.ClassVar[QtCore.pyqtSignal]
     def labelsEditable(self) -> bool: ...
@@ -782,28 +761,7 @@ class QChart(QtWidgets.QGraphicsWidget):
     ChartThemeBlueIcy = ...  # type: QChart.ChartTheme
     ChartThemeQt = ...  # type: QChart.ChartTheme
 
-    class AnimationOptions(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QChart.AnimationOptions', 'QChart.AnimationOption']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QChart.AnimationOptions') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QChart.AnimationOptions': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QChart.AnimationOptions', 'QChart.AnimationOption', int]) -> 'QChart.AnimationOptions': ...
-        def __and__(self, other: typing.Union['QChart.AnimationOptions', 'QChart.AnimationOption', int]) -> 'QChart.AnimationOptions': ...
-        def __xor__(self, other: typing.Union['QChart.AnimationOptions', 'QChart.AnimationOption', int]) -> 'QChart.AnimationOptions': ...
-        def __ror__ (self, other: 'QChart.AnimationOption') -> 'QChart.AnimationOptions': ...
-        def __rand__(self, other: 'QChart.AnimationOption') -> 'QChart.AnimationOptions': ...
-        def __rxor__(self, other: 'QChart.AnimationOption') -> 'QChart.AnimationOptions': ...
+    class AnimationOptions(QtCore._QFlags['QChart.AnimationOption']): ...
 
     def __init__(self, parent: typing.Optional[QtWidgets.QGraphicsItem] = ..., flags: typing.Union[QtCore.Qt.WindowFlags, QtCore.Qt.WindowType] = ...) -> None: ...
 
@@ -885,28 +843,7 @@ class QChartView(QtWidgets.QGraphicsView):
     HorizontalRubberBand = ...  # type: QChartView.RubberBand
     RectangleRubberBand = ...  # type: QChartView.RubberBand
 
-    class RubberBands(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QChartView.RubberBands', 'QChartView.RubberBand']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QChartView.RubberBands') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QChartView.RubberBands': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QChartView.RubberBands', 'QChartView.RubberBand', int]) -> 'QChartView.RubberBands': ...
-        def __and__(self, other: typing.Union['QChartView.RubberBands', 'QChartView.RubberBand', int]) -> 'QChartView.RubberBands': ...
-        def __xor__(self, other: typing.Union['QChartView.RubberBands', 'QChartView.RubberBand', int]) -> 'QChartView.RubberBands': ...
-        def __ror__ (self, other: 'QChartView.RubberBand') -> 'QChartView.RubberBands': ...
-        def __rand__(self, other: 'QChartView.RubberBand') -> 'QChartView.RubberBands': ...
-        def __rxor__(self, other: 'QChartView.RubberBand') -> 'QChartView.RubberBands': ...
+    class RubberBands(QtCore._QFlags['QChartView.RubberBand']): ...
 
     @typing.overload
     def __init__(self, parent: typing.Optional[QtWidgets.QWidget] = ...) -> None: ...
@@ -1370,28 +1307,7 @@ class QPolarChart('QChart'):
     PolarOrientationRadial = ...  # type: QPolarChart.PolarOrientation
     PolarOrientationAngular = ...  # type: QPolarChart.PolarOrientation
 
-    class PolarOrientations(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QPolarChart.PolarOrientations', 'QPolarChart.PolarOrientation']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QPolarChart.PolarOrientations') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QPolarChart.PolarOrientations': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QPolarChart.PolarOrientations', 'QPolarChart.PolarOrientation', int]) -> 'QPolarChart.PolarOrientations': ...
-        def __and__(self, other: typing.Union['QPolarChart.PolarOrientations', 'QPolarChart.PolarOrientation', int]) -> 'QPolarChart.PolarOrientations': ...
-        def __xor__(self, other: typing.Union['QPolarChart.PolarOrientations', 'QPolarChart.PolarOrientation', int]) -> 'QPolarChart.PolarOrientations': ...
-        def __ror__ (self, other: 'QPolarChart.PolarOrientation') -> 'QPolarChart.PolarOrientations': ...
-        def __rand__(self, other: 'QPolarChart.PolarOrientation') -> 'QPolarChart.PolarOrientations': ...
-        def __rxor__(self, other: 'QPolarChart.PolarOrientation') -> 'QPolarChart.PolarOrientations': ...
+    class PolarOrientations(QtCore._QFlags['QPolarChart.PolarOrientation']): ...
 
     def __init__(self, parent: typing.Optional[QtWidgets.QGraphicsItem] = ..., flags: typing.Union[QtCore.Qt.WindowFlags, QtCore.Qt.WindowType] = ...) -> None: ...
 
@@ -25,13 +25,37 @@ import typing
 
 from PyQt5 import sip
 from PyQt5 import QtCore
-from PyQt5 import QtWidgets
 import enum  # import was missing
 
 # Support for QDate, QDateTime and QTime.
 import datetime
 
 
+_QFlagsEnumT = typing.TypeVar('_QFlagsEnumT', bound=int)
+_QFlagsT = typing.TypeVar('_QFlagsT', bound='_QFlags[typing.Any]')
+
+class _QFlags(sip.simplewrapper, typing.Generic[_QFlagsEnumT]):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, f: typing.Union['_QFlags[_QFlagsEnumT]', _QFlagsEnumT]) -> None: ...
+    @typing.overload
+    def __init__(self, f: int) -> None: ...
+
+    def __hash__(self) -> int: ...
+    def __bool__(self) -> int: ...
+    def __invert__(self: _QFlagsT) -> _QFlagsT: ...
+    def __index__(self) -> int: ...
+    def __int__(self) -> int: ...
+    def __or__ (self: _QFlagsT, other: typing.Union[_QFlagsT, _QFlagsEnumT, int]) -> _QFlagsT: ...
+    def __and__(self: _QFlagsT, other: typing.Union[_QFlagsT, _QFlagsEnumT, int]) -> _QFlagsT: ...
+    def __xor__(self: _QFlagsT, other: typing.Union[_QFlagsT, _QFlagsEnumT, int]) -> _QFlagsT: ...
+    def __ror__ (self: _QFlagsT, other: _QFlagsEnumT) -> _QFlagsT: ...
+    def __rand__(self: _QFlagsT, other: _QFlagsEnumT) -> _QFlagsT: ...
+    def __rxor__(self: _QFlagsT, other: _QFlagsEnumT) -> _QFlagsT: ...
+
+
 class pyqtBoundSignal:
 
     signal = ... # type: str
@@ -2808,507 +2832,49 @@ class Qt(sip.simplewrapper):
     darkYellow = ...  # type: Qt.GlobalColor
     transparent = ...  # type: Qt.GlobalColor
 
-    class KeyboardModifiers(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['Qt.KeyboardModifiers', 'Qt.KeyboardModifier']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'Qt.KeyboardModifiers') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'Qt.KeyboardModifiers': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['Qt.KeyboardModifiers', 'Qt.KeyboardModifier', int]) -> 'Qt.KeyboardModifiers': ...
-        def __and__(self, other: typing.Union['Qt.KeyboardModifiers', 'Qt.KeyboardModifier', int]) -> 'Qt.KeyboardModifiers': ...
-        def __xor__(self, other: typing.Union['Qt.KeyboardModifiers', 'Qt.KeyboardModifier', int]) -> 'Qt.KeyboardModifiers': ...
-        def __ror__ (self, other: 'Qt.KeyboardModifier') -> 'Qt.KeyboardModifiers': ...
-        def __rand__(self, other: 'Qt.KeyboardModifier') -> 'Qt.KeyboardModifiers': ...
-        def __rxor__(self, other: 'Qt.KeyboardModifier') -> 'Qt.KeyboardModifiers': ...
-
-    class MouseButtons(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['Qt.MouseButtons', 'Qt.MouseButton']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'Qt.MouseButtons') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'Qt.MouseButtons': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['Qt.MouseButtons', 'Qt.MouseButton', int]) -> 'Qt.MouseButtons': ...
-        def __and__(self, other: typing.Union['Qt.MouseButtons', 'Qt.MouseButton', int]) -> 'Qt.MouseButtons': ...
-        def __xor__(self, other: typing.Union['Qt.MouseButtons', 'Qt.MouseButton', int]) -> 'Qt.MouseButtons': ...
-        def __ror__ (self, other: 'Qt.MouseButton') -> 'Qt.MouseButtons': ...
-        def __rand__(self, other: 'Qt.MouseButton') -> 'Qt.MouseButtons': ...
-        def __rxor__(self, other: 'Qt.MouseButton') -> 'Qt.MouseButtons': ...
-
-    class Orientations(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['Qt.Orientations', 'Qt.Orientation']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'Qt.Orientations') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'Qt.Orientations': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['Qt.Orientations', 'Qt.Orientation', int]) -> 'Qt.Orientations': ...
-        def __and__(self, other: typing.Union['Qt.Orientations', 'Qt.Orientation', int]) -> 'Qt.Orientations': ...
-        def __xor__(self, other: typing.Union['Qt.Orientations', 'Qt.Orientation', int]) -> 'Qt.Orientations': ...
-        def __ror__ (self, other: 'Qt.Orientation') -> 'Qt.Orientations': ...
-        def __rand__(self, other: 'Qt.Orientation') -> 'Qt.Orientations': ...
-        def __rxor__(self, other: 'Qt.Orientation') -> 'Qt.Orientations': ...
-
-    class Alignment(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['Qt.Alignment', 'Qt.AlignmentFlag', int]) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'Qt.Alignment') -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'Qt.Alignment': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['Qt.Alignment', 'Qt.AlignmentFlag', int]) -> 'Qt.Alignment': ...
-        def __and__(self, other: typing.Union['Qt.Alignment', 'Qt.AlignmentFlag', int]) -> 'Qt.Alignment': ...
-        def __xor__(self, other: typing.Union['Qt.Alignment', 'Qt.AlignmentFlag', int]) -> 'Qt.Alignment': ...
-        def __ror__ (self, other: 'Qt.AlignmentFlag') -> 'Qt.Alignment': ...
-        def __rand__(self, other: 'Qt.AlignmentFlag') -> 'Qt.Alignment': ...
-        def __rxor__(self, other: 'Qt.AlignmentFlag') -> 'Qt.Alignment': ...
-
-    class WindowFlags(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['Qt.WindowFlags', 'Qt.WindowType', int]) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'Qt.WindowFlags') -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'Qt.WindowFlags': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['Qt.WindowFlags', 'Qt.WindowType', int]) -> 'Qt.WindowFlags': ...
-        def __and__(self, other: typing.Union['Qt.WindowFlags', 'Qt.WindowType', int]) -> 'Qt.WindowFlags': ...
-        def __xor__(self, other: typing.Union['Qt.WindowFlags', 'Qt.WindowType', int]) -> 'Qt.WindowFlags': ...
-        def __ror__ (self, other: 'Qt.WindowType') -> 'Qt.WindowFlags': ...
-        def __rand__(self, other: 'Qt.WindowType') -> 'Qt.WindowFlags': ...
-        def __rxor__(self, other: 'Qt.WindowType') -> 'Qt.WindowFlags': ...
-
-    class WindowStates(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['Qt.WindowStates', 'Qt.WindowState']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'Qt.WindowStates') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'Qt.WindowStates': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['Qt.WindowStates', 'Qt.WindowState', int]) -> 'Qt.WindowStates': ...
-        def __and__(self, other: typing.Union['Qt.WindowStates', 'Qt.WindowState', int]) -> 'Qt.WindowStates': ...
-        def __xor__(self, other: typing.Union['Qt.WindowStates', 'Qt.WindowState', int]) -> 'Qt.WindowStates': ...
-        def __ror__ (self, other: 'Qt.WindowState') -> 'Qt.WindowStates': ...
-        def __rand__(self, other: 'Qt.WindowState') -> 'Qt.WindowStates': ...
-        def __rxor__(self, other: 'Qt.WindowState') -> 'Qt.WindowStates': ...
-
-    class ImageConversionFlags(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['Qt.ImageConversionFlags', 'Qt.ImageConversionFlag']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'Qt.ImageConversionFlags') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'Qt.ImageConversionFlags': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['Qt.ImageConversionFlags', 'Qt.ImageConversionFlag', int]) -> 'Qt.ImageConversionFlags': ...
-        def __and__(self, other: typing.Union['Qt.ImageConversionFlags', 'Qt.ImageConversionFlag', int]) -> 'Qt.ImageConversionFlags': ...
-        def __xor__(self, other: typing.Union['Qt.ImageConversionFlags', 'Qt.ImageConversionFlag', int]) -> 'Qt.ImageConversionFlags': ...
-        def __ror__ (self, other: 'Qt.ImageConversionFlag') -> 'Qt.ImageConversionFlags': ...
-        def __rand__(self, other: 'Qt.ImageConversionFlag') -> 'Qt.ImageConversionFlags': ...
-        def __rxor__(self, other: 'Qt.ImageConversionFlag') -> 'Qt.ImageConversionFlags': ...
-
-    class DockWidgetAreas(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['Qt.DockWidgetAreas', 'Qt.DockWidgetArea']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'Qt.DockWidgetAreas') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'Qt.DockWidgetAreas': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['Qt.DockWidgetAreas', 'Qt.DockWidgetArea', int]) -> 'Qt.DockWidgetAreas': ...
-        def __and__(self, other: typing.Union['Qt.DockWidgetAreas', 'Qt.DockWidgetArea', int]) -> 'Qt.DockWidgetAreas': ...
-        def __xor__(self, other: typing.Union['Qt.DockWidgetAreas', 'Qt.DockWidgetArea', int]) -> 'Qt.DockWidgetAreas': ...
-        def __ror__ (self, other: 'Qt.DockWidgetArea') -> 'Qt.DockWidgetAreas': ...
-        def __rand__(self, other: 'Qt.DockWidgetArea') -> 'Qt.DockWidgetAreas': ...
-        def __rxor__(self, other: 'Qt.DockWidgetArea') -> 'Qt.DockWidgetAreas': ...
-
-    class ToolBarAreas(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['Qt.ToolBarAreas', 'Qt.ToolBarArea']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'Qt.ToolBarAreas') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'Qt.ToolBarAreas': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['Qt.ToolBarAreas', 'Qt.ToolBarArea', int]) -> 'Qt.ToolBarAreas': ...
-        def __and__(self, other: typing.Union['Qt.ToolBarAreas', 'Qt.ToolBarArea', int]) -> 'Qt.ToolBarAreas': ...
-        def __xor__(self, other: typing.Union['Qt.ToolBarAreas', 'Qt.ToolBarArea', int]) -> 'Qt.ToolBarAreas': ...
-        def __ror__ (self, other: 'Qt.ToolBarArea') -> 'Qt.ToolBarAreas': ...
-        def __rand__(self, other: 'Qt.ToolBarArea') -> 'Qt.ToolBarAreas': ...
-        def __rxor__(self, other: 'Qt.ToolBarArea') -> 'Qt.ToolBarAreas': ...
-
-    class InputMethodQueries(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['Qt.InputMethodQueries', 'Qt.InputMethodQuery']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'Qt.InputMethodQueries') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'Qt.InputMethodQueries': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['Qt.InputMethodQueries', 'Qt.InputMethodQuery', int]) -> 'Qt.InputMethodQueries': ...
-        def __and__(self, other: typing.Union['Qt.InputMethodQueries', 'Qt.InputMethodQuery', int]) -> 'Qt.InputMethodQueries': ...
-        def __xor__(self, other: typing.Union['Qt.InputMethodQueries', 'Qt.InputMethodQuery', int]) -> 'Qt.InputMethodQueries': ...
-        def __ror__ (self, other: 'Qt.InputMethodQuery') -> 'Qt.InputMethodQueries': ...
-        def __rand__(self, other: 'Qt.InputMethodQuery') -> 'Qt.InputMethodQueries': ...
-        def __rxor__(self, other: 'Qt.InputMethodQuery') -> 'Qt.InputMethodQueries': ...
-
-    class DropActions(sip.simplewrapper):
+    class KeyboardModifiers(QtCore._QFlags['Qt.KeyboardModifier']): ...
 
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['Qt.DropActions', 'Qt.DropAction']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'Qt.DropActions') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
+    class MouseButtons(QtCore._QFlags['Qt.MouseButton']): ...
 
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'Qt.DropActions': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['Qt.DropActions', 'Qt.DropAction', int]) -> 'Qt.DropActions': ...
-        def __and__(self, other: typing.Union['Qt.DropActions', 'Qt.DropAction', int]) -> 'Qt.DropActions': ...
-        def __xor__(self, other: typing.Union['Qt.DropActions', 'Qt.DropAction', int]) -> 'Qt.DropActions': ...
-        def __ror__ (self, other: 'Qt.DropAction') -> 'Qt.DropActions': ...
-        def __rand__(self, other: 'Qt.DropAction') -> 'Qt.DropActions': ...
-        def __rxor__(self, other: 'Qt.DropAction') -> 'Qt.DropActions': ...
-
-    class ItemFlags(sip.simplewrapper):
+    class Orientations(QtCore._QFlags['Qt.Orientation']): ...
 
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['Qt.ItemFlags', 'Qt.ItemFlag']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'Qt.ItemFlags') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
+    class Alignment(QtCore._QFlags['Qt.AlignmentFlag']): ...
 
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'Qt.ItemFlags': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['Qt.ItemFlags', 'Qt.ItemFlag', int]) -> 'Qt.ItemFlags': ...
-        def __and__(self, other: typing.Union['Qt.ItemFlags', 'Qt.ItemFlag', int]) -> 'Qt.ItemFlags': ...
-        def __xor__(self, other: typing.Union['Qt.ItemFlags', 'Qt.ItemFlag', int]) -> 'Qt.ItemFlags': ...
-        def __ror__ (self, other: 'Qt.ItemFlag') -> 'Qt.ItemFlags': ...
-        def __rand__(self, other: 'Qt.ItemFlag') -> 'Qt.ItemFlags': ...
-        def __rxor__(self, other: 'Qt.ItemFlag') -> 'Qt.ItemFlags': ...
-
-    class MatchFlags(sip.simplewrapper):
+    class WindowFlags(QtCore._QFlags['Qt.WindowType']): ...
 
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['Qt.MatchFlags', 'Qt.MatchFlag']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'Qt.MatchFlags') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
+    class WindowStates(QtCore._QFlags['Qt.WindowState']): ...
 
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'Qt.MatchFlags': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['Qt.MatchFlags', 'Qt.MatchFlag', int]) -> 'Qt.MatchFlags': ...
-        def __and__(self, other: typing.Union['Qt.MatchFlags', 'Qt.MatchFlag', int]) -> 'Qt.MatchFlags': ...
-        def __xor__(self, other: typing.Union['Qt.MatchFlags', 'Qt.MatchFlag', int]) -> 'Qt.MatchFlags': ...
-        def __ror__ (self, other: 'Qt.MatchFlag') -> 'Qt.MatchFlags': ...
-        def __rand__(self, other: 'Qt.MatchFlag') -> 'Qt.MatchFlags': ...
-        def __rxor__(self, other: 'Qt.MatchFlag') -> 'Qt.MatchFlags': ...
-
-    class TextInteractionFlags(sip.simplewrapper):
+    class ImageConversionFlags(QtCore._QFlags['Qt.ImageConversionFlag']): ...
 
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['Qt.TextInteractionFlags', 'Qt.TextInteractionFlag']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'Qt.TextInteractionFlags') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
+    class DockWidgetAreas(QtCore._QFlags['Qt.DockWidgetArea']): ...
 
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'Qt.TextInteractionFlags': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['Qt.TextInteractionFlags', 'Qt.TextInteractionFlag', int]) -> 'Qt.TextInteractionFlags': ...
-        def __and__(self, other: typing.Union['Qt.TextInteractionFlags', 'Qt.TextInteractionFlag', int]) -> 'Qt.TextInteractionFlags': ...
-        def __xor__(self, other: typing.Union['Qt.TextInteractionFlags', 'Qt.TextInteractionFlag', int]) -> 'Qt.TextInteractionFlags': ...
-        def __ror__ (self, other: 'Qt.TextInteractionFlag') -> 'Qt.TextInteractionFlags': ...
-        def __rand__(self, other: 'Qt.TextInteractionFlag') -> 'Qt.TextInteractionFlags': ...
-        def __rxor__(self, other: 'Qt.TextInteractionFlag') -> 'Qt.TextInteractionFlags': ...
-
-    class InputMethodHints(sip.simplewrapper):
+    class ToolBarAreas(QtCore._QFlags['Qt.ToolBarArea']): ...
 
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['Qt.InputMethodHints', 'Qt.InputMethodHint']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'Qt.InputMethodHints') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
+    class InputMethodQueries(QtCore._QFlags['Qt.InputMethodQuery']): ...
 
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'Qt.InputMethodHints': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['Qt.InputMethodHints', 'Qt.InputMethodHint', int]) -> 'Qt.InputMethodHints': ...
-        def __and__(self, other: typing.Union['Qt.InputMethodHints', 'Qt.InputMethodHint', int]) -> 'Qt.InputMethodHints': ...
-        def __xor__(self, other: typing.Union['Qt.InputMethodHints', 'Qt.InputMethodHint', int]) -> 'Qt.InputMethodHints': ...
-        def __ror__ (self, other: 'Qt.InputMethodHint') -> 'Qt.InputMethodHints': ...
-        def __rand__(self, other: 'Qt.InputMethodHint') -> 'Qt.InputMethodHints': ...
-        def __rxor__(self, other: 'Qt.InputMethodHint') -> 'Qt.InputMethodHints': ...
-
-    class TouchPointStates(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['Qt.TouchPointStates', 'Qt.TouchPointState']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'Qt.TouchPointStates') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'Qt.TouchPointStates': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['Qt.TouchPointStates', 'Qt.TouchPointState', int]) -> 'Qt.TouchPointStates': ...
-        def __and__(self, other: typing.Union['Qt.TouchPointStates', 'Qt.TouchPointState', int]) -> 'Qt.TouchPointStates': ...
-        def __xor__(self, other: typing.Union['Qt.TouchPointStates', 'Qt.TouchPointState', int]) -> 'Qt.TouchPointStates': ...
-        def __ror__ (self, other: 'Qt.TouchPointState') -> 'Qt.TouchPointStates': ...
-        def __rand__(self, other: 'Qt.TouchPointState') -> 'Qt.TouchPointStates': ...
-        def __rxor__(self, other: 'Qt.TouchPointState') -> 'Qt.TouchPointStates': ...
-
-    class GestureFlags(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['Qt.GestureFlags', 'Qt.GestureFlag']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'Qt.GestureFlags') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
+    class DropActions(QtCore._QFlags['Qt.DropAction']): ...
 
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'Qt.GestureFlags': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['Qt.GestureFlags', 'Qt.GestureFlag', int]) -> 'Qt.GestureFlags': ...
-        def __and__(self, other: typing.Union['Qt.GestureFlags', 'Qt.GestureFlag', int]) -> 'Qt.GestureFlags': ...
-        def __xor__(self, other: typing.Union['Qt.GestureFlags', 'Qt.GestureFlag', int]) -> 'Qt.GestureFlags': ...
-        def __ror__ (self, other: 'Qt.GestureFlag') -> 'Qt.GestureFlags': ...
-        def __rand__(self, other: 'Qt.GestureFlag') -> 'Qt.GestureFlags': ...
-        def __rxor__(self, other: 'Qt.GestureFlag') -> 'Qt.GestureFlags': ...
-
-    class ScreenOrientations(sip.simplewrapper):
+    class ItemFlags(QtCore._QFlags['Qt.ItemFlag']): ...
 
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['Qt.ScreenOrientations', 'Qt.ScreenOrientation']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'Qt.ScreenOrientations') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
+    class MatchFlags(QtCore._QFlags['Qt.MatchFlag']): ...
 
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'Qt.ScreenOrientations': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['Qt.ScreenOrientations', 'Qt.ScreenOrientation', int]) -> 'Qt.ScreenOrientations': ...
-        def __and__(self, other: typing.Union['Qt.ScreenOrientations', 'Qt.ScreenOrientation', int]) -> 'Qt.ScreenOrientations': ...
-        def __xor__(self, other: typing.Union['Qt.ScreenOrientations', 'Qt.ScreenOrientation', int]) -> 'Qt.ScreenOrientations': ...
-        def __ror__ (self, other: 'Qt.ScreenOrientation') -> 'Qt.ScreenOrientations': ...
-        def __rand__(self, other: 'Qt.ScreenOrientation') -> 'Qt.ScreenOrientations': ...
-        def __rxor__(self, other: 'Qt.ScreenOrientation') -> 'Qt.ScreenOrientations': ...
-
-    class FindChildOptions(sip.simplewrapper):
+    class TextInteractionFlags(QtCore._QFlags['Qt.TextInteractionFlag']): ...
 
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['Qt.FindChildOptions', 'Qt.FindChildOption']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'Qt.FindChildOptions') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
+    class InputMethodHints(QtCore._QFlags['Qt.InputMethodHint']): ...
 
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'Qt.FindChildOptions': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['Qt.FindChildOptions', 'Qt.FindChildOption', int]) -> 'Qt.FindChildOptions': ...
-        def __and__(self, other: typing.Union['Qt.FindChildOptions', 'Qt.FindChildOption', int]) -> 'Qt.FindChildOptions': ...
-        def __xor__(self, other: typing.Union['Qt.FindChildOptions', 'Qt.FindChildOption', int]) -> 'Qt.FindChildOptions': ...
-        def __ror__ (self, other: 'Qt.FindChildOption') -> 'Qt.FindChildOptions': ...
-        def __rand__(self, other: 'Qt.FindChildOption') -> 'Qt.FindChildOptions': ...
-        def __rxor__(self, other: 'Qt.FindChildOption') -> 'Qt.FindChildOptions': ...
-
-    class ApplicationStates(sip.simplewrapper):
+    class TouchPointStates(QtCore._QFlags['Qt.TouchPointState']): ...
 
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['Qt.ApplicationStates', 'Qt.ApplicationState']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'Qt.ApplicationStates') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
+    class GestureFlags(QtCore._QFlags['Qt.GestureFlag']): ...
 
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'Qt.ApplicationStates': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['Qt.ApplicationStates', 'Qt.ApplicationState', int]) -> 'Qt.ApplicationStates': ...
-        def __and__(self, other: typing.Union['Qt.ApplicationStates', 'Qt.ApplicationState', int]) -> 'Qt.ApplicationStates': ...
-        def __xor__(self, other: typing.Union['Qt.ApplicationStates', 'Qt.ApplicationState', int]) -> 'Qt.ApplicationStates': ...
-        def __ror__ (self, other: 'Qt.ApplicationState') -> 'Qt.ApplicationStates': ...
-        def __rand__(self, other: 'Qt.ApplicationState') -> 'Qt.ApplicationStates': ...
-        def __rxor__(self, other: 'Qt.ApplicationState') -> 'Qt.ApplicationStates': ...
-
-    class Edges(sip.simplewrapper):
+    class ScreenOrientations(QtCore._QFlags['Qt.ScreenOrientation']): ...
 
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['Qt.Edges', 'Qt.Edge']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'Qt.Edges') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
+    class FindChildOptions(QtCore._QFlags['Qt.FindChildOption']): ...
 
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'Qt.Edges': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['Qt.Edges', 'Qt.Edge', int]) -> 'Qt.Edges': ...
-        def __and__(self, other: typing.Union['Qt.Edges', 'Qt.Edge', int]) -> 'Qt.Edges': ...
-        def __xor__(self, other: typing.Union['Qt.Edges', 'Qt.Edge', int]) -> 'Qt.Edges': ...
-        def __ror__ (self, other: 'Qt.Edge') -> 'Qt.Edges': ...
-        def __rand__(self, other: 'Qt.Edge') -> 'Qt.Edges': ...
-        def __rxor__(self, other: 'Qt.Edge') -> 'Qt.Edges': ...
-
-    class MouseEventFlags(sip.simplewrapper):
+    class ApplicationStates(QtCore._QFlags['Qt.ApplicationState']): ...
 
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['Qt.MouseEventFlags', 'Qt.MouseEventFlag']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'Qt.MouseEventFlags') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
+    class Edges(QtCore._QFlags['Qt.Edge']): ...
 
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'Qt.MouseEventFlags': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['Qt.MouseEventFlags', 'Qt.MouseEventFlag', int]) -> 'Qt.MouseEventFlags': ...
-        def __and__(self, other: typing.Union['Qt.MouseEventFlags', 'Qt.MouseEventFlag', int]) -> 'Qt.MouseEventFlags': ...
-        def __xor__(self, other: typing.Union['Qt.MouseEventFlags', 'Qt.MouseEventFlag', int]) -> 'Qt.MouseEventFlags': ...
-        def __ror__ (self, other: 'Qt.MouseEventFlag') -> 'Qt.MouseEventFlags': ...
-        def __rand__(self, other: 'Qt.MouseEventFlag') -> 'Qt.MouseEventFlags': ...
-        def __rxor__(self, other: 'Qt.MouseEventFlag') -> 'Qt.MouseEventFlags': ...
+    class MouseEventFlags(QtCore._QFlags['Qt.MouseEventFlag']): ...
 
     def convertFromPlainText(self, plain: str, mode: QtCore.Qt.WhiteSpaceMode = ...) -> str: ...
     def mightBeRichText(self, a0: str) -> bool: ...
@@ -3557,28 +3123,7 @@ class QAbstractItemModel(QObject):
     VerticalSortHint = ...  # type: QAbstractItemModel.LayoutChangeHint
     HorizontalSortHint = ...  # type: QAbstractItemModel.LayoutChangeHint
 
-    class CheckIndexOptions(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QAbstractItemModel.CheckIndexOptions', 'QAbstractItemModel.CheckIndexOption']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QAbstractItemModel.CheckIndexOptions') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QAbstractItemModel.CheckIndexOptions': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QAbstractItemModel.CheckIndexOptions', 'QAbstractItemModel.CheckIndexOption', int]) -> 'QAbstractItemModel.CheckIndexOptions': ...
-        def __and__(self, other: typing.Union['QAbstractItemModel.CheckIndexOptions', 'QAbstractItemModel.CheckIndexOption', int]) -> 'QAbstractItemModel.CheckIndexOptions': ...
-        def __xor__(self, other: typing.Union['QAbstractItemModel.CheckIndexOptions', 'QAbstractItemModel.CheckIndexOption', int]) -> 'QAbstractItemModel.CheckIndexOptions': ...
-        def __ror__ (self, other: 'QAbstractItemModel.CheckIndexOption') -> 'QAbstractItemModel.CheckIndexOptions': ...
-        def __rand__(self, other: 'QAbstractItemModel.CheckIndexOption') -> 'QAbstractItemModel.CheckIndexOptions': ...
-        def __rxor__(self, other: 'QAbstractItemModel.CheckIndexOption') -> 'QAbstractItemModel.CheckIndexOptions': ...
+    class CheckIndexOptions(QtCore._QFlags['QAbstractItemModel.CheckIndexOption']): ...
 
     def __init__(self, parent: typing.Optional[QObject] = ...) -> None: ...
 
@@ -3881,26 +3426,7 @@ class QIODevice(QObject):
     NewOnly = ...  # type: QIODevice.OpenModeFlag
     ExistingOnly = ...  # type: QIODevice.OpenModeFlag
 
-    class OpenMode(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QIODevice.OpenMode', 'QIODevice.OpenModeFlag']) -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QIODevice.OpenMode': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QIODevice.OpenMode', 'QIODevice.OpenModeFlag', int]) -> 'QIODevice.OpenMode': ...
-        def __and__(self, other: typing.Union['QIODevice.OpenMode', 'QIODevice.OpenModeFlag', int]) -> 'QIODevice.OpenMode': ...
-        def __xor__(self, other: typing.Union['QIODevice.OpenMode', 'QIODevice.OpenModeFlag', int]) -> 'QIODevice.OpenMode': ...
-        def __ror__ (self, other: 'QIODevice.OpenModeFlag') -> 'QIODevice.OpenMode': ...
-        def __rand__(self, other: 'QIODevice.OpenModeFlag') -> 'QIODevice.OpenMode': ...
-        def __rxor__(self, other: 'QIODevice.OpenModeFlag') -> 'QIODevice.OpenMode': ...
+    class OpenMode(QtCore._QFlags['QIODevice.OpenModeFlag']): ...
 
     @typing.overload
     def __init__(self) -> None: ...
@@ -4017,28 +3543,7 @@ class QByteArray(sip.simplewrapper):
     IgnoreBase64DecodingErrors = ...  # type: QByteArray.Base64Option
     AbortOnBase64DecodingErrors = ...  # type: QByteArray.Base64Option
 
-    class Base64Options(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QByteArray.Base64Options', 'QByteArray.Base64Option']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QByteArray.Base64Options') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QByteArray.Base64Options': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QByteArray.Base64Options', 'QByteArray.Base64Option', int]) -> 'QByteArray.Base64Options': ...
-        def __and__(self, other: typing.Union['QByteArray.Base64Options', 'QByteArray.Base64Option', int]) -> 'QByteArray.Base64Options': ...
-        def __xor__(self, other: typing.Union['QByteArray.Base64Options', 'QByteArray.Base64Option', int]) -> 'QByteArray.Base64Options': ...
-        def __ror__ (self, other: 'QByteArray.Base64Option') -> 'QByteArray.Base64Options': ...
-        def __rand__(self, other: 'QByteArray.Base64Option') -> 'QByteArray.Base64Options': ...
-        def __rxor__(self, other: 'QByteArray.Base64Option') -> 'QByteArray.Base64Options': ...
+    class Base64Options(QtCore._QFlags['QByteArray.Base64Option']): ...
 
     class FromBase64Result(sip.simplewrapper):
 
@@ -4501,28 +4006,7 @@ class QCommandLineOption(sip.simplewrapper):
     HiddenFromHelp = ...  # type: QCommandLineOption.Flag
     ShortOptionStyle = ...  # type: QCommandLineOption.Flag
 
-    class Flags(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QCommandLineOption.Flags', 'QCommandLineOption.Flag']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QCommandLineOption.Flags') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QCommandLineOption.Flags': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QCommandLineOption.Flags', 'QCommandLineOption.Flag', int]) -> 'QCommandLineOption.Flags': ...
-        def __and__(self, other: typing.Union['QCommandLineOption.Flags', 'QCommandLineOption.Flag', int]) -> 'QCommandLineOption.Flags': ...
-        def __xor__(self, other: typing.Union['QCommandLineOption.Flags', 'QCommandLineOption.Flag', int]) -> 'QCommandLineOption.Flags': ...
-        def __ror__ (self, other: 'QCommandLineOption.Flag') -> 'QCommandLineOption.Flags': ...
-        def __rand__(self, other: 'QCommandLineOption.Flag') -> 'QCommandLineOption.Flags': ...
-        def __rxor__(self, other: 'QCommandLineOption.Flag') -> 'QCommandLineOption.Flags': ...
+    class Flags(QtCore._QFlags['QCommandLineOption.Flag']): ...
 
     @typing.overload
     def __init__(self, name: str) -> None: ...
@@ -5683,51 +5167,9 @@ class QDir(sip.simplewrapper):
     NoDot = ...  # type: QDir.Filter
     NoDotDot = ...  # type: QDir.Filter
 
-    class Filters(sip.simplewrapper):
+    class Filters(QtCore._QFlags['QDir.Filter']): ...
 
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QDir.Filters', 'QDir.Filter']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QDir.Filters') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QDir.Filters': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QDir.Filters', 'QDir.Filter', int]) -> 'QDir.Filters': ...
-        def __and__(self, other: typing.Union['QDir.Filters', 'QDir.Filter', int]) -> 'QDir.Filters': ...
-        def __xor__(self, other: typing.Union['QDir.Filters', 'QDir.Filter', int]) -> 'QDir.Filters': ...
-        def __ror__ (self, other: 'QDir.Filter') -> 'QDir.Filters': ...
-        def __rand__(self, other: 'QDir.Filter') -> 'QDir.Filters': ...
-        def __rxor__(self, other: 'QDir.Filter') -> 'QDir.Filters': ...
-
-    class SortFlags(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QDir.SortFlags', 'QDir.SortFlag']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QDir.SortFlags') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QDir.SortFlags': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QDir.SortFlags', 'QDir.SortFlag', int]) -> 'QDir.SortFlags': ...
-        def __and__(self, other: typing.Union['QDir.SortFlags', 'QDir.SortFlag', int]) -> 'QDir.SortFlags': ...
-        def __xor__(self, other: typing.Union['QDir.SortFlags', 'QDir.SortFlag', int]) -> 'QDir.SortFlags': ...
-        def __ror__ (self, other: 'QDir.SortFlag') -> 'QDir.SortFlags': ...
-        def __rand__(self, other: 'QDir.SortFlag') -> 'QDir.SortFlags': ...
-        def __rxor__(self, other: 'QDir.SortFlag') -> 'QDir.SortFlags': ...
+    class SortFlags(QtCore._QFlags['QDir.SortFlag']): ...
 
     @typing.overload
     def __init__(self, a0: 'QDir') -> None: ...
@@ -5850,28 +5292,7 @@ class QDirIterator(sip.simplewrapper):
     FollowSymlinks = ...  # type: QDirIterator.IteratorFlag
     Subdirectories = ...  # type: QDirIterator.IteratorFlag
 
-    class IteratorFlags(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QDirIterator.IteratorFlags', 'QDirIterator.IteratorFlag']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QDirIterator.IteratorFlags') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QDirIterator.IteratorFlags': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QDirIterator.IteratorFlags', 'QDirIterator.IteratorFlag', int]) -> 'QDirIterator.IteratorFlags': ...
-        def __and__(self, other: typing.Union['QDirIterator.IteratorFlags', 'QDirIterator.IteratorFlag', int]) -> 'QDirIterator.IteratorFlags': ...
-        def __xor__(self, other: typing.Union['QDirIterator.IteratorFlags', 'QDirIterator.IteratorFlag', int]) -> 'QDirIterator.IteratorFlags': ...
-        def __ror__ (self, other: 'QDirIterator.IteratorFlag') -> 'QDirIterator.IteratorFlags': ...
-        def __rand__(self, other: 'QDirIterator.IteratorFlag') -> 'QDirIterator.IteratorFlags': ...
-        def __rxor__(self, other: 'QDirIterator.IteratorFlag') -> 'QDirIterator.IteratorFlags': ...
+    class IteratorFlags(QtCore._QFlags['QDirIterator.IteratorFlag']): ...
 
     @typing.overload
     def __init__(self, dir: QDir, flags: 'QDirIterator.IteratorFlags' = ...) -> None: ...
@@ -6067,28 +5488,7 @@ class QEventLoop(QObject):
     WaitForMoreEvents = ...  # type: QEventLoop.ProcessEventsFlag
     X11ExcludeTimers = ...  # type: QEventLoop.ProcessEventsFlag
 
-    class ProcessEventsFlags(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QEventLoop.ProcessEventsFlags', 'QEventLoop.ProcessEventsFlag']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QEventLoop.ProcessEventsFlags') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QEventLoop.ProcessEventsFlags': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QEventLoop.ProcessEventsFlags', 'QEventLoop.ProcessEventsFlag', int]) -> 'QEventLoop.ProcessEventsFlags': ...
-        def __and__(self, other: typing.Union['QEventLoop.ProcessEventsFlags', 'QEventLoop.ProcessEventsFlag', int]) -> 'QEventLoop.ProcessEventsFlags': ...
-        def __xor__(self, other: typing.Union['QEventLoop.ProcessEventsFlags', 'QEventLoop.ProcessEventsFlag', int]) -> 'QEventLoop.ProcessEventsFlags': ...
-        def __ror__ (self, other: 'QEventLoop.ProcessEventsFlag') -> 'QEventLoop.ProcessEventsFlags': ...
-        def __rand__(self, other: 'QEventLoop.ProcessEventsFlag') -> 'QEventLoop.ProcessEventsFlags': ...
-        def __rxor__(self, other: 'QEventLoop.ProcessEventsFlag') -> 'QEventLoop.ProcessEventsFlags': ...
+    class ProcessEventsFlags(QtCore._QFlags['QEventLoop.ProcessEventsFlag']): ...
 
     def __init__(self, parent: typing.Optional[QObject] = ...) -> None: ...
 
@@ -6221,51 +5621,9 @@ class QFileDevice(QIODevice):
     PermissionsError = ...  # type: QFileDevice.FileError
     CopyError = ...  # type: QFileDevice.FileError
 
-    class Permissions(sip.simplewrapper):
+    class Permissions(QtCore._QFlags['QFileDevice.Permission']): ...
 
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QFileDevice.Permissions', 'QFileDevice.Permission']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QFileDevice.Permissions') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QFileDevice.Permissions': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QFileDevice.Permissions', 'QFileDevice.Permission', int]) -> 'QFileDevice.Permissions': ...
-        def __and__(self, other: typing.Union['QFileDevice.Permissions', 'QFileDevice.Permission', int]) -> 'QFileDevice.Permissions': ...
-        def __xor__(self, other: typing.Union['QFileDevice.Permissions', 'QFileDevice.Permission', int]) -> 'QFileDevice.Permissions': ...
-        def __ror__ (self, other: 'QFileDevice.Permission') -> 'QFileDevice.Permissions': ...
-        def __rand__(self, other: 'QFileDevice.Permission') -> 'QFileDevice.Permissions': ...
-        def __rxor__(self, other: 'QFileDevice.Permission') -> 'QFileDevice.Permissions': ...
-
-    class FileHandleFlags(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QFileDevice.FileHandleFlags', 'QFileDevice.FileHandleFlag']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QFileDevice.FileHandleFlags') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QFileDevice.FileHandleFlags': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QFileDevice.FileHandleFlags', 'QFileDevice.FileHandleFlag', int]) -> 'QFileDevice.FileHandleFlags': ...
-        def __and__(self, other: typing.Union['QFileDevice.FileHandleFlags', 'QFileDevice.FileHandleFlag', int]) -> 'QFileDevice.FileHandleFlags': ...
-        def __xor__(self, other: typing.Union['QFileDevice.FileHandleFlags', 'QFileDevice.FileHandleFlag', int]) -> 'QFileDevice.FileHandleFlags': ...
-        def __ror__ (self, other: 'QFileDevice.FileHandleFlag') -> 'QFileDevice.FileHandleFlags': ...
-        def __rand__(self, other: 'QFileDevice.FileHandleFlag') -> 'QFileDevice.FileHandleFlags': ...
-        def __rxor__(self, other: 'QFileDevice.FileHandleFlag') -> 'QFileDevice.FileHandleFlags': ...
+    class FileHandleFlags(QtCore._QFlags['QFileDevice.FileHandleFlag']): ...
 
     def setFileTime(self, newDate: typing.Union[QDateTime, datetime.datetime], fileTime: 'QFileDevice.FileTime') -> bool: ...
     def fileTime(self, time: 'QFileDevice.FileTime') -> QDateTime: ...
@@ -6599,28 +5957,7 @@ class QItemSelectionModel(QObject):
     ToggleCurrent = ...  # type: QItemSelectionModel.SelectionFlag
     ClearAndSelect = ...  # type: QItemSelectionModel.SelectionFlag
 
-    class SelectionFlags(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QItemSelectionModel.SelectionFlags', 'QItemSelectionModel.SelectionFlag']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QItemSelectionModel.SelectionFlags') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QItemSelectionModel.SelectionFlags': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QItemSelectionModel.SelectionFlags', 'QItemSelectionModel.SelectionFlag', int]) -> 'QItemSelectionModel.SelectionFlags': ...
-        def __and__(self, other: typing.Union['QItemSelectionModel.SelectionFlags', 'QItemSelectionModel.SelectionFlag', int]) -> 'QItemSelectionModel.SelectionFlags': ...
-        def __xor__(self, other: typing.Union['QItemSelectionModel.SelectionFlags', 'QItemSelectionModel.SelectionFlag', int]) -> 'QItemSelectionModel.SelectionFlags': ...
-        def __ror__ (self, other: 'QItemSelectionModel.SelectionFlag') -> 'QItemSelectionModel.SelectionFlags': ...
-        def __rand__(self, other: 'QItemSelectionModel.SelectionFlag') -> 'QItemSelectionModel.SelectionFlags': ...
-        def __rxor__(self, other: 'QItemSelectionModel.SelectionFlag') -> 'QItemSelectionModel.SelectionFlags': ...
+    class SelectionFlags(QtCore._QFlags['QItemSelectionModel.SelectionFlag']): ...
 
     @typing.overload
     def __init__(self, model: typing.Optional[QAbstractItemModel] = ...) -> None: ...
@@ -6886,28 +6223,7 @@ class QLibrary(QObject):
     PreventUnloadHint = ...  # type: QLibrary.LoadHint
     DeepBindHint = ...  # type: QLibrary.LoadHint
 
-    class LoadHints(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QLibrary.LoadHints', 'QLibrary.LoadHint']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QLibrary.LoadHints') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QLibrary.LoadHints': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QLibrary.LoadHints', 'QLibrary.LoadHint', int]) -> 'QLibrary.LoadHints': ...
-        def __and__(self, other: typing.Union['QLibrary.LoadHints', 'QLibrary.LoadHint', int]) -> 'QLibrary.LoadHints': ...
-        def __xor__(self, other: typing.Union['QLibrary.LoadHints', 'QLibrary.LoadHint', int]) -> 'QLibrary.LoadHints': ...
-        def __ror__ (self, other: 'QLibrary.LoadHint') -> 'QLibrary.LoadHints': ...
-        def __rand__(self, other: 'QLibrary.LoadHint') -> 'QLibrary.LoadHints': ...
-        def __rxor__(self, other: 'QLibrary.LoadHint') -> 'QLibrary.LoadHints': ...
+    class LoadHints(QtCore._QFlags['QLibrary.LoadHint']): ...
 
     @typing.overload
     def __init__(self, parent: typing.Optional[QObject] = ...) -> None: ...
@@ -8777,51 +8093,9 @@ class QLocale(sip.simplewrapper):
     Muscogee = ...  # type: QLocale.Language
     Silesian = ...  # type: QLocale.Language
 
-    class NumberOptions(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QLocale.NumberOptions', 'QLocale.NumberOption']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QLocale.NumberOptions') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QLocale.NumberOptions': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QLocale.NumberOptions', 'QLocale.NumberOption', int]) -> 'QLocale.NumberOptions': ...
-        def __and__(self, other: typing.Union['QLocale.NumberOptions', 'QLocale.NumberOption', int]) -> 'QLocale.NumberOptions': ...
-        def __xor__(self, other: typing.Union['QLocale.NumberOptions', 'QLocale.NumberOption', int]) -> 'QLocale.NumberOptions': ...
-        def __ror__ (self, other: 'QLocale.NumberOption') -> 'QLocale.NumberOptions': ...
-        def __rand__(self, other: 'QLocale.NumberOption') -> 'QLocale.NumberOptions': ...
-        def __rxor__(self, other: 'QLocale.NumberOption') -> 'QLocale.NumberOptions': ...
-
-    class DataSizeFormats(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QLocale.DataSizeFormats', 'QLocale.DataSizeFormat']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QLocale.DataSizeFormats') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
+    class NumberOptions(QtCore._QFlags['QLocale.NumberOption']): ...
 
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QLocale.DataSizeFormats': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QLocale.DataSizeFormats', 'QLocale.DataSizeFormat', int]) -> 'QLocale.DataSizeFormats': ...
-        def __and__(self, other: typing.Union['QLocale.DataSizeFormats', 'QLocale.DataSizeFormat', int]) -> 'QLocale.DataSizeFormats': ...
-        def __xor__(self, other: typing.Union['QLocale.DataSizeFormats', 'QLocale.DataSizeFormat', int]) -> 'QLocale.DataSizeFormats': ...
-        def __ror__ (self, other: 'QLocale.DataSizeFormat') -> 'QLocale.DataSizeFormats': ...
-        def __rand__(self, other: 'QLocale.DataSizeFormat') -> 'QLocale.DataSizeFormats': ...
-        def __rxor__(self, other: 'QLocale.DataSizeFormat') -> 'QLocale.DataSizeFormats': ...
+    class DataSizeFormats(QtCore._QFlags['QLocale.DataSizeFormat']): ...
 
     @typing.overload
     def __init__(self) -> None: ...
@@ -9394,28 +8668,7 @@ class QMetaType(sip.simplewrapper):
     QColorSpace = ...  # type: QMetaType.Type
     User = ...  # type: QMetaType.Type
 
-    class TypeFlags(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QMetaType.TypeFlags', 'QMetaType.TypeFlag']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QMetaType.TypeFlags') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QMetaType.TypeFlags': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QMetaType.TypeFlags', 'QMetaType.TypeFlag', int]) -> 'QMetaType.TypeFlags': ...
-        def __and__(self, other: typing.Union['QMetaType.TypeFlags', 'QMetaType.TypeFlag', int]) -> 'QMetaType.TypeFlags': ...
-        def __xor__(self, other: typing.Union['QMetaType.TypeFlags', 'QMetaType.TypeFlag', int]) -> 'QMetaType.TypeFlags': ...
-        def __ror__ (self, other: 'QMetaType.TypeFlag') -> 'QMetaType.TypeFlags': ...
-        def __rand__(self, other: 'QMetaType.TypeFlag') -> 'QMetaType.TypeFlags': ...
-        def __rxor__(self, other: 'QMetaType.TypeFlag') -> 'QMetaType.TypeFlags': ...
+    class TypeFlags(QtCore._QFlags['QMetaType.TypeFlag']): ...
 
     def __init__(self, type: int = ...) -> None: ...
 
@@ -10394,51 +9647,9 @@ class QRegularExpression(sip.simplewrapper):
     OptimizeOnFirstUsageOption = ...  # type: QRegularExpression.PatternOption
     DontAutomaticallyOptimizeOption = ...  # type: QRegularExpression.PatternOption
 
-    class PatternOptions(sip.simplewrapper):
+    class PatternOptions(QtCore._QFlags['QRegularExpression.PatternOption']): ...
 
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QRegularExpression.PatternOptions', 'QRegularExpression.PatternOption']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QRegularExpression.PatternOptions') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QRegularExpression.PatternOptions': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QRegularExpression.PatternOptions', 'QRegularExpression.PatternOption', int]) -> 'QRegularExpression.PatternOptions': ...
-        def __and__(self, other: typing.Union['QRegularExpression.PatternOptions', 'QRegularExpression.PatternOption', int]) -> 'QRegularExpression.PatternOptions': ...
-        def __xor__(self, other: typing.Union['QRegularExpression.PatternOptions', 'QRegularExpression.PatternOption', int]) -> 'QRegularExpression.PatternOptions': ...
-        def __ror__ (self, other: 'QRegularExpression.PatternOption') -> 'QRegularExpression.PatternOptions': ...
-        def __rand__(self, other: 'QRegularExpression.PatternOption') -> 'QRegularExpression.PatternOptions': ...
-        def __rxor__(self, other: 'QRegularExpression.PatternOption') -> 'QRegularExpression.PatternOptions': ...
-
-    class MatchOptions(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QRegularExpression.MatchOptions', 'QRegularExpression.MatchOption']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QRegularExpression.MatchOptions') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QRegularExpression.MatchOptions': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QRegularExpression.MatchOptions', 'QRegularExpression.MatchOption', int]) -> 'QRegularExpression.MatchOptions': ...
-        def __and__(self, other: typing.Union['QRegularExpression.MatchOptions', 'QRegularExpression.MatchOption', int]) -> 'QRegularExpression.MatchOptions': ...
-        def __xor__(self, other: typing.Union['QRegularExpression.MatchOptions', 'QRegularExpression.MatchOption', int]) -> 'QRegularExpression.MatchOptions': ...
-        def __ror__ (self, other: 'QRegularExpression.MatchOption') -> 'QRegularExpression.MatchOptions': ...
-        def __rand__(self, other: 'QRegularExpression.MatchOption') -> 'QRegularExpression.MatchOptions': ...
-        def __rxor__(self, other: 'QRegularExpression.MatchOption') -> 'QRegularExpression.MatchOptions': ...
+    class MatchOptions(QtCore._QFlags['QRegularExpression.MatchOption']): ...
 
     @typing.overload
     def __init__(self) -> None: ...
@@ -10784,8 +9995,6 @@ class QSignalMapper(QObject):
     @typing.overload
     def mapping(self, text: str) -> QObject: ...
     @typing.overload
-    def mapping(self, widget: QtWidgets.QWidget) -> QObject: ...
-    @typing.overload
     def mapping(self, object: QObject) -> QObject: ...
     def removeMappings(self, sender: QObject) -> None: ...
     @typing.overload
@@ -10793,8 +10002,6 @@ class QSignalMapper(QObject):
     @typing.overload
     def setMapping(self, sender: QObject, text: str) -> None: ...
     @typing.overload
-    def setMapping(self, sender: QObject, widget: QtWidgets.QWidget) -> None: ...
-    @typing.overload
     def setMapping(self, sender: QObject, object: QObject) -> None: ...
 
 
@@ -11068,28 +10275,7 @@ class QStandardPaths(sip.simplewrapper):
     AppLocalDataLocation = ...  # type: QStandardPaths.StandardLocation
     AppConfigLocation = ...  # type: QStandardPaths.StandardLocation
 
-    class LocateOptions(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QStandardPaths.LocateOptions', 'QStandardPaths.LocateOption']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QStandardPaths.LocateOptions') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QStandardPaths.LocateOptions': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QStandardPaths.LocateOptions', 'QStandardPaths.LocateOption', int]) -> 'QStandardPaths.LocateOptions': ...
-        def __and__(self, other: typing.Union['QStandardPaths.LocateOptions', 'QStandardPaths.LocateOption', int]) -> 'QStandardPaths.LocateOptions': ...
-        def __xor__(self, other: typing.Union['QStandardPaths.LocateOptions', 'QStandardPaths.LocateOption', int]) -> 'QStandardPaths.LocateOptions': ...
-        def __ror__ (self, other: 'QStandardPaths.LocateOption') -> 'QStandardPaths.LocateOptions': ...
-        def __rand__(self, other: 'QStandardPaths.LocateOption') -> 'QStandardPaths.LocateOptions': ...
-        def __rxor__(self, other: 'QStandardPaths.LocateOption') -> 'QStandardPaths.LocateOptions': ...
+    class LocateOptions(QtCore._QFlags['QStandardPaths.LocateOption']): ...
 
     def __init__(self, a0: 'QStandardPaths') -> None: ...
 
@@ -11393,28 +10579,7 @@ class QTextBoundaryFinder(sip.simplewrapper):
     EndOfItem = ...  # type: QTextBoundaryFinder.BoundaryReason
     MandatoryBreak = ...  # type: QTextBoundaryFinder.BoundaryReason
 
-    class BoundaryReasons(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QTextBoundaryFinder.BoundaryReasons', 'QTextBoundaryFinder.BoundaryReason']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QTextBoundaryFinder.BoundaryReasons') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QTextBoundaryFinder.BoundaryReasons': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QTextBoundaryFinder.BoundaryReasons', 'QTextBoundaryFinder.BoundaryReason', int]) -> 'QTextBoundaryFinder.BoundaryReasons': ...
-        def __and__(self, other: typing.Union['QTextBoundaryFinder.BoundaryReasons', 'QTextBoundaryFinder.BoundaryReason', int]) -> 'QTextBoundaryFinder.BoundaryReasons': ...
-        def __xor__(self, other: typing.Union['QTextBoundaryFinder.BoundaryReasons', 'QTextBoundaryFinder.BoundaryReason', int]) -> 'QTextBoundaryFinder.BoundaryReasons': ...
-        def __ror__ (self, other: 'QTextBoundaryFinder.BoundaryReason') -> 'QTextBoundaryFinder.BoundaryReasons': ...
-        def __rand__(self, other: 'QTextBoundaryFinder.BoundaryReason') -> 'QTextBoundaryFinder.BoundaryReasons': ...
-        def __rxor__(self, other: 'QTextBoundaryFinder.BoundaryReason') -> 'QTextBoundaryFinder.BoundaryReasons': ...
+    class BoundaryReasons(QtCore._QFlags['QTextBoundaryFinder.BoundaryReason']): ...
 
     @typing.overload
     def __init__(self) -> None: ...
@@ -11450,28 +10615,7 @@ class QTextCodec(sip.wrapper):
     ConvertInvalidToNull = ...  # type: QTextCodec.ConversionFlag
     IgnoreHeader = ...  # type: QTextCodec.ConversionFlag
 
-    class ConversionFlags(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QTextCodec.ConversionFlags', 'QTextCodec.ConversionFlag']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QTextCodec.ConversionFlags') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QTextCodec.ConversionFlags': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QTextCodec.ConversionFlags', 'QTextCodec.ConversionFlag', int]) -> 'QTextCodec.ConversionFlags': ...
-        def __and__(self, other: typing.Union['QTextCodec.ConversionFlags', 'QTextCodec.ConversionFlag', int]) -> 'QTextCodec.ConversionFlags': ...
-        def __xor__(self, other: typing.Union['QTextCodec.ConversionFlags', 'QTextCodec.ConversionFlag', int]) -> 'QTextCodec.ConversionFlags': ...
-        def __ror__ (self, other: 'QTextCodec.ConversionFlag') -> 'QTextCodec.ConversionFlags': ...
-        def __rand__(self, other: 'QTextCodec.ConversionFlag') -> 'QTextCodec.ConversionFlags': ...
-        def __rxor__(self, other: 'QTextCodec.ConversionFlag') -> 'QTextCodec.ConversionFlags': ...
+    class ConversionFlags(QtCore._QFlags['QTextCodec.ConversionFlag']): ...
 
     class ConverterState(sip.simplewrapper):
 
@@ -11594,28 +10738,7 @@ class QTextStream(sip.simplewrapper):
     FixedNotation = ...  # type: QTextStream.RealNumberNotation
     ScientificNotation = ...  # type: QTextStream.RealNumberNotation
 
-    class NumberFlags(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QTextStream.NumberFlags', 'QTextStream.NumberFlag']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QTextStream.NumberFlags') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QTextStream.NumberFlags': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QTextStream.NumberFlags', 'QTextStream.NumberFlag', int]) -> 'QTextStream.NumberFlags': ...
-        def __and__(self, other: typing.Union['QTextStream.NumberFlags', 'QTextStream.NumberFlag', int]) -> 'QTextStream.NumberFlags': ...
-        def __xor__(self, other: typing.Union['QTextStream.NumberFlags', 'QTextStream.NumberFlag', int]) -> 'QTextStream.NumberFlags': ...
-        def __ror__ (self, other: 'QTextStream.NumberFlag') -> 'QTextStream.NumberFlags': ...
-        def __rand__(self, other: 'QTextStream.NumberFlag') -> 'QTextStream.NumberFlags': ...
-        def __rxor__(self, other: 'QTextStream.NumberFlag') -> 'QTextStream.NumberFlags': ...
+    class NumberFlags(QtCore._QFlags['QTextStream.NumberFlag']): ...
 
     @typing.overload
     def __init__(self) -> None: ...
@@ -12078,51 +11201,9 @@ class QUrl(sip.simplewrapper):
         def __init__(self, a0: 'QUrl.FormattingOptions') -> None: ...
 
 
-    class ComponentFormattingOptions(sip.simplewrapper):
+    class ComponentFormattingOptions(QtCore._QFlags['QUrl.ComponentFormattingOption']): ...
 
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QUrl.ComponentFormattingOptions', 'QUrl.ComponentFormattingOption']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QUrl.ComponentFormattingOptions') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QUrl.ComponentFormattingOptions': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QUrl.ComponentFormattingOptions', 'QUrl.ComponentFormattingOption', int]) -> 'QUrl.ComponentFormattingOptions': ...
-        def __and__(self, other: typing.Union['QUrl.ComponentFormattingOptions', 'QUrl.ComponentFormattingOption', int]) -> 'QUrl.ComponentFormattingOptions': ...
-        def __xor__(self, other: typing.Union['QUrl.ComponentFormattingOptions', 'QUrl.ComponentFormattingOption', int]) -> 'QUrl.ComponentFormattingOptions': ...
-        def __ror__ (self, other: 'QUrl.ComponentFormattingOption') -> 'QUrl.ComponentFormattingOptions': ...
-        def __rand__(self, other: 'QUrl.ComponentFormattingOption') -> 'QUrl.ComponentFormattingOptions': ...
-        def __rxor__(self, other: 'QUrl.ComponentFormattingOption') -> 'QUrl.ComponentFormattingOptions': ...
-
-    class UserInputResolutionOptions(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QUrl.UserInputResolutionOptions', 'QUrl.UserInputResolutionOption']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QUrl.UserInputResolutionOptions') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QUrl.UserInputResolutionOptions': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QUrl.UserInputResolutionOptions', 'QUrl.UserInputResolutionOption', int]) -> 'QUrl.UserInputResolutionOptions': ...
-        def __and__(self, other: typing.Union['QUrl.UserInputResolutionOptions', 'QUrl.UserInputResolutionOption', int]) -> 'QUrl.UserInputResolutionOptions': ...
-        def __xor__(self, other: typing.Union['QUrl.UserInputResolutionOptions', 'QUrl.UserInputResolutionOption', int]) -> 'QUrl.UserInputResolutionOptions': ...
-        def __ror__ (self, other: 'QUrl.UserInputResolutionOption') -> 'QUrl.UserInputResolutionOptions': ...
-        def __rand__(self, other: 'QUrl.UserInputResolutionOption') -> 'QUrl.UserInputResolutionOptions': ...
-        def __rxor__(self, other: 'QUrl.UserInputResolutionOption') -> 'QUrl.UserInputResolutionOptions': ...
+    class UserInputResolutionOptions(QtCore._QFlags['QUrl.UserInputResolutionOption']): ...
 
     @typing.overload
     def __init__(self) -> None: ...
@@ -171,51 +171,9 @@ class QDBusConnection(sip.simplewrapper):
     SystemBus = ...  # type: QDBusConnection.BusType
     ActivationBus = ...  # type: QDBusConnection.BusType
 
-    class RegisterOptions(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QDBusConnection.RegisterOptions', 'QDBusConnection.RegisterOption']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QDBusConnection.RegisterOptions') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QDBusConnection.RegisterOptions': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QDBusConnection.RegisterOptions', 'QDBusConnection.RegisterOption', int]) -> 'QDBusConnection.RegisterOptions': ...
-        def __and__(self, other: typing.Union['QDBusConnection.RegisterOptions', 'QDBusConnection.RegisterOption', int]) -> 'QDBusConnection.RegisterOptions': ...
-        def __xor__(self, other: typing.Union['QDBusConnection.RegisterOptions', 'QDBusConnection.RegisterOption', int]) -> 'QDBusConnection.RegisterOptions': ...
-        def __ror__ (self, other: 'QDBusConnection.RegisterOption') -> 'QDBusConnection.RegisterOptions': ...
-        def __rand__(self, other: 'QDBusConnection.RegisterOption') -> 'QDBusConnection.RegisterOptions': ...
-        def __rxor__(self, other: 'QDBusConnection.RegisterOption') -> 'QDBusConnection.RegisterOptions': ...
-
-    class ConnectionCapabilities(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QDBusConnection.ConnectionCapabilities', 'QDBusConnection.ConnectionCapability']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QDBusConnection.ConnectionCapabilities') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QDBusConnection.ConnectionCapabilities': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QDBusConnection.ConnectionCapabilities', 'QDBusConnection.ConnectionCapability', int]) -> 'QDBusConnection.ConnectionCapabilities': ...
-        def __and__(self, other: typing.Union['QDBusConnection.ConnectionCapabilities', 'QDBusConnection.ConnectionCapability', int]) -> 'QDBusConnection.ConnectionCapabilities': ...
-        def __xor__(self, other: typing.Union['QDBusConnection.ConnectionCapabilities', 'QDBusConnection.ConnectionCapability', int]) -> 'QDBusConnection.ConnectionCapabilities': ...
-        def __ror__ (self, other: 'QDBusConnection.ConnectionCapability') -> 'QDBusConnection.ConnectionCapabilities': ...
-        def __rand__(self, other: 'QDBusConnection.ConnectionCapability') -> 'QDBusConnection.ConnectionCapabilities': ...
-        def __rxor__(self, other: 'QDBusConnection.ConnectionCapability') -> 'QDBusConnection.ConnectionCapabilities': ...
+    class RegisterOptions(QtCore._QFlags['QDBusConnection.RegisterOption']): ...
+
+    class ConnectionCapabilities(QtCore._QFlags['QDBusConnection.ConnectionCapability']): ...
 
     @typing.overload
     def __init__(self, name: str) -> None: ...
@@ -539,28 +497,7 @@ class QDBusServiceWatcher(QtCore.QObject):
     WatchForUnregistration = ...  # type: QDBusServiceWatcher.WatchModeFlag
     WatchForOwnerChange = ...  # type: QDBusServiceWatcher.WatchModeFlag
 
-    class WatchMode(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QDBusServiceWatcher.WatchMode', 'QDBusServiceWatcher.WatchModeFlag']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QDBusServiceWatcher.WatchMode') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QDBusServiceWatcher.WatchMode': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QDBusServiceWatcher.WatchMode', 'QDBusServiceWatcher.WatchModeFlag', int]) -> 'QDBusServiceWatcher.WatchMode': ...
-        def __and__(self, other: typing.Union['QDBusServiceWatcher.WatchMode', 'QDBusServiceWatcher.WatchModeFlag', int]) -> 'QDBusServiceWatcher.WatchMode': ...
-        def __xor__(self, other: typing.Union['QDBusServiceWatcher.WatchMode', 'QDBusServiceWatcher.WatchModeFlag', int]) -> 'QDBusServiceWatcher.WatchMode': ...
-        def __ror__ (self, other: 'QDBusServiceWatcher.WatchModeFlag') -> 'QDBusServiceWatcher.WatchMode': ...
-        def __rand__(self, other: 'QDBusServiceWatcher.WatchModeFlag') -> 'QDBusServiceWatcher.WatchMode': ...
-        def __rxor__(self, other: 'QDBusServiceWatcher.WatchModeFlag') -> 'QDBusServiceWatcher.WatchMode': ...
+    class WatchMode(QtCore._QFlags['QDBusServiceWatcher.WatchModeFlag']): ...
 
     @typing.overload
     def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
@@ -91,28 +91,7 @@ class QDesignerFormWindowInterface(QtWidgets.QWidget):
     TabOrderFeature = ...  # type: QDesignerFormWindowInterface.FeatureFlag
     DefaultFeature = ...  # type: QDesignerFormWindowInterface.FeatureFlag
 
-    class Feature(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QDesignerFormWindowInterface.Feature', 'QDesignerFormWindowInterface.FeatureFlag']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QDesignerFormWindowInterface.Feature') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QDesignerFormWindowInterface.Feature': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QDesignerFormWindowInterface.Feature', 'QDesignerFormWindowInterface.FeatureFlag', int]) -> 'QDesignerFormWindowInterface.Feature': ...
-        def __and__(self, other: typing.Union['QDesignerFormWindowInterface.Feature', 'QDesignerFormWindowInterface.FeatureFlag', int]) -> 'QDesignerFormWindowInterface.Feature': ...
-        def __xor__(self, other: typing.Union['QDesignerFormWindowInterface.Feature', 'QDesignerFormWindowInterface.FeatureFlag', int]) -> 'QDesignerFormWindowInterface.Feature': ...
-        def __ror__ (self, other: 'QDesignerFormWindowInterface.FeatureFlag') -> 'QDesignerFormWindowInterface.Feature': ...
-        def __rand__(self, other: 'QDesignerFormWindowInterface.FeatureFlag') -> 'QDesignerFormWindowInterface.Feature': ...
-        def __rxor__(self, other: 'QDesignerFormWindowInterface.FeatureFlag') -> 'QDesignerFormWindowInterface.Feature': ...
+    class Feature(QtCore._QFlags['QDesignerFormWindowInterface.FeatureFlag']): ...
 
     def __init__(self, parent: typing.Optional[QtWidgets.QWidget] = ..., flags: typing.Union[QtCore.Qt.WindowFlags, QtCore.Qt.WindowType] = ...) -> None: ...
 
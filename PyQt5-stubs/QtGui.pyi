@@ -1781,28 +1781,7 @@ class QTouchEvent(QInputEvent):
         Pen = ...  # type: QTouchEvent.TouchPoint.InfoFlag
         Token = ...  # type: QTouchEvent.TouchPoint.InfoFlag
 
-        class InfoFlags(sip.simplewrapper):
-
-            @typing.overload
-            def __init__(self) -> None: ...
-            @typing.overload
-            def __init__(self, f: typing.Union['QTouchEvent.TouchPoint.InfoFlags', 'QTouchEvent.TouchPoint.InfoFlag']) -> None: ...
-            @typing.overload
-            def __init__(self, a0: 'QTouchEvent.TouchPoint.InfoFlags') -> None: ...
-            @typing.overload
-            def __init__(self, f: int) -> None: ...
-
-            def __hash__(self) -> int: ...
-            def __bool__(self) -> int: ...
-            def __invert__(self) -> 'QTouchEvent.TouchPoint.InfoFlags': ...
-            def __index__(self) -> int: ...
-            def __int__(self) -> int: ...
-            def __or__ (self, other: typing.Union['QTouchEvent.TouchPoint.InfoFlags', 'QTouchEvent.TouchPoint.InfoFlag', int]) -> 'QTouchEvent.TouchPoint.InfoFlags': ...
-            def __and__(self, other: typing.Union['QTouchEvent.TouchPoint.InfoFlags', 'QTouchEvent.TouchPoint.InfoFlag', int]) -> 'QTouchEvent.TouchPoint.InfoFlags': ...
-            def __xor__(self, other: typing.Union['QTouchEvent.TouchPoint.InfoFlags', 'QTouchEvent.TouchPoint.InfoFlag', int]) -> 'QTouchEvent.TouchPoint.InfoFlags': ...
-            def __ror__ (self, other: 'QTouchEvent.TouchPoint.InfoFlag') -> 'QTouchEvent.TouchPoint.InfoFlags': ...
-            def __rand__(self, other: 'QTouchEvent.TouchPoint.InfoFlag') -> 'QTouchEvent.TouchPoint.InfoFlags': ...
-            def __rxor__(self, other: 'QTouchEvent.TouchPoint.InfoFlag') -> 'QTouchEvent.TouchPoint.InfoFlags': ...
+        class InfoFlags(QtCore._QFlags['QTouchEvent.TouchPoint.InfoFlag']): ...
 
         def ellipseDiameters(self) -> QtCore.QSizeF: ...
         def rotation(self) -> float: ...
@@ -2616,28 +2595,7 @@ class QGlyphRun(sip.simplewrapper):
     RightToLeft = ...  # type: QGlyphRun.GlyphRunFlag
     SplitLigature = ...  # type: QGlyphRun.GlyphRunFlag
 
-    class GlyphRunFlags(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QGlyphRun.GlyphRunFlags', 'QGlyphRun.GlyphRunFlag']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QGlyphRun.GlyphRunFlags') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QGlyphRun.GlyphRunFlags': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QGlyphRun.GlyphRunFlags', 'QGlyphRun.GlyphRunFlag', int]) -> 'QGlyphRun.GlyphRunFlags': ...
-        def __and__(self, other: typing.Union['QGlyphRun.GlyphRunFlags', 'QGlyphRun.GlyphRunFlag', int]) -> 'QGlyphRun.GlyphRunFlags': ...
-        def __xor__(self, other: typing.Union['QGlyphRun.GlyphRunFlags', 'QGlyphRun.GlyphRunFlag', int]) -> 'QGlyphRun.GlyphRunFlags': ...
-        def __ror__ (self, other: 'QGlyphRun.GlyphRunFlag') -> 'QGlyphRun.GlyphRunFlags': ...
-        def __rand__(self, other: 'QGlyphRun.GlyphRunFlag') -> 'QGlyphRun.GlyphRunFlags': ...
-        def __rxor__(self, other: 'QGlyphRun.GlyphRunFlag') -> 'QGlyphRun.GlyphRunFlags': ...
+    class GlyphRunFlags(QtCore._QFlags['QGlyphRun.GlyphRunFlag']): ...
 
     @typing.overload
     def __init__(self) -> None: ...
@@ -3215,28 +3173,7 @@ class QImageIOHandler(sip.simplewrapper):
     ImageTransformation = ...  # type: QImageIOHandler.ImageOption
     TransformedByDefault = ...  # type: QImageIOHandler.ImageOption
 
-    class Transformations(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QImageIOHandler.Transformations', 'QImageIOHandler.Transformation']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QImageIOHandler.Transformations') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QImageIOHandler.Transformations': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QImageIOHandler.Transformations', 'QImageIOHandler.Transformation', int]) -> 'QImageIOHandler.Transformations': ...
-        def __and__(self, other: typing.Union['QImageIOHandler.Transformations', 'QImageIOHandler.Transformation', int]) -> 'QImageIOHandler.Transformations': ...
-        def __xor__(self, other: typing.Union['QImageIOHandler.Transformations', 'QImageIOHandler.Transformation', int]) -> 'QImageIOHandler.Transformations': ...
-        def __ror__ (self, other: 'QImageIOHandler.Transformation') -> 'QImageIOHandler.Transformations': ...
-        def __rand__(self, other: 'QImageIOHandler.Transformation') -> 'QImageIOHandler.Transformations': ...
-        def __rxor__(self, other: 'QImageIOHandler.Transformation') -> 'QImageIOHandler.Transformations': ...
+    class Transformations(QtCore._QFlags['QImageIOHandler.Transformation']): ...
 
     def __init__(self) -> None: ...
 
@@ -3902,28 +3839,7 @@ class QOpenGLBuffer(sip.simplewrapper):
     PixelPackBuffer = ...  # type: QOpenGLBuffer.Type
     PixelUnpackBuffer = ...  # type: QOpenGLBuffer.Type
 
-    class RangeAccessFlags(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QOpenGLBuffer.RangeAccessFlags', 'QOpenGLBuffer.RangeAccessFlag']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QOpenGLBuffer.RangeAccessFlags') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QOpenGLBuffer.RangeAccessFlags': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QOpenGLBuffer.RangeAccessFlags', 'QOpenGLBuffer.RangeAccessFlag', int]) -> 'QOpenGLBuffer.RangeAccessFlags': ...
-        def __and__(self, other: typing.Union['QOpenGLBuffer.RangeAccessFlags', 'QOpenGLBuffer.RangeAccessFlag', int]) -> 'QOpenGLBuffer.RangeAccessFlags': ...
-        def __xor__(self, other: typing.Union['QOpenGLBuffer.RangeAccessFlags', 'QOpenGLBuffer.RangeAccessFlag', int]) -> 'QOpenGLBuffer.RangeAccessFlags': ...
-        def __ror__ (self, other: 'QOpenGLBuffer.RangeAccessFlag') -> 'QOpenGLBuffer.RangeAccessFlags': ...
-        def __rand__(self, other: 'QOpenGLBuffer.RangeAccessFlag') -> 'QOpenGLBuffer.RangeAccessFlags': ...
-        def __rxor__(self, other: 'QOpenGLBuffer.RangeAccessFlag') -> 'QOpenGLBuffer.RangeAccessFlags': ...
+    class RangeAccessFlags(QtCore._QFlags['QOpenGLBuffer.RangeAccessFlag']): ...
 
     @typing.overload
     def __init__(self) -> None: ...
@@ -4100,74 +4016,11 @@ class QOpenGLDebugMessage(sip.simplewrapper):
     OtherSource = ...  # type: QOpenGLDebugMessage.Source
     AnySource = ...  # type: QOpenGLDebugMessage.Source
 
-    class Sources(sip.simplewrapper):
+    class Sources(QtCore._QFlags['QOpenGLDebugMessage.Source']): ...
 
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QOpenGLDebugMessage.Sources', 'QOpenGLDebugMessage.Source']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QOpenGLDebugMessage.Sources') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QOpenGLDebugMessage.Sources': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QOpenGLDebugMessage.Sources', 'QOpenGLDebugMessage.Source', int]) -> 'QOpenGLDebugMessage.Sources': ...
-        def __and__(self, other: typing.Union['QOpenGLDebugMessage.Sources', 'QOpenGLDebugMessage.Source', int]) -> 'QOpenGLDebugMessage.Sources': ...
-        def __xor__(self, other: typing.Union['QOpenGLDebugMessage.Sources', 'QOpenGLDebugMessage.Source', int]) -> 'QOpenGLDebugMessage.Sources': ...
-        def __ror__ (self, other: 'QOpenGLDebugMessage.Source') -> 'QOpenGLDebugMessage.Sources': ...
-        def __rand__(self, other: 'QOpenGLDebugMessage.Source') -> 'QOpenGLDebugMessage.Sources': ...
-        def __rxor__(self, other: 'QOpenGLDebugMessage.Source') -> 'QOpenGLDebugMessage.Sources': ...
-
-    class Types(sip.simplewrapper):
+    class Types(QtCore._QFlags['QOpenGLDebugMessage.Type']): ...
 
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QOpenGLDebugMessage.Types', 'QOpenGLDebugMessage.Type']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QOpenGLDebugMessage.Types') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QOpenGLDebugMessage.Types': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QOpenGLDebugMessage.Types', 'QOpenGLDebugMessage.Type', int]) -> 'QOpenGLDebugMessage.Types': ...
-        def __and__(self, other: typing.Union['QOpenGLDebugMessage.Types', 'QOpenGLDebugMessage.Type', int]) -> 'QOpenGLDebugMessage.Types': ...
-        def __xor__(self, other: typing.Union['QOpenGLDebugMessage.Types', 'QOpenGLDebugMessage.Type', int]) -> 'QOpenGLDebugMessage.Types': ...
-        def __ror__ (self, other: 'QOpenGLDebugMessage.Type') -> 'QOpenGLDebugMessage.Types': ...
-        def __rand__(self, other: 'QOpenGLDebugMessage.Type') -> 'QOpenGLDebugMessage.Types': ...
-        def __rxor__(self, other: 'QOpenGLDebugMessage.Type') -> 'QOpenGLDebugMessage.Types': ...
-
-    class Severities(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QOpenGLDebugMessage.Severities', 'QOpenGLDebugMessage.Severity']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QOpenGLDebugMessage.Severities') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QOpenGLDebugMessage.Severities': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QOpenGLDebugMessage.Severities', 'QOpenGLDebugMessage.Severity', int]) -> 'QOpenGLDebugMessage.Severities': ...
-        def __and__(self, other: typing.Union['QOpenGLDebugMessage.Severities', 'QOpenGLDebugMessage.Severity', int]) -> 'QOpenGLDebugMessage.Severities': ...
-        def __xor__(self, other: typing.Union['QOpenGLDebugMessage.Severities', 'QOpenGLDebugMessage.Severity', int]) -> 'QOpenGLDebugMessage.Severities': ...
-        def __ror__ (self, other: 'QOpenGLDebugMessage.Severity') -> 'QOpenGLDebugMessage.Severities': ...
-        def __rand__(self, other: 'QOpenGLDebugMessage.Severity') -> 'QOpenGLDebugMessage.Severities': ...
-        def __rxor__(self, other: 'QOpenGLDebugMessage.Severity') -> 'QOpenGLDebugMessage.Severities': ...
+    class Severities(QtCore._QFlags['QOpenGLDebugMessage.Severity']): ...
 
     @typing.overload
     def __init__(self) -> None: ...
@@ -4388,28 +4241,7 @@ class QOpenGLShader(QtCore.QObject):
     TessellationEvaluation = ...  # type: QOpenGLShader.ShaderTypeBit
     Compute = ...  # type: QOpenGLShader.ShaderTypeBit
 
-    class ShaderType(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QOpenGLShader.ShaderType', 'QOpenGLShader.ShaderTypeBit']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QOpenGLShader.ShaderType') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QOpenGLShader.ShaderType': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QOpenGLShader.ShaderType', 'QOpenGLShader.ShaderTypeBit', int]) -> 'QOpenGLShader.ShaderType': ...
-        def __and__(self, other: typing.Union['QOpenGLShader.ShaderType', 'QOpenGLShader.ShaderTypeBit', int]) -> 'QOpenGLShader.ShaderType': ...
-        def __xor__(self, other: typing.Union['QOpenGLShader.ShaderType', 'QOpenGLShader.ShaderTypeBit', int]) -> 'QOpenGLShader.ShaderType': ...
-        def __ror__ (self, other: 'QOpenGLShader.ShaderTypeBit') -> 'QOpenGLShader.ShaderType': ...
-        def __rand__(self, other: 'QOpenGLShader.ShaderTypeBit') -> 'QOpenGLShader.ShaderType': ...
-        def __rxor__(self, other: 'QOpenGLShader.ShaderTypeBit') -> 'QOpenGLShader.ShaderType': ...
+    class ShaderType(QtCore._QFlags['QOpenGLShader.ShaderTypeBit']): ...
 
     def __init__(self, type: typing.Union['QOpenGLShader.ShaderType', 'QOpenGLShader.ShaderTypeBit'], parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
 
@@ -5183,28 +5015,7 @@ class QOpenGLTexture(sip.simplewrapper):
     TargetRectangle = ...  # type: QOpenGLTexture.Target
     TargetBuffer = ...  # type: QOpenGLTexture.Target
 
-    class Features(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QOpenGLTexture.Features', 'QOpenGLTexture.Feature']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QOpenGLTexture.Features') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QOpenGLTexture.Features': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QOpenGLTexture.Features', 'QOpenGLTexture.Feature', int]) -> 'QOpenGLTexture.Features': ...
-        def __and__(self, other: typing.Union['QOpenGLTexture.Features', 'QOpenGLTexture.Feature', int]) -> 'QOpenGLTexture.Features': ...
-        def __xor__(self, other: typing.Union['QOpenGLTexture.Features', 'QOpenGLTexture.Feature', int]) -> 'QOpenGLTexture.Features': ...
-        def __ror__ (self, other: 'QOpenGLTexture.Feature') -> 'QOpenGLTexture.Features': ...
-        def __rand__(self, other: 'QOpenGLTexture.Feature') -> 'QOpenGLTexture.Features': ...
-        def __rxor__(self, other: 'QOpenGLTexture.Feature') -> 'QOpenGLTexture.Features': ...
+    class Features(QtCore._QFlags['QOpenGLTexture.Feature']): ...
 
     @typing.overload
     def __init__(self, target: 'QOpenGLTexture.Target') -> None: ...
@@ -6491,28 +6302,7 @@ class QPainter(sip.simplewrapper):
     Qt4CompatiblePainting = ...  # type: QPainter.RenderHint
     LosslessImageRendering = ...  # type: QPainter.RenderHint
 
-    class RenderHints(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QPainter.RenderHints', 'QPainter.RenderHint']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QPainter.RenderHints') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QPainter.RenderHints': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QPainter.RenderHints', 'QPainter.RenderHint', int]) -> 'QPainter.RenderHints': ...
-        def __and__(self, other: typing.Union['QPainter.RenderHints', 'QPainter.RenderHint', int]) -> 'QPainter.RenderHints': ...
-        def __xor__(self, other: typing.Union['QPainter.RenderHints', 'QPainter.RenderHint', int]) -> 'QPainter.RenderHints': ...
-        def __ror__ (self, other: 'QPainter.RenderHint') -> 'QPainter.RenderHints': ...
-        def __rand__(self, other: 'QPainter.RenderHint') -> 'QPainter.RenderHints': ...
-        def __rxor__(self, other: 'QPainter.RenderHint') -> 'QPainter.RenderHints': ...
+    class RenderHints(QtCore._QFlags['QPainter.RenderHint']): ...
 
     class PixmapFragment(sip.simplewrapper):
 
@@ -6535,28 +6325,7 @@ class QPainter(sip.simplewrapper):
         @staticmethod
         def create(pos: typing.Union[QtCore.QPointF, QtCore.QPoint], sourceRect: QtCore.QRectF, scaleX: float = ..., scaleY: float = ..., rotation: float = ..., opacity: float = ...) -> 'QPainter.PixmapFragment': ...
 
-    class PixmapFragmentHints(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QPainter.PixmapFragmentHints', 'QPainter.PixmapFragmentHint']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QPainter.PixmapFragmentHints') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QPainter.PixmapFragmentHints': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QPainter.PixmapFragmentHints', 'QPainter.PixmapFragmentHint', int]) -> 'QPainter.PixmapFragmentHints': ...
-        def __and__(self, other: typing.Union['QPainter.PixmapFragmentHints', 'QPainter.PixmapFragmentHint', int]) -> 'QPainter.PixmapFragmentHints': ...
-        def __xor__(self, other: typing.Union['QPainter.PixmapFragmentHints', 'QPainter.PixmapFragmentHint', int]) -> 'QPainter.PixmapFragmentHints': ...
-        def __ror__ (self, other: 'QPainter.PixmapFragmentHint') -> 'QPainter.PixmapFragmentHints': ...
-        def __rand__(self, other: 'QPainter.PixmapFragmentHint') -> 'QPainter.PixmapFragmentHints': ...
-        def __rxor__(self, other: 'QPainter.PixmapFragmentHint') -> 'QPainter.PixmapFragmentHints': ...
+    class PixmapFragmentHints(QtCore._QFlags['QPainter.PixmapFragmentHint']): ...
 
     @typing.overload
     def __init__(self) -> None: ...
@@ -6905,28 +6674,7 @@ class QTextItem(sip.simplewrapper):
     Underline = ...  # type: QTextItem.RenderFlag
     StrikeOut = ...  # type: QTextItem.RenderFlag
 
-    class RenderFlags(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QTextItem.RenderFlags', 'QTextItem.RenderFlag']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QTextItem.RenderFlags') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QTextItem.RenderFlags': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QTextItem.RenderFlags', 'QTextItem.RenderFlag', int]) -> 'QTextItem.RenderFlags': ...
-        def __and__(self, other: typing.Union['QTextItem.RenderFlags', 'QTextItem.RenderFlag', int]) -> 'QTextItem.RenderFlags': ...
-        def __xor__(self, other: typing.Union['QTextItem.RenderFlags', 'QTextItem.RenderFlag', int]) -> 'QTextItem.RenderFlags': ...
-        def __ror__ (self, other: 'QTextItem.RenderFlag') -> 'QTextItem.RenderFlags': ...
-        def __rand__(self, other: 'QTextItem.RenderFlag') -> 'QTextItem.RenderFlags': ...
-        def __rxor__(self, other: 'QTextItem.RenderFlag') -> 'QTextItem.RenderFlags': ...
+    class RenderFlags(QtCore._QFlags['QTextItem.RenderFlag']): ...
 
     @typing.overload
     def __init__(self) -> None: ...
@@ -7074,51 +6822,9 @@ class QPaintEngine(sip.simplewrapper):
     RasterOpModes = ...  # type: QPaintEngine.PaintEngineFeature
     AllFeatures = ...  # type: QPaintEngine.PaintEngineFeature
 
-    class PaintEngineFeatures(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QPaintEngine.PaintEngineFeatures', 'QPaintEngine.PaintEngineFeature']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QPaintEngine.PaintEngineFeatures') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QPaintEngine.PaintEngineFeatures': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QPaintEngine.PaintEngineFeatures', 'QPaintEngine.PaintEngineFeature', int]) -> 'QPaintEngine.PaintEngineFeatures': ...
-        def __and__(self, other: typing.Union['QPaintEngine.PaintEngineFeatures', 'QPaintEngine.PaintEngineFeature', int]) -> 'QPaintEngine.PaintEngineFeatures': ...
-        def __xor__(self, other: typing.Union['QPaintEngine.PaintEngineFeatures', 'QPaintEngine.PaintEngineFeature', int]) -> 'QPaintEngine.PaintEngineFeatures': ...
-        def __ror__ (self, other: 'QPaintEngine.PaintEngineFeature') -> 'QPaintEngine.PaintEngineFeatures': ...
-        def __rand__(self, other: 'QPaintEngine.PaintEngineFeature') -> 'QPaintEngine.PaintEngineFeatures': ...
-        def __rxor__(self, other: 'QPaintEngine.PaintEngineFeature') -> 'QPaintEngine.PaintEngineFeatures': ...
-
-    class DirtyFlags(sip.simplewrapper):
+    class PaintEngineFeatures(QtCore._QFlags['QPaintEngine.PaintEngineFeature']): ...
 
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QPaintEngine.DirtyFlags', 'QPaintEngine.DirtyFlag']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QPaintEngine.DirtyFlags') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QPaintEngine.DirtyFlags': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QPaintEngine.DirtyFlags', 'QPaintEngine.DirtyFlag', int]) -> 'QPaintEngine.DirtyFlags': ...
-        def __and__(self, other: typing.Union['QPaintEngine.DirtyFlags', 'QPaintEngine.DirtyFlag', int]) -> 'QPaintEngine.DirtyFlags': ...
-        def __xor__(self, other: typing.Union['QPaintEngine.DirtyFlags', 'QPaintEngine.DirtyFlag', int]) -> 'QPaintEngine.DirtyFlags': ...
-        def __ror__ (self, other: 'QPaintEngine.DirtyFlag') -> 'QPaintEngine.DirtyFlags': ...
-        def __rand__(self, other: 'QPaintEngine.DirtyFlag') -> 'QPaintEngine.DirtyFlags': ...
-        def __rxor__(self, other: 'QPaintEngine.DirtyFlag') -> 'QPaintEngine.DirtyFlags': ...
+    class DirtyFlags(QtCore._QFlags['QPaintEngine.DirtyFlag']): ...
 
     def __init__(self, features: typing.Union['QPaintEngine.PaintEngineFeatures', 'QPaintEngine.PaintEngineFeature'] = ...) -> None: ...
 
@@ -8068,28 +7774,7 @@ class QRawFont(sip.simplewrapper):
     PixelAntialiasing = ...  # type: QRawFont.AntialiasingType
     SubPixelAntialiasing = ...  # type: QRawFont.AntialiasingType
 
-    class LayoutFlags(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QRawFont.LayoutFlags', 'QRawFont.LayoutFlag']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QRawFont.LayoutFlags') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QRawFont.LayoutFlags': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QRawFont.LayoutFlags', 'QRawFont.LayoutFlag', int]) -> 'QRawFont.LayoutFlags': ...
-        def __and__(self, other: typing.Union['QRawFont.LayoutFlags', 'QRawFont.LayoutFlag', int]) -> 'QRawFont.LayoutFlags': ...
-        def __xor__(self, other: typing.Union['QRawFont.LayoutFlags', 'QRawFont.LayoutFlag', int]) -> 'QRawFont.LayoutFlags': ...
-        def __ror__ (self, other: 'QRawFont.LayoutFlag') -> 'QRawFont.LayoutFlags': ...
-        def __rand__(self, other: 'QRawFont.LayoutFlag') -> 'QRawFont.LayoutFlags': ...
-        def __rxor__(self, other: 'QRawFont.LayoutFlag') -> 'QRawFont.LayoutFlags': ...
+    class LayoutFlags(QtCore._QFlags['QRawFont.LayoutFlag']): ...
 
     @typing.overload
     def __init__(self) -> None: ...
@@ -8642,28 +8327,7 @@ class QSurfaceFormat(sip.simplewrapper):
     DeprecatedFunctions = ...  # type: QSurfaceFormat.FormatOption
     ResetNotification = ...  # type: QSurfaceFormat.FormatOption
 
-    class FormatOptions(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QSurfaceFormat.FormatOptions', 'QSurfaceFormat.FormatOption']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QSurfaceFormat.FormatOptions') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QSurfaceFormat.FormatOptions': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QSurfaceFormat.FormatOptions', 'QSurfaceFormat.FormatOption', int]) -> 'QSurfaceFormat.FormatOptions': ...
-        def __and__(self, other: typing.Union['QSurfaceFormat.FormatOptions', 'QSurfaceFormat.FormatOption', int]) -> 'QSurfaceFormat.FormatOptions': ...
-        def __xor__(self, other: typing.Union['QSurfaceFormat.FormatOptions', 'QSurfaceFormat.FormatOption', int]) -> 'QSurfaceFormat.FormatOptions': ...
-        def __ror__ (self, other: 'QSurfaceFormat.FormatOption') -> 'QSurfaceFormat.FormatOptions': ...
-        def __rand__(self, other: 'QSurfaceFormat.FormatOption') -> 'QSurfaceFormat.FormatOptions': ...
-        def __rxor__(self, other: 'QSurfaceFormat.FormatOption') -> 'QSurfaceFormat.FormatOptions': ...
+    class FormatOptions(QtCore._QFlags['QSurfaceFormat.FormatOption']): ...
 
     @typing.overload
     def __init__(self) -> None: ...
@@ -8970,51 +8634,9 @@ class QTextDocument(QtCore.QObject):
     DocumentTitle = ...  # type: QTextDocument.MetaInformation
     DocumentUrl = ...  # type: QTextDocument.MetaInformation
 
-    class FindFlags(sip.simplewrapper):
+    class FindFlags(QtCore._QFlags['QTextDocument.FindFlag']): ...
 
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QTextDocument.FindFlags', 'QTextDocument.FindFlag']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QTextDocument.FindFlags') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QTextDocument.FindFlags': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QTextDocument.FindFlags', 'QTextDocument.FindFlag', int]) -> 'QTextDocument.FindFlags': ...
-        def __and__(self, other: typing.Union['QTextDocument.FindFlags', 'QTextDocument.FindFlag', int]) -> 'QTextDocument.FindFlags': ...
-        def __xor__(self, other: typing.Union['QTextDocument.FindFlags', 'QTextDocument.FindFlag', int]) -> 'QTextDocument.FindFlags': ...
-        def __ror__ (self, other: 'QTextDocument.FindFlag') -> 'QTextDocument.FindFlags': ...
-        def __rand__(self, other: 'QTextDocument.FindFlag') -> 'QTextDocument.FindFlags': ...
-        def __rxor__(self, other: 'QTextDocument.FindFlag') -> 'QTextDocument.FindFlags': ...
-
-    class MarkdownFeatures(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QTextDocument.MarkdownFeatures', 'QTextDocument.MarkdownFeature']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QTextDocument.MarkdownFeatures') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QTextDocument.MarkdownFeatures': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QTextDocument.MarkdownFeatures', 'QTextDocument.MarkdownFeature', int]) -> 'QTextDocument.MarkdownFeatures': ...
-        def __and__(self, other: typing.Union['QTextDocument.MarkdownFeatures', 'QTextDocument.MarkdownFeature', int]) -> 'QTextDocument.MarkdownFeatures': ...
-        def __xor__(self, other: typing.Union['QTextDocument.MarkdownFeatures', 'QTextDocument.MarkdownFeature', int]) -> 'QTextDocument.MarkdownFeatures': ...
-        def __ror__ (self, other: 'QTextDocument.MarkdownFeature') -> 'QTextDocument.MarkdownFeatures': ...
-        def __rand__(self, other: 'QTextDocument.MarkdownFeature') -> 'QTextDocument.MarkdownFeatures': ...
-        def __rxor__(self, other: 'QTextDocument.MarkdownFeature') -> 'QTextDocument.MarkdownFeatures': ...
+    class MarkdownFeatures(QtCore._QFlags['QTextDocument.MarkdownFeature']): ...
 
     @typing.overload
     def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
@@ -9457,28 +9079,7 @@ class QTextFormat(sip.simplewrapper):
     FrameFormat = ...  # type: QTextFormat.FormatType
     UserFormat = ...  # type: QTextFormat.FormatType
 
-    class PageBreakFlags(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QTextFormat.PageBreakFlags', 'QTextFormat.PageBreakFlag']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QTextFormat.PageBreakFlags') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QTextFormat.PageBreakFlags': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QTextFormat.PageBreakFlags', 'QTextFormat.PageBreakFlag', int]) -> 'QTextFormat.PageBreakFlags': ...
-        def __and__(self, other: typing.Union['QTextFormat.PageBreakFlags', 'QTextFormat.PageBreakFlag', int]) -> 'QTextFormat.PageBreakFlags': ...
-        def __xor__(self, other: typing.Union['QTextFormat.PageBreakFlags', 'QTextFormat.PageBreakFlag', int]) -> 'QTextFormat.PageBreakFlags': ...
-        def __ror__ (self, other: 'QTextFormat.PageBreakFlag') -> 'QTextFormat.PageBreakFlags': ...
-        def __rand__(self, other: 'QTextFormat.PageBreakFlag') -> 'QTextFormat.PageBreakFlags': ...
-        def __rxor__(self, other: 'QTextFormat.PageBreakFlag') -> 'QTextFormat.PageBreakFlags': ...
+    class PageBreakFlags(QtCore._QFlags['QTextFormat.PageBreakFlag']): ...
 
     @typing.overload
     def __init__(self) -> None: ...
@@ -10250,28 +9851,7 @@ class QTextOption(sip.simplewrapper):
     WrapAnywhere = ...  # type: QTextOption.WrapMode
     WrapAtWordBoundaryOrAnywhere = ...  # type: QTextOption.WrapMode
 
-    class Flags(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QTextOption.Flags', 'QTextOption.Flag']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QTextOption.Flags') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QTextOption.Flags': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QTextOption.Flags', 'QTextOption.Flag', int]) -> 'QTextOption.Flags': ...
-        def __and__(self, other: typing.Union['QTextOption.Flags', 'QTextOption.Flag', int]) -> 'QTextOption.Flags': ...
-        def __xor__(self, other: typing.Union['QTextOption.Flags', 'QTextOption.Flag', int]) -> 'QTextOption.Flags': ...
-        def __ror__ (self, other: 'QTextOption.Flag') -> 'QTextOption.Flags': ...
-        def __rand__(self, other: 'QTextOption.Flag') -> 'QTextOption.Flags': ...
-        def __rxor__(self, other: 'QTextOption.Flag') -> 'QTextOption.Flags': ...
+    class Flags(QtCore._QFlags['QTextOption.Flag']): ...
 
     class Tab(sip.simplewrapper):
 
@@ -10391,28 +9971,7 @@ class QTouchDevice(sip.simplewrapper):
     TouchScreen = ...  # type: QTouchDevice.DeviceType
     TouchPad = ...  # type: QTouchDevice.DeviceType
 
-    class Capabilities(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QTouchDevice.Capabilities', 'QTouchDevice.CapabilityFlag']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QTouchDevice.Capabilities') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QTouchDevice.Capabilities': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QTouchDevice.Capabilities', 'QTouchDevice.CapabilityFlag', int]) -> 'QTouchDevice.Capabilities': ...
-        def __and__(self, other: typing.Union['QTouchDevice.Capabilities', 'QTouchDevice.CapabilityFlag', int]) -> 'QTouchDevice.Capabilities': ...
-        def __xor__(self, other: typing.Union['QTouchDevice.Capabilities', 'QTouchDevice.CapabilityFlag', int]) -> 'QTouchDevice.Capabilities': ...
-        def __ror__ (self, other: 'QTouchDevice.CapabilityFlag') -> 'QTouchDevice.Capabilities': ...
-        def __rand__(self, other: 'QTouchDevice.CapabilityFlag') -> 'QTouchDevice.Capabilities': ...
-        def __rxor__(self, other: 'QTouchDevice.CapabilityFlag') -> 'QTouchDevice.Capabilities': ...
+    class Capabilities(QtCore._QFlags['QTouchDevice.CapabilityFlag']): ...
 
     @typing.overload
     def __init__(self) -> None: ...
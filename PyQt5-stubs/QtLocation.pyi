@@ -331,143 +331,17 @@ class QGeoRouteRequest(sip.simplewrapper):
     PublicTransitTravel = ...  # type: QGeoRouteRequest.TravelMode
     TruckTravel = ...  # type: QGeoRouteRequest.TravelMode
 
-    class TravelModes(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QGeoRouteRequest.TravelModes', 'QGeoRouteRequest.TravelMode']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QGeoRouteRequest.TravelModes') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QGeoRouteRequest.TravelModes': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QGeoRouteRequest.TravelModes', 'QGeoRouteRequest.TravelMode', int]) -> 'QGeoRouteRequest.TravelModes': ...
-        def __and__(self, other: typing.Union['QGeoRouteRequest.TravelModes', 'QGeoRouteRequest.TravelMode', int]) -> 'QGeoRouteRequest.TravelModes': ...
-        def __xor__(self, other: typing.Union['QGeoRouteRequest.TravelModes', 'QGeoRouteRequest.TravelMode', int]) -> 'QGeoRouteRequest.TravelModes': ...
-        def __ror__ (self, other: 'QGeoRouteRequest.TravelMode') -> 'QGeoRouteRequest.TravelModes': ...
-        def __rand__(self, other: 'QGeoRouteRequest.TravelMode') -> 'QGeoRouteRequest.TravelModes': ...
-        def __rxor__(self, other: 'QGeoRouteRequest.TravelMode') -> 'QGeoRouteRequest.TravelModes': ...
-
-    class FeatureTypes(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QGeoRouteRequest.FeatureTypes', 'QGeoRouteRequest.FeatureType']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QGeoRouteRequest.FeatureTypes') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QGeoRouteRequest.FeatureTypes': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QGeoRouteRequest.FeatureTypes', 'QGeoRouteRequest.FeatureType', int]) -> 'QGeoRouteRequest.FeatureTypes': ...
-        def __and__(self, other: typing.Union['QGeoRouteRequest.FeatureTypes', 'QGeoRouteRequest.FeatureType', int]) -> 'QGeoRouteRequest.FeatureTypes': ...
-        def __xor__(self, other: typing.Union['QGeoRouteRequest.FeatureTypes', 'QGeoRouteRequest.FeatureType', int]) -> 'QGeoRouteRequest.FeatureTypes': ...
-        def __ror__ (self, other: 'QGeoRouteRequest.FeatureType') -> 'QGeoRouteRequest.FeatureTypes': ...
-        def __rand__(self, other: 'QGeoRouteRequest.FeatureType') -> 'QGeoRouteRequest.FeatureTypes': ...
-        def __rxor__(self, other: 'QGeoRouteRequest.FeatureType') -> 'QGeoRouteRequest.FeatureTypes': ...
-
-    class FeatureWeights(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QGeoRouteRequest.FeatureWeights', 'QGeoRouteRequest.FeatureWeight']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QGeoRouteRequest.FeatureWeights') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QGeoRouteRequest.FeatureWeights': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QGeoRouteRequest.FeatureWeights', 'QGeoRouteRequest.FeatureWeight', int]) -> 'QGeoRouteRequest.FeatureWeights': ...
-        def __and__(self, other: typing.Union['QGeoRouteRequest.FeatureWeights', 'QGeoRouteRequest.FeatureWeight', int]) -> 'QGeoRouteRequest.FeatureWeights': ...
-        def __xor__(self, other: typing.Union['QGeoRouteRequest.FeatureWeights', 'QGeoRouteRequest.FeatureWeight', int]) -> 'QGeoRouteRequest.FeatureWeights': ...
-        def __ror__ (self, other: 'QGeoRouteRequest.FeatureWeight') -> 'QGeoRouteRequest.FeatureWeights': ...
-        def __rand__(self, other: 'QGeoRouteRequest.FeatureWeight') -> 'QGeoRouteRequest.FeatureWeights': ...
-        def __rxor__(self, other: 'QGeoRouteRequest.FeatureWeight') -> 'QGeoRouteRequest.FeatureWeights': ...
-
-    class RouteOptimizations(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QGeoRouteRequest.RouteOptimizations', 'QGeoRouteRequest.RouteOptimization']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QGeoRouteRequest.RouteOptimizations') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QGeoRouteRequest.RouteOptimizations': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QGeoRouteRequest.RouteOptimizations', 'QGeoRouteRequest.RouteOptimization', int]) -> 'QGeoRouteRequest.RouteOptimizations': ...
-        def __and__(self, other: typing.Union['QGeoRouteRequest.RouteOptimizations', 'QGeoRouteRequest.RouteOptimization', int]) -> 'QGeoRouteRequest.RouteOptimizations': ...
-        def __xor__(self, other: typing.Union['QGeoRouteRequest.RouteOptimizations', 'QGeoRouteRequest.RouteOptimization', int]) -> 'QGeoRouteRequest.RouteOptimizations': ...
-        def __ror__ (self, other: 'QGeoRouteRequest.RouteOptimization') -> 'QGeoRouteRequest.RouteOptimizations': ...
-        def __rand__(self, other: 'QGeoRouteRequest.RouteOptimization') -> 'QGeoRouteRequest.RouteOptimizations': ...
-        def __rxor__(self, other: 'QGeoRouteRequest.RouteOptimization') -> 'QGeoRouteRequest.RouteOptimizations': ...
-
-    class SegmentDetails(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QGeoRouteRequest.SegmentDetails', 'QGeoRouteRequest.SegmentDetail']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QGeoRouteRequest.SegmentDetails') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QGeoRouteRequest.SegmentDetails': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QGeoRouteRequest.SegmentDetails', 'QGeoRouteRequest.SegmentDetail', int]) -> 'QGeoRouteRequest.SegmentDetails': ...
-        def __and__(self, other: typing.Union['QGeoRouteRequest.SegmentDetails', 'QGeoRouteRequest.SegmentDetail', int]) -> 'QGeoRouteRequest.SegmentDetails': ...
-        def __xor__(self, other: typing.Union['QGeoRouteRequest.SegmentDetails', 'QGeoRouteRequest.SegmentDetail', int]) -> 'QGeoRouteRequest.SegmentDetails': ...
-        def __ror__ (self, other: 'QGeoRouteRequest.SegmentDetail') -> 'QGeoRouteRequest.SegmentDetails': ...
-        def __rand__(self, other: 'QGeoRouteRequest.SegmentDetail') -> 'QGeoRouteRequest.SegmentDetails': ...
-        def __rxor__(self, other: 'QGeoRouteRequest.SegmentDetail') -> 'QGeoRouteRequest.SegmentDetails': ...
-
-    class ManeuverDetails(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QGeoRouteRequest.ManeuverDetails', 'QGeoRouteRequest.ManeuverDetail']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QGeoRouteRequest.ManeuverDetails') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QGeoRouteRequest.ManeuverDetails': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QGeoRouteRequest.ManeuverDetails', 'QGeoRouteRequest.ManeuverDetail', int]) -> 'QGeoRouteRequest.ManeuverDetails': ...
-        def __and__(self, other: typing.Union['QGeoRouteRequest.ManeuverDetails', 'QGeoRouteRequest.ManeuverDetail', int]) -> 'QGeoRouteRequest.ManeuverDetails': ...
-        def __xor__(self, other: typing.Union['QGeoRouteRequest.ManeuverDetails', 'QGeoRouteRequest.ManeuverDetail', int]) -> 'QGeoRouteRequest.ManeuverDetails': ...
-        def __ror__ (self, other: 'QGeoRouteRequest.ManeuverDetail') -> 'QGeoRouteRequest.ManeuverDetails': ...
-        def __rand__(self, other: 'QGeoRouteRequest.ManeuverDetail') -> 'QGeoRouteRequest.ManeuverDetails': ...
-        def __rxor__(self, other: 'QGeoRouteRequest.ManeuverDetail') -> 'QGeoRouteRequest.ManeuverDetails': ...
+    class TravelModes(QtCore._QFlags['QGeoRouteRequest.TravelMode']): ...
+
+    class FeatureTypes(QtCore._QFlags['QGeoRouteRequest.FeatureType']): ...
+
+    class FeatureWeights(QtCore._QFlags['QGeoRouteRequest.FeatureWeight']): ...
+
+    class RouteOptimizations(QtCore._QFlags['QGeoRouteRequest.RouteOptimization']): ...
+
+    class SegmentDetails(QtCore._QFlags['QGeoRouteRequest.SegmentDetail']): ...
+
+    class ManeuverDetails(QtCore._QFlags['QGeoRouteRequest.ManeuverDetail']): ...
 
     @typing.overload
     def __init__(self, waypoints: typing.Iterable[QtPositioning.QGeoCoordinate] = ...) -> None: ...
@@ -692,120 +566,15 @@ class QGeoServiceProvider(QtCore.QObject):
     ConnectionError = ...  # type: QGeoServiceProvider.Error
     LoaderError = ...  # type: QGeoServiceProvider.Error
 
-    class RoutingFeatures(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QGeoServiceProvider.RoutingFeatures', 'QGeoServiceProvider.RoutingFeature']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QGeoServiceProvider.RoutingFeatures') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QGeoServiceProvider.RoutingFeatures': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QGeoServiceProvider.RoutingFeatures', 'QGeoServiceProvider.RoutingFeature', int]) -> 'QGeoServiceProvider.RoutingFeatures': ...
-        def __and__(self, other: typing.Union['QGeoServiceProvider.RoutingFeatures', 'QGeoServiceProvider.RoutingFeature', int]) -> 'QGeoServiceProvider.RoutingFeatures': ...
-        def __xor__(self, other: typing.Union['QGeoServiceProvider.RoutingFeatures', 'QGeoServiceProvider.RoutingFeature', int]) -> 'QGeoServiceProvider.RoutingFeatures': ...
-        def __ror__ (self, other: 'QGeoServiceProvider.RoutingFeature') -> 'QGeoServiceProvider.RoutingFeatures': ...
-        def __rand__(self, other: 'QGeoServiceProvider.RoutingFeature') -> 'QGeoServiceProvider.RoutingFeatures': ...
-        def __rxor__(self, other: 'QGeoServiceProvider.RoutingFeature') -> 'QGeoServiceProvider.RoutingFeatures': ...
-
-    class GeocodingFeatures(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QGeoServiceProvider.GeocodingFeatures', 'QGeoServiceProvider.GeocodingFeature']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QGeoServiceProvider.GeocodingFeatures') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QGeoServiceProvider.GeocodingFeatures': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QGeoServiceProvider.GeocodingFeatures', 'QGeoServiceProvider.GeocodingFeature', int]) -> 'QGeoServiceProvider.GeocodingFeatures': ...
-        def __and__(self, other: typing.Union['QGeoServiceProvider.GeocodingFeatures', 'QGeoServiceProvider.GeocodingFeature', int]) -> 'QGeoServiceProvider.GeocodingFeatures': ...
-        def __xor__(self, other: typing.Union['QGeoServiceProvider.GeocodingFeatures', 'QGeoServiceProvider.GeocodingFeature', int]) -> 'QGeoServiceProvider.GeocodingFeatures': ...
-        def __ror__ (self, other: 'QGeoServiceProvider.GeocodingFeature') -> 'QGeoServiceProvider.GeocodingFeatures': ...
-        def __rand__(self, other: 'QGeoServiceProvider.GeocodingFeature') -> 'QGeoServiceProvider.GeocodingFeatures': ...
-        def __rxor__(self, other: 'QGeoServiceProvider.GeocodingFeature') -> 'QGeoServiceProvider.GeocodingFeatures': ...
-
-    class MappingFeatures(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QGeoServiceProvider.MappingFeatures', 'QGeoServiceProvider.MappingFeature']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QGeoServiceProvider.MappingFeatures') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QGeoServiceProvider.MappingFeatures': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QGeoServiceProvider.MappingFeatures', 'QGeoServiceProvider.MappingFeature', int]) -> 'QGeoServiceProvider.MappingFeatures': ...
-        def __and__(self, other: typing.Union['QGeoServiceProvider.MappingFeatures', 'QGeoServiceProvider.MappingFeature', int]) -> 'QGeoServiceProvider.MappingFeatures': ...
-        def __xor__(self, other: typing.Union['QGeoServiceProvider.MappingFeatures', 'QGeoServiceProvider.MappingFeature', int]) -> 'QGeoServiceProvider.MappingFeatures': ...
-        def __ror__ (self, other: 'QGeoServiceProvider.MappingFeature') -> 'QGeoServiceProvider.MappingFeatures': ...
-        def __rand__(self, other: 'QGeoServiceProvider.MappingFeature') -> 'QGeoServiceProvider.MappingFeatures': ...
-        def __rxor__(self, other: 'QGeoServiceProvider.MappingFeature') -> 'QGeoServiceProvider.MappingFeatures': ...
-
-    class PlacesFeatures(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QGeoServiceProvider.PlacesFeatures', 'QGeoServiceProvider.PlacesFeature']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QGeoServiceProvider.PlacesFeatures') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QGeoServiceProvider.PlacesFeatures': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QGeoServiceProvider.PlacesFeatures', 'QGeoServiceProvider.PlacesFeature', int]) -> 'QGeoServiceProvider.PlacesFeatures': ...
-        def __and__(self, other: typing.Union['QGeoServiceProvider.PlacesFeatures', 'QGeoServiceProvider.PlacesFeature', int]) -> 'QGeoServiceProvider.PlacesFeatures': ...
-        def __xor__(self, other: typing.Union['QGeoServiceProvider.PlacesFeatures', 'QGeoServiceProvider.PlacesFeature', int]) -> 'QGeoServiceProvider.PlacesFeatures': ...
-        def __ror__ (self, other: 'QGeoServiceProvider.PlacesFeature') -> 'QGeoServiceProvider.PlacesFeatures': ...
-        def __rand__(self, other: 'QGeoServiceProvider.PlacesFeature') -> 'QGeoServiceProvider.PlacesFeatures': ...
-        def __rxor__(self, other: 'QGeoServiceProvider.PlacesFeature') -> 'QGeoServiceProvider.PlacesFeatures': ...
-
-    class NavigationFeatures(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QGeoServiceProvider.NavigationFeatures', 'QGeoServiceProvider.NavigationFeature']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QGeoServiceProvider.NavigationFeatures') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QGeoServiceProvider.NavigationFeatures': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QGeoServiceProvider.NavigationFeatures', 'QGeoServiceProvider.NavigationFeature', int]) -> 'QGeoServiceProvider.NavigationFeatures': ...
-        def __and__(self, other: typing.Union['QGeoServiceProvider.NavigationFeatures', 'QGeoServiceProvider.NavigationFeature', int]) -> 'QGeoServiceProvider.NavigationFeatures': ...
-        def __xor__(self, other: typing.Union['QGeoServiceProvider.NavigationFeatures', 'QGeoServiceProvider.NavigationFeature', int]) -> 'QGeoServiceProvider.NavigationFeatures': ...
-        def __ror__ (self, other: 'QGeoServiceProvider.NavigationFeature') -> 'QGeoServiceProvider.NavigationFeatures': ...
-        def __rand__(self, other: 'QGeoServiceProvider.NavigationFeature') -> 'QGeoServiceProvider.NavigationFeatures': ...
-        def __rxor__(self, other: 'QGeoServiceProvider.NavigationFeature') -> 'QGeoServiceProvider.NavigationFeatures': ...
+    class RoutingFeatures(QtCore._QFlags['QGeoServiceProvider.RoutingFeature']): ...
+
+    class GeocodingFeatures(QtCore._QFlags['QGeoServiceProvider.GeocodingFeature']): ...
+
+    class MappingFeatures(QtCore._QFlags['QGeoServiceProvider.MappingFeature']): ...
+
+    class PlacesFeatures(QtCore._QFlags['QGeoServiceProvider.PlacesFeature']): ...
+
+    class NavigationFeatures(QtCore._QFlags['QGeoServiceProvider.NavigationFeature']): ...
 
     def __init__(self, providerName: str, parameters: typing.Dict[str, typing.Any] = ..., allowExperimental: bool = ...) -> None: ...
 
@@ -853,28 +622,7 @@ class QLocation(sip.simplewrapper):
     PrivateVisibility = ...  # type: QLocation.Visibility
     PublicVisibility = ...  # type: QLocation.Visibility
 
-    class VisibilityScope(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QLocation.VisibilityScope', 'QLocation.Visibility']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QLocation.VisibilityScope') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QLocation.VisibilityScope': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QLocation.VisibilityScope', 'QLocation.Visibility', int]) -> 'QLocation.VisibilityScope': ...
-        def __and__(self, other: typing.Union['QLocation.VisibilityScope', 'QLocation.Visibility', int]) -> 'QLocation.VisibilityScope': ...
-        def __xor__(self, other: typing.Union['QLocation.VisibilityScope', 'QLocation.Visibility', int]) -> 'QLocation.VisibilityScope': ...
-        def __ror__ (self, other: 'QLocation.Visibility') -> 'QLocation.VisibilityScope': ...
-        def __rand__(self, other: 'QLocation.Visibility') -> 'QLocation.VisibilityScope': ...
-        def __rxor__(self, other: 'QLocation.Visibility') -> 'QLocation.VisibilityScope': ...
+    class VisibilityScope(QtCore._QFlags['QLocation.Visibility']): ...
 
 
 class QPlace(sip.simplewrapper):
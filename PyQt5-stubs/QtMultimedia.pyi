@@ -91,28 +91,7 @@ class QVideoFilterRunnable(sip.simplewrapper):
 
     LastInChain = ...  # type: QVideoFilterRunnable.RunFlag
 
-    class RunFlags(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QVideoFilterRunnable.RunFlags', 'QVideoFilterRunnable.RunFlag']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QVideoFilterRunnable.RunFlags') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QVideoFilterRunnable.RunFlags': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QVideoFilterRunnable.RunFlags', 'QVideoFilterRunnable.RunFlag', int]) -> 'QVideoFilterRunnable.RunFlags': ...
-        def __and__(self, other: typing.Union['QVideoFilterRunnable.RunFlags', 'QVideoFilterRunnable.RunFlag', int]) -> 'QVideoFilterRunnable.RunFlags': ...
-        def __xor__(self, other: typing.Union['QVideoFilterRunnable.RunFlags', 'QVideoFilterRunnable.RunFlag', int]) -> 'QVideoFilterRunnable.RunFlags': ...
-        def __ror__ (self, other: 'QVideoFilterRunnable.RunFlag') -> 'QVideoFilterRunnable.RunFlags': ...
-        def __rand__(self, other: 'QVideoFilterRunnable.RunFlag') -> 'QVideoFilterRunnable.RunFlags': ...
-        def __rxor__(self, other: 'QVideoFilterRunnable.RunFlag') -> 'QVideoFilterRunnable.RunFlags': ...
+    class RunFlags(QtCore._QFlags['QVideoFilterRunnable.RunFlag']): ...
 
     @typing.overload
     def __init__(self) -> None: ...
@@ -788,51 +767,9 @@ class QCamera(QMediaObject):
     StoppingStatus = ...  # type: QCamera.Status
     ActiveStatus = ...  # type: QCamera.Status
 
-    class CaptureModes(sip.simplewrapper):
+    class CaptureModes(QtCore._QFlags['QCamera.CaptureMode']): ...
 
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QCamera.CaptureModes', 'QCamera.CaptureMode']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QCamera.CaptureModes') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QCamera.CaptureModes': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QCamera.CaptureModes', 'QCamera.CaptureMode', int]) -> 'QCamera.CaptureModes': ...
-        def __and__(self, other: typing.Union['QCamera.CaptureModes', 'QCamera.CaptureMode', int]) -> 'QCamera.CaptureModes': ...
-        def __xor__(self, other: typing.Union['QCamera.CaptureModes', 'QCamera.CaptureMode', int]) -> 'QCamera.CaptureModes': ...
-        def __ror__ (self, other: 'QCamera.CaptureMode') -> 'QCamera.CaptureModes': ...
-        def __rand__(self, other: 'QCamera.CaptureMode') -> 'QCamera.CaptureModes': ...
-        def __rxor__(self, other: 'QCamera.CaptureMode') -> 'QCamera.CaptureModes': ...
-
-    class LockTypes(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QCamera.LockTypes', 'QCamera.LockType']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QCamera.LockTypes') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QCamera.LockTypes': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QCamera.LockTypes', 'QCamera.LockType', int]) -> 'QCamera.LockTypes': ...
-        def __and__(self, other: typing.Union['QCamera.LockTypes', 'QCamera.LockType', int]) -> 'QCamera.LockTypes': ...
-        def __xor__(self, other: typing.Union['QCamera.LockTypes', 'QCamera.LockType', int]) -> 'QCamera.LockTypes': ...
-        def __ror__ (self, other: 'QCamera.LockType') -> 'QCamera.LockTypes': ...
-        def __rand__(self, other: 'QCamera.LockType') -> 'QCamera.LockTypes': ...
-        def __rxor__(self, other: 'QCamera.LockType') -> 'QCamera.LockTypes': ...
+    class LockTypes(QtCore._QFlags['QCamera.LockType']): ...
 
     class FrameRateRange(sip.simplewrapper):
 
@@ -1043,28 +980,7 @@ class QCameraExposure(QtCore.QObject):
     FlashSlowSyncRearCurtain = ...  # type: QCameraExposure.FlashMode
     FlashManual = ...  # type: QCameraExposure.FlashMode
 
-    class FlashModes(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QCameraExposure.FlashModes', 'QCameraExposure.FlashMode']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QCameraExposure.FlashModes') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QCameraExposure.FlashModes': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QCameraExposure.FlashModes', 'QCameraExposure.FlashMode', int]) -> 'QCameraExposure.FlashModes': ...
-        def __and__(self, other: typing.Union['QCameraExposure.FlashModes', 'QCameraExposure.FlashMode', int]) -> 'QCameraExposure.FlashModes': ...
-        def __xor__(self, other: typing.Union['QCameraExposure.FlashModes', 'QCameraExposure.FlashMode', int]) -> 'QCameraExposure.FlashModes': ...
-        def __ror__ (self, other: 'QCameraExposure.FlashMode') -> 'QCameraExposure.FlashModes': ...
-        def __rand__(self, other: 'QCameraExposure.FlashMode') -> 'QCameraExposure.FlashModes': ...
-        def __rxor__(self, other: 'QCameraExposure.FlashMode') -> 'QCameraExposure.FlashModes': ...
+    class FlashModes(QtCore._QFlags['QCameraExposure.FlashMode']): ...
 
     exposureCompensationChanged: typing.ClassVar[QtCore.pyqtSignal]
     isoSensitivityChanged: typing.ClassVar[QtCore.pyqtSignal]
@@ -1242,28 +1158,7 @@ class QCameraFocus(QtCore.QObject):
     ContinuousFocus = ...  # type: QCameraFocus.FocusMode
     MacroFocus = ...  # type: QCameraFocus.FocusMode
 
-    class FocusModes(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QCameraFocus.FocusModes', 'QCameraFocus.FocusMode']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QCameraFocus.FocusModes') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QCameraFocus.FocusModes': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QCameraFocus.FocusModes', 'QCameraFocus.FocusMode', int]) -> 'QCameraFocus.FocusModes': ...
-        def __and__(self, other: typing.Union['QCameraFocus.FocusModes', 'QCameraFocus.FocusMode', int]) -> 'QCameraFocus.FocusModes': ...
-        def __xor__(self, other: typing.Union['QCameraFocus.FocusModes', 'QCameraFocus.FocusMode', int]) -> 'QCameraFocus.FocusModes': ...
-        def __ror__ (self, other: 'QCameraFocus.FocusMode') -> 'QCameraFocus.FocusModes': ...
-        def __rand__(self, other: 'QCameraFocus.FocusMode') -> 'QCameraFocus.FocusModes': ...
-        def __rxor__(self, other: 'QCameraFocus.FocusMode') -> 'QCameraFocus.FocusModes': ...
+    class FocusModes(QtCore._QFlags['QCameraFocus.FocusMode']): ...
 
     maximumDigitalZoomChanged: typing.ClassVar[QtCore.pyqtSignal]
     maximumOpticalZoomChanged: typing.ClassVar[QtCore.pyqtSignal]
@@ -1338,28 +1233,7 @@ class QCameraImageCapture(QtCore.QObject, QMediaBindableInterface):
     NotSupportedFeatureError = ...  # type: QCameraImageCapture.Error
     FormatError = ...  # type: QCameraImageCapture.Error
 
-    class CaptureDestinations(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QCameraImageCapture.CaptureDestinations', 'QCameraImageCapture.CaptureDestination']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QCameraImageCapture.CaptureDestinations') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QCameraImageCapture.CaptureDestinations': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QCameraImageCapture.CaptureDestinations', 'QCameraImageCapture.CaptureDestination', int]) -> 'QCameraImageCapture.CaptureDestinations': ...
-        def __and__(self, other: typing.Union['QCameraImageCapture.CaptureDestinations', 'QCameraImageCapture.CaptureDestination', int]) -> 'QCameraImageCapture.CaptureDestinations': ...
-        def __xor__(self, other: typing.Union['QCameraImageCapture.CaptureDestinations', 'QCameraImageCapture.CaptureDestination', int]) -> 'QCameraImageCapture.CaptureDestinations': ...
-        def __ror__ (self, other: 'QCameraImageCapture.CaptureDestination') -> 'QCameraImageCapture.CaptureDestinations': ...
-        def __rand__(self, other: 'QCameraImageCapture.CaptureDestination') -> 'QCameraImageCapture.CaptureDestinations': ...
-        def __rxor__(self, other: 'QCameraImageCapture.CaptureDestination') -> 'QCameraImageCapture.CaptureDestinations': ...
+    class CaptureDestinations(QtCore._QFlags['QCameraImageCapture.CaptureDestination']): ...
 
     def __init__(self, mediaObject: QMediaObject, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
 
@@ -1964,28 +1838,7 @@ class QMediaPlayer(QMediaObject):
     PlayingState = ...  # type: QMediaPlayer.State
     PausedState = ...  # type: QMediaPlayer.State
 
-    class Flags(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QMediaPlayer.Flags', 'QMediaPlayer.Flag']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QMediaPlayer.Flags') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QMediaPlayer.Flags': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QMediaPlayer.Flags', 'QMediaPlayer.Flag', int]) -> 'QMediaPlayer.Flags': ...
-        def __and__(self, other: typing.Union['QMediaPlayer.Flags', 'QMediaPlayer.Flag', int]) -> 'QMediaPlayer.Flags': ...
-        def __xor__(self, other: typing.Union['QMediaPlayer.Flags', 'QMediaPlayer.Flag', int]) -> 'QMediaPlayer.Flags': ...
-        def __ror__ (self, other: 'QMediaPlayer.Flag') -> 'QMediaPlayer.Flags': ...
-        def __rand__(self, other: 'QMediaPlayer.Flag') -> 'QMediaPlayer.Flags': ...
-        def __rxor__(self, other: 'QMediaPlayer.Flag') -> 'QMediaPlayer.Flags': ...
+    class Flags(QtCore._QFlags['QMediaPlayer.Flag']): ...
 
     def __init__(self, parent: typing.Optional[QtCore.QObject] = ..., flags: typing.Union['QMediaPlayer.Flags', 'QMediaPlayer.Flag'] = ...) -> None: ...
 
@@ -261,28 +261,7 @@ class QNearFieldManager(QtCore.QObject):
     NdefWriteTargetAccess = ...  # type: QNearFieldManager.TargetAccessMode
     TagTypeSpecificTargetAccess = ...  # type: QNearFieldManager.TargetAccessMode
 
-    class TargetAccessModes(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QNearFieldManager.TargetAccessModes', 'QNearFieldManager.TargetAccessMode']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QNearFieldManager.TargetAccessModes') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QNearFieldManager.TargetAccessModes': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QNearFieldManager.TargetAccessModes', 'QNearFieldManager.TargetAccessMode', int]) -> 'QNearFieldManager.TargetAccessModes': ...
-        def __and__(self, other: typing.Union['QNearFieldManager.TargetAccessModes', 'QNearFieldManager.TargetAccessMode', int]) -> 'QNearFieldManager.TargetAccessModes': ...
-        def __xor__(self, other: typing.Union['QNearFieldManager.TargetAccessModes', 'QNearFieldManager.TargetAccessMode', int]) -> 'QNearFieldManager.TargetAccessModes': ...
-        def __ror__ (self, other: 'QNearFieldManager.TargetAccessMode') -> 'QNearFieldManager.TargetAccessModes': ...
-        def __rand__(self, other: 'QNearFieldManager.TargetAccessMode') -> 'QNearFieldManager.TargetAccessModes': ...
-        def __rxor__(self, other: 'QNearFieldManager.TargetAccessMode') -> 'QNearFieldManager.TargetAccessModes': ...
+    class TargetAccessModes(QtCore._QFlags['QNearFieldManager.TargetAccessMode']): ...
 
     def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
 
@@ -339,28 +318,7 @@ class QNearFieldShareManager(QtCore.QObject):
     ShareAlreadyInProgressError = ...  # type: QNearFieldShareManager.ShareError
     SharePermissionDeniedError = ...  # type: QNearFieldShareManager.ShareError
 
-    class ShareModes(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QNearFieldShareManager.ShareModes', 'QNearFieldShareManager.ShareMode']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QNearFieldShareManager.ShareModes') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QNearFieldShareManager.ShareModes': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QNearFieldShareManager.ShareModes', 'QNearFieldShareManager.ShareMode', int]) -> 'QNearFieldShareManager.ShareModes': ...
-        def __and__(self, other: typing.Union['QNearFieldShareManager.ShareModes', 'QNearFieldShareManager.ShareMode', int]) -> 'QNearFieldShareManager.ShareModes': ...
-        def __xor__(self, other: typing.Union['QNearFieldShareManager.ShareModes', 'QNearFieldShareManager.ShareMode', int]) -> 'QNearFieldShareManager.ShareModes': ...
-        def __ror__ (self, other: 'QNearFieldShareManager.ShareMode') -> 'QNearFieldShareManager.ShareModes': ...
-        def __rand__(self, other: 'QNearFieldShareManager.ShareMode') -> 'QNearFieldShareManager.ShareModes': ...
-        def __rxor__(self, other: 'QNearFieldShareManager.ShareMode') -> 'QNearFieldShareManager.ShareModes': ...
+    class ShareModes(QtCore._QFlags['QNearFieldShareManager.ShareMode']): ...
 
     def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
 
@@ -442,28 +400,7 @@ class QNearFieldTarget(QtCore.QObject):
     NfcTagType4 = ...  # type: QNearFieldTarget.Type
     MifareTag = ...  # type: QNearFieldTarget.Type
 
-    class AccessMethods(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QNearFieldTarget.AccessMethods', 'QNearFieldTarget.AccessMethod']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QNearFieldTarget.AccessMethods') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QNearFieldTarget.AccessMethods': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QNearFieldTarget.AccessMethods', 'QNearFieldTarget.AccessMethod', int]) -> 'QNearFieldTarget.AccessMethods': ...
-        def __and__(self, other: typing.Union['QNearFieldTarget.AccessMethods', 'QNearFieldTarget.AccessMethod', int]) -> 'QNearFieldTarget.AccessMethods': ...
-        def __xor__(self, other: typing.Union['QNearFieldTarget.AccessMethods', 'QNearFieldTarget.AccessMethod', int]) -> 'QNearFieldTarget.AccessMethods': ...
-        def __ror__ (self, other: 'QNearFieldTarget.AccessMethod') -> 'QNearFieldTarget.AccessMethods': ...
-        def __rand__(self, other: 'QNearFieldTarget.AccessMethod') -> 'QNearFieldTarget.AccessMethods': ...
-        def __rxor__(self, other: 'QNearFieldTarget.AccessMethod') -> 'QNearFieldTarget.AccessMethods': ...
+    class AccessMethods(QtCore._QFlags['QNearFieldTarget.AccessMethod']): ...
 
     class RequestId(sip.simplewrapper):
 
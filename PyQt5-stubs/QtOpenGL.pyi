@@ -93,28 +93,7 @@ class QGL(sip.simplewrapper):
     DeprecatedFunctions = ...  # type: QGL.FormatOption
     NoDeprecatedFunctions = ...  # type: QGL.FormatOption
 
-    class FormatOptions(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QGL.FormatOptions', 'QGL.FormatOption']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QGL.FormatOptions') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QGL.FormatOptions': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QGL.FormatOptions', 'QGL.FormatOption', int]) -> 'QGL.FormatOptions': ...
-        def __and__(self, other: typing.Union['QGL.FormatOptions', 'QGL.FormatOption', int]) -> 'QGL.FormatOptions': ...
-        def __xor__(self, other: typing.Union['QGL.FormatOptions', 'QGL.FormatOption', int]) -> 'QGL.FormatOptions': ...
-        def __ror__ (self, other: 'QGL.FormatOption') -> 'QGL.FormatOptions': ...
-        def __rand__(self, other: 'QGL.FormatOption') -> 'QGL.FormatOptions': ...
-        def __rxor__(self, other: 'QGL.FormatOption') -> 'QGL.FormatOptions': ...
+    class FormatOptions(QtCore._QFlags['QGL.FormatOption']): ...
 
 
 class QGLFormat(sip.simplewrapper):
@@ -176,28 +155,7 @@ class QGLFormat(sip.simplewrapper):
     OpenGL_ES_CommonLite_Version_1_1 = ...  # type: QGLFormat.OpenGLVersionFlag
     OpenGL_ES_Version_2_0 = ...  # type: QGLFormat.OpenGLVersionFlag
 
-    class OpenGLVersionFlags(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QGLFormat.OpenGLVersionFlags', 'QGLFormat.OpenGLVersionFlag']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QGLFormat.OpenGLVersionFlags') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QGLFormat.OpenGLVersionFlags': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QGLFormat.OpenGLVersionFlags', 'QGLFormat.OpenGLVersionFlag', int]) -> 'QGLFormat.OpenGLVersionFlags': ...
-        def __and__(self, other: typing.Union['QGLFormat.OpenGLVersionFlags', 'QGLFormat.OpenGLVersionFlag', int]) -> 'QGLFormat.OpenGLVersionFlags': ...
-        def __xor__(self, other: typing.Union['QGLFormat.OpenGLVersionFlags', 'QGLFormat.OpenGLVersionFlag', int]) -> 'QGLFormat.OpenGLVersionFlags': ...
-        def __ror__ (self, other: 'QGLFormat.OpenGLVersionFlag') -> 'QGLFormat.OpenGLVersionFlags': ...
-        def __rand__(self, other: 'QGLFormat.OpenGLVersionFlag') -> 'QGLFormat.OpenGLVersionFlags': ...
-        def __rxor__(self, other: 'QGLFormat.OpenGLVersionFlag') -> 'QGLFormat.OpenGLVersionFlags': ...
+    class OpenGLVersionFlags(QtCore._QFlags['QGLFormat.OpenGLVersionFlag']): ...
 
     @typing.overload
     def __init__(self) -> None: ...
@@ -289,28 +247,7 @@ class QGLContext(sip.wrapper):
     LinearFilteringBindOption = ...  # type: QGLContext.BindOption
     DefaultBindOption = ...  # type: QGLContext.BindOption
 
-    class BindOptions(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QGLContext.BindOptions', 'QGLContext.BindOption']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QGLContext.BindOptions') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QGLContext.BindOptions': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QGLContext.BindOptions', 'QGLContext.BindOption', int]) -> 'QGLContext.BindOptions': ...
-        def __and__(self, other: typing.Union['QGLContext.BindOptions', 'QGLContext.BindOption', int]) -> 'QGLContext.BindOptions': ...
-        def __xor__(self, other: typing.Union['QGLContext.BindOptions', 'QGLContext.BindOption', int]) -> 'QGLContext.BindOptions': ...
-        def __ror__ (self, other: 'QGLContext.BindOption') -> 'QGLContext.BindOptions': ...
-        def __rand__(self, other: 'QGLContext.BindOption') -> 'QGLContext.BindOptions': ...
-        def __rxor__(self, other: 'QGLContext.BindOption') -> 'QGLContext.BindOptions': ...
+    class BindOptions(QtCore._QFlags['QGLContext.BindOption']): ...
 
     def __init__(self, format: QGLFormat) -> None: ...
 
@@ -103,28 +103,7 @@ class QGeoAreaMonitorSource(QtCore.QObject):
     UnknownSourceError = ...  # type: QGeoAreaMonitorSource.Error
     NoError = ...  # type: QGeoAreaMonitorSource.Error
 
-    class AreaMonitorFeatures(sip.wrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QGeoAreaMonitorSource.AreaMonitorFeatures', 'QGeoAreaMonitorSource.AreaMonitorFeature']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QGeoAreaMonitorSource.AreaMonitorFeatures') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QGeoAreaMonitorSource.AreaMonitorFeatures': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QGeoAreaMonitorSource.AreaMonitorFeatures', 'QGeoAreaMonitorSource.AreaMonitorFeature', int]) -> 'QGeoAreaMonitorSource.AreaMonitorFeatures': ...
-        def __and__(self, other: typing.Union['QGeoAreaMonitorSource.AreaMonitorFeatures', 'QGeoAreaMonitorSource.AreaMonitorFeature', int]) -> 'QGeoAreaMonitorSource.AreaMonitorFeatures': ...
-        def __xor__(self, other: typing.Union['QGeoAreaMonitorSource.AreaMonitorFeatures', 'QGeoAreaMonitorSource.AreaMonitorFeature', int]) -> 'QGeoAreaMonitorSource.AreaMonitorFeatures': ...
-        def __ror__ (self, other: 'QGeoAreaMonitorSource.AreaMonitorFeature') -> 'QGeoAreaMonitorSource.AreaMonitorFeatures': ...
-        def __rand__(self, other: 'QGeoAreaMonitorSource.AreaMonitorFeature') -> 'QGeoAreaMonitorSource.AreaMonitorFeatures': ...
-        def __rxor__(self, other: 'QGeoAreaMonitorSource.AreaMonitorFeature') -> 'QGeoAreaMonitorSource.AreaMonitorFeatures': ...
+    class AreaMonitorFeatures(QtCore._QFlags['QGeoAreaMonitorSource.AreaMonitorFeature'], sip.wrapper): ...
 
     def __init__(self, parent: QtCore.QObject) -> None: ...
 
@@ -403,28 +382,7 @@ class QGeoPositionInfoSource(QtCore.QObject):
     UnknownSourceError = ...  # type: QGeoPositionInfoSource.Error
     NoError = ...  # type: QGeoPositionInfoSource.Error
 
-    class PositioningMethods(sip.wrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QGeoPositionInfoSource.PositioningMethods', 'QGeoPositionInfoSource.PositioningMethod']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QGeoPositionInfoSource.PositioningMethods') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QGeoPositionInfoSource.PositioningMethods': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QGeoPositionInfoSource.PositioningMethods', 'QGeoPositionInfoSource.PositioningMethod', int]) -> 'QGeoPositionInfoSource.PositioningMethods': ...
-        def __and__(self, other: typing.Union['QGeoPositionInfoSource.PositioningMethods', 'QGeoPositionInfoSource.PositioningMethod', int]) -> 'QGeoPositionInfoSource.PositioningMethods': ...
-        def __xor__(self, other: typing.Union['QGeoPositionInfoSource.PositioningMethods', 'QGeoPositionInfoSource.PositioningMethod', int]) -> 'QGeoPositionInfoSource.PositioningMethods': ...
-        def __ror__ (self, other: 'QGeoPositionInfoSource.PositioningMethod') -> 'QGeoPositionInfoSource.PositioningMethods': ...
-        def __rand__(self, other: 'QGeoPositionInfoSource.PositioningMethod') -> 'QGeoPositionInfoSource.PositioningMethods': ...
-        def __rxor__(self, other: 'QGeoPositionInfoSource.PositioningMethod') -> 'QGeoPositionInfoSource.PositioningMethods': ...
+    class PositioningMethods(QtCore._QFlags['QGeoPositionInfoSource.PositioningMethod'], sip.wrapper): ...
 
     def __init__(self, parent: QtCore.QObject) -> None: ...
 
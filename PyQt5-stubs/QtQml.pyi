@@ -49,28 +49,7 @@ class QJSEngine(QtCore.QObject):
     GarbageCollectionExtension = ...  # type: QJSEngine.Extension
     AllExtensions = ...  # type: QJSEngine.Extension
 
-    class Extensions(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QJSEngine.Extensions', 'QJSEngine.Extension']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QJSEngine.Extensions') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QJSEngine.Extensions': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QJSEngine.Extensions', 'QJSEngine.Extension', int]) -> 'QJSEngine.Extensions': ...
-        def __and__(self, other: typing.Union['QJSEngine.Extensions', 'QJSEngine.Extension', int]) -> 'QJSEngine.Extensions': ...
-        def __xor__(self, other: typing.Union['QJSEngine.Extensions', 'QJSEngine.Extension', int]) -> 'QJSEngine.Extensions': ...
-        def __ror__ (self, other: 'QJSEngine.Extension') -> 'QJSEngine.Extensions': ...
-        def __rand__(self, other: 'QJSEngine.Extension') -> 'QJSEngine.Extensions': ...
-        def __rxor__(self, other: 'QJSEngine.Extension') -> 'QJSEngine.Extensions': ...
+    class Extensions(QtCore._QFlags['QJSEngine.Extension']): ...
 
     @typing.overload
     def __init__(self) -> None: ...
@@ -390,28 +369,7 @@ class QQmlImageProviderBase(sip.wrapper):
     Texture = ...  # type: QQmlImageProviderBase.ImageType
     ImageResponse = ...  # type: QQmlImageProviderBase.ImageType
 
-    class Flags(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QQmlImageProviderBase.Flags', 'QQmlImageProviderBase.Flag']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QQmlImageProviderBase.Flags') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QQmlImageProviderBase.Flags': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QQmlImageProviderBase.Flags', 'QQmlImageProviderBase.Flag', int]) -> 'QQmlImageProviderBase.Flags': ...
-        def __and__(self, other: typing.Union['QQmlImageProviderBase.Flags', 'QQmlImageProviderBase.Flag', int]) -> 'QQmlImageProviderBase.Flags': ...
-        def __xor__(self, other: typing.Union['QQmlImageProviderBase.Flags', 'QQmlImageProviderBase.Flag', int]) -> 'QQmlImageProviderBase.Flags': ...
-        def __ror__ (self, other: 'QQmlImageProviderBase.Flag') -> 'QQmlImageProviderBase.Flags': ...
-        def __rand__(self, other: 'QQmlImageProviderBase.Flag') -> 'QQmlImageProviderBase.Flags': ...
-        def __rxor__(self, other: 'QQmlImageProviderBase.Flag') -> 'QQmlImageProviderBase.Flags': ...
+    class Flags(QtCore._QFlags['QQmlImageProviderBase.Flag']): ...
 
     def __init__(self, a0: 'QQmlImageProviderBase') -> None: ...
 
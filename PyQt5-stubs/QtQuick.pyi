@@ -104,28 +104,7 @@ class QQuickItem(QtCore.QObject, QtQml.QQmlParserStatus):
     ItemHasContents = ...  # type: QQuickItem.Flag
     ItemAcceptsDrops = ...  # type: QQuickItem.Flag
 
-    class Flags(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QQuickItem.Flags', 'QQuickItem.Flag']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QQuickItem.Flags') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QQuickItem.Flags': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QQuickItem.Flags', 'QQuickItem.Flag', int]) -> 'QQuickItem.Flags': ...
-        def __and__(self, other: typing.Union['QQuickItem.Flags', 'QQuickItem.Flag', int]) -> 'QQuickItem.Flags': ...
-        def __xor__(self, other: typing.Union['QQuickItem.Flags', 'QQuickItem.Flag', int]) -> 'QQuickItem.Flags': ...
-        def __ror__ (self, other: 'QQuickItem.Flag') -> 'QQuickItem.Flags': ...
-        def __rand__(self, other: 'QQuickItem.Flag') -> 'QQuickItem.Flags': ...
-        def __rxor__(self, other: 'QQuickItem.Flag') -> 'QQuickItem.Flags': ...
+    class Flags(QtCore._QFlags['QQuickItem.Flag']): ...
 
     class ItemChangeData(sip.simplewrapper):
 
@@ -401,28 +380,7 @@ class QQuickPaintedItem(QQuickItem):
     FramebufferObject = ...  # type: QQuickPaintedItem.RenderTarget
     InvertedYFramebufferObject = ...  # type: QQuickPaintedItem.RenderTarget
 
-    class PerformanceHints(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QQuickPaintedItem.PerformanceHints', 'QQuickPaintedItem.PerformanceHint']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QQuickPaintedItem.PerformanceHints') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QQuickPaintedItem.PerformanceHints': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QQuickPaintedItem.PerformanceHints', 'QQuickPaintedItem.PerformanceHint', int]) -> 'QQuickPaintedItem.PerformanceHints': ...
-        def __and__(self, other: typing.Union['QQuickPaintedItem.PerformanceHints', 'QQuickPaintedItem.PerformanceHint', int]) -> 'QQuickPaintedItem.PerformanceHints': ...
-        def __xor__(self, other: typing.Union['QQuickPaintedItem.PerformanceHints', 'QQuickPaintedItem.PerformanceHint', int]) -> 'QQuickPaintedItem.PerformanceHints': ...
-        def __ror__ (self, other: 'QQuickPaintedItem.PerformanceHint') -> 'QQuickPaintedItem.PerformanceHints': ...
-        def __rand__(self, other: 'QQuickPaintedItem.PerformanceHint') -> 'QQuickPaintedItem.PerformanceHints': ...
-        def __rxor__(self, other: 'QQuickPaintedItem.PerformanceHint') -> 'QQuickPaintedItem.PerformanceHints': ...
+    class PerformanceHints(QtCore._QFlags['QQuickPaintedItem.PerformanceHint']): ...
 
     def __init__(self, parent: typing.Optional[QQuickItem] = ...) -> None: ...
 
@@ -533,28 +491,7 @@ class QQuickWindow(QtGui.QWindow):
     TextureCanUseAtlas = ...  # type: QQuickWindow.CreateTextureOption
     TextureIsOpaque = ...  # type: QQuickWindow.CreateTextureOption
 
-    class CreateTextureOptions(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QQuickWindow.CreateTextureOptions', 'QQuickWindow.CreateTextureOption']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QQuickWindow.CreateTextureOptions') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QQuickWindow.CreateTextureOptions': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QQuickWindow.CreateTextureOptions', 'QQuickWindow.CreateTextureOption', int]) -> 'QQuickWindow.CreateTextureOptions': ...
-        def __and__(self, other: typing.Union['QQuickWindow.CreateTextureOptions', 'QQuickWindow.CreateTextureOption', int]) -> 'QQuickWindow.CreateTextureOptions': ...
-        def __xor__(self, other: typing.Union['QQuickWindow.CreateTextureOptions', 'QQuickWindow.CreateTextureOption', int]) -> 'QQuickWindow.CreateTextureOptions': ...
-        def __ror__ (self, other: 'QQuickWindow.CreateTextureOption') -> 'QQuickWindow.CreateTextureOptions': ...
-        def __rand__(self, other: 'QQuickWindow.CreateTextureOption') -> 'QQuickWindow.CreateTextureOptions': ...
-        def __rxor__(self, other: 'QQuickWindow.CreateTextureOption') -> 'QQuickWindow.CreateTextureOptions': ...
+    class CreateTextureOptions(QtCore._QFlags['QQuickWindow.CreateTextureOption']): ...
 
     def __init__(self, parent: typing.Optional[QtGui.QWindow] = ...) -> None: ...
 
@@ -717,51 +654,9 @@ class QSGAbstractRenderer(QtCore.QObject):
     ClearDepthBuffer = ...  # type: QSGAbstractRenderer.ClearModeBit
     ClearStencilBuffer = ...  # type: QSGAbstractRenderer.ClearModeBit
 
-    class ClearMode(sip.simplewrapper):
+    class ClearMode(QtCore._QFlags['QSGAbstractRenderer.ClearModeBit']): ...
 
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QSGAbstractRenderer.ClearMode', 'QSGAbstractRenderer.ClearModeBit']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QSGAbstractRenderer.ClearMode') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QSGAbstractRenderer.ClearMode': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QSGAbstractRenderer.ClearMode', 'QSGAbstractRenderer.ClearModeBit', int]) -> 'QSGAbstractRenderer.ClearMode': ...
-        def __and__(self, other: typing.Union['QSGAbstractRenderer.ClearMode', 'QSGAbstractRenderer.ClearModeBit', int]) -> 'QSGAbstractRenderer.ClearMode': ...
-        def __xor__(self, other: typing.Union['QSGAbstractRenderer.ClearMode', 'QSGAbstractRenderer.ClearModeBit', int]) -> 'QSGAbstractRenderer.ClearMode': ...
-        def __ror__ (self, other: 'QSGAbstractRenderer.ClearModeBit') -> 'QSGAbstractRenderer.ClearMode': ...
-        def __rand__(self, other: 'QSGAbstractRenderer.ClearModeBit') -> 'QSGAbstractRenderer.ClearMode': ...
-        def __rxor__(self, other: 'QSGAbstractRenderer.ClearModeBit') -> 'QSGAbstractRenderer.ClearMode': ...
-
-    class MatrixTransformFlags(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QSGAbstractRenderer.MatrixTransformFlags', 'QSGAbstractRenderer.MatrixTransformFlag']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QSGAbstractRenderer.MatrixTransformFlags') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QSGAbstractRenderer.MatrixTransformFlags': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QSGAbstractRenderer.MatrixTransformFlags', 'QSGAbstractRenderer.MatrixTransformFlag', int]) -> 'QSGAbstractRenderer.MatrixTransformFlags': ...
-        def __and__(self, other: typing.Union['QSGAbstractRenderer.MatrixTransformFlags', 'QSGAbstractRenderer.MatrixTransformFlag', int]) -> 'QSGAbstractRenderer.MatrixTransformFlags': ...
-        def __xor__(self, other: typing.Union['QSGAbstractRenderer.MatrixTransformFlags', 'QSGAbstractRenderer.MatrixTransformFlag', int]) -> 'QSGAbstractRenderer.MatrixTransformFlags': ...
-        def __ror__ (self, other: 'QSGAbstractRenderer.MatrixTransformFlag') -> 'QSGAbstractRenderer.MatrixTransformFlags': ...
-        def __rand__(self, other: 'QSGAbstractRenderer.MatrixTransformFlag') -> 'QSGAbstractRenderer.MatrixTransformFlags': ...
-        def __rxor__(self, other: 'QSGAbstractRenderer.MatrixTransformFlag') -> 'QSGAbstractRenderer.MatrixTransformFlags': ...
+    class MatrixTransformFlags(QtCore._QFlags['QSGAbstractRenderer.MatrixTransformFlag']): ...
 
     sceneGraphChanged: typing.ClassVar[QtCore.pyqtSignal]
     def renderScene(self, fboId: int = ...) -> None: ...
@@ -800,28 +695,7 @@ class QSGEngine(QtCore.QObject):
     TextureCanUseAtlas = ...  # type: QSGEngine.CreateTextureOption
     TextureIsOpaque = ...  # type: QSGEngine.CreateTextureOption
 
-    class CreateTextureOptions(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QSGEngine.CreateTextureOptions', 'QSGEngine.CreateTextureOption']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QSGEngine.CreateTextureOptions') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QSGEngine.CreateTextureOptions': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QSGEngine.CreateTextureOptions', 'QSGEngine.CreateTextureOption', int]) -> 'QSGEngine.CreateTextureOptions': ...
-        def __and__(self, other: typing.Union['QSGEngine.CreateTextureOptions', 'QSGEngine.CreateTextureOption', int]) -> 'QSGEngine.CreateTextureOptions': ...
-        def __xor__(self, other: typing.Union['QSGEngine.CreateTextureOptions', 'QSGEngine.CreateTextureOption', int]) -> 'QSGEngine.CreateTextureOptions': ...
-        def __ror__ (self, other: 'QSGEngine.CreateTextureOption') -> 'QSGEngine.CreateTextureOptions': ...
-        def __rand__(self, other: 'QSGEngine.CreateTextureOption') -> 'QSGEngine.CreateTextureOptions': ...
-        def __rxor__(self, other: 'QSGEngine.CreateTextureOption') -> 'QSGEngine.CreateTextureOptions': ...
+    class CreateTextureOptions(QtCore._QFlags['QSGEngine.CreateTextureOption']): ...
 
     def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
 
@@ -857,28 +731,7 @@ class QSGMaterial(sip.wrapper):
     SupportsRhiShader = ...  # type: QSGMaterial.Flag
     RhiShaderWanted = ...  # type: QSGMaterial.Flag
 
-    class Flags(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QSGMaterial.Flags', 'QSGMaterial.Flag']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QSGMaterial.Flags') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QSGMaterial.Flags': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QSGMaterial.Flags', 'QSGMaterial.Flag', int]) -> 'QSGMaterial.Flags': ...
-        def __and__(self, other: typing.Union['QSGMaterial.Flags', 'QSGMaterial.Flag', int]) -> 'QSGMaterial.Flags': ...
-        def __xor__(self, other: typing.Union['QSGMaterial.Flags', 'QSGMaterial.Flag', int]) -> 'QSGMaterial.Flags': ...
-        def __ror__ (self, other: 'QSGMaterial.Flag') -> 'QSGMaterial.Flags': ...
-        def __rand__(self, other: 'QSGMaterial.Flag') -> 'QSGMaterial.Flags': ...
-        def __rxor__(self, other: 'QSGMaterial.Flag') -> 'QSGMaterial.Flags': ...
+    class Flags(QtCore._QFlags['QSGMaterial.Flag']): ...
 
     def __init__(self) -> None: ...
 
@@ -1141,51 +994,9 @@ class QSGNode(sip.wrapper):
     ClipNodeType = ...  # type: QSGNode.NodeType
     OpacityNodeType = ...  # type: QSGNode.NodeType
 
-    class Flags(sip.simplewrapper):
+    class Flags(QtCore._QFlags['QSGNode.Flag']): ...
 
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QSGNode.Flags', 'QSGNode.Flag']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QSGNode.Flags') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QSGNode.Flags': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QSGNode.Flags', 'QSGNode.Flag', int]) -> 'QSGNode.Flags': ...
-        def __and__(self, other: typing.Union['QSGNode.Flags', 'QSGNode.Flag', int]) -> 'QSGNode.Flags': ...
-        def __xor__(self, other: typing.Union['QSGNode.Flags', 'QSGNode.Flag', int]) -> 'QSGNode.Flags': ...
-        def __ror__ (self, other: 'QSGNode.Flag') -> 'QSGNode.Flags': ...
-        def __rand__(self, other: 'QSGNode.Flag') -> 'QSGNode.Flags': ...
-        def __rxor__(self, other: 'QSGNode.Flag') -> 'QSGNode.Flags': ...
-
-    class DirtyState(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QSGNode.DirtyState', 'QSGNode.DirtyStateBit']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QSGNode.DirtyState') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QSGNode.DirtyState': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QSGNode.DirtyState', 'QSGNode.DirtyStateBit', int]) -> 'QSGNode.DirtyState': ...
-        def __and__(self, other: typing.Union['QSGNode.DirtyState', 'QSGNode.DirtyStateBit', int]) -> 'QSGNode.DirtyState': ...
-        def __xor__(self, other: typing.Union['QSGNode.DirtyState', 'QSGNode.DirtyStateBit', int]) -> 'QSGNode.DirtyState': ...
-        def __ror__ (self, other: 'QSGNode.DirtyStateBit') -> 'QSGNode.DirtyState': ...
-        def __rand__(self, other: 'QSGNode.DirtyStateBit') -> 'QSGNode.DirtyState': ...
-        def __rxor__(self, other: 'QSGNode.DirtyStateBit') -> 'QSGNode.DirtyState': ...
+    class DirtyState(QtCore._QFlags['QSGNode.DirtyStateBit']): ...
 
     def __init__(self) -> None: ...
 
@@ -1242,28 +1053,7 @@ class QSGImageNode(QSGGeometryNode):
     MirrorHorizontally = ...  # type: QSGImageNode.TextureCoordinatesTransformFlag
     MirrorVertically = ...  # type: QSGImageNode.TextureCoordinatesTransformFlag
 
-    class TextureCoordinatesTransformMode(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QSGImageNode.TextureCoordinatesTransformMode', 'QSGImageNode.TextureCoordinatesTransformFlag']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QSGImageNode.TextureCoordinatesTransformMode') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QSGImageNode.TextureCoordinatesTransformMode': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QSGImageNode.TextureCoordinatesTransformMode', 'QSGImageNode.TextureCoordinatesTransformFlag', int]) -> 'QSGImageNode.TextureCoordinatesTransformMode': ...
-        def __and__(self, other: typing.Union['QSGImageNode.TextureCoordinatesTransformMode', 'QSGImageNode.TextureCoordinatesTransformFlag', int]) -> 'QSGImageNode.TextureCoordinatesTransformMode': ...
-        def __xor__(self, other: typing.Union['QSGImageNode.TextureCoordinatesTransformMode', 'QSGImageNode.TextureCoordinatesTransformFlag', int]) -> 'QSGImageNode.TextureCoordinatesTransformMode': ...
-        def __ror__ (self, other: 'QSGImageNode.TextureCoordinatesTransformFlag') -> 'QSGImageNode.TextureCoordinatesTransformMode': ...
-        def __rand__(self, other: 'QSGImageNode.TextureCoordinatesTransformFlag') -> 'QSGImageNode.TextureCoordinatesTransformMode': ...
-        def __rxor__(self, other: 'QSGImageNode.TextureCoordinatesTransformFlag') -> 'QSGImageNode.TextureCoordinatesTransformMode': ...
+    class TextureCoordinatesTransformMode(QtCore._QFlags['QSGImageNode.TextureCoordinatesTransformFlag']): ...
 
     @staticmethod
     def rebuildGeometry(g: QSGGeometry, texture: 'QSGTexture', rect: QtCore.QRectF, sourceRect: QtCore.QRectF, texCoordMode: typing.Union['QSGImageNode.TextureCoordinatesTransformMode', 'QSGImageNode.TextureCoordinatesTransformFlag']) -> None: ...
@@ -1457,56 +1247,14 @@ class QSGMaterialRhiShader(QSGMaterialShader):
         Src1Alpha = ...  # type: QSGMaterialRhiShader.GraphicsPipelineState.BlendFactor
         OneMinusSrc1Alpha = ...  # type: QSGMaterialRhiShader.GraphicsPipelineState.BlendFactor
 
-        class ColorMask(sip.simplewrapper):
-
-            @typing.overload
-            def __init__(self) -> None: ...
-            @typing.overload
-            def __init__(self, f: typing.Union['QSGMaterialRhiShader.GraphicsPipelineState.ColorMask', 'QSGMaterialRhiShader.GraphicsPipelineState.ColorMaskComponent']) -> None: ...
-            @typing.overload
-            def __init__(self, a0: 'QSGMaterialRhiShader.GraphicsPipelineState.ColorMask') -> None: ...
-            @typing.overload
-            def __init__(self, f: int) -> None: ...
-
-            def __hash__(self) -> int: ...
-            def __bool__(self) -> int: ...
-            def __invert__(self) -> 'QSGMaterialRhiShader.GraphicsPipelineState.ColorMask': ...
-            def __index__(self) -> int: ...
-            def __int__(self) -> int: ...
-            def __or__ (self, other: typing.Union['QSGMaterialRhiShader.GraphicsPipelineState.ColorMask', 'QSGMaterialRhiShader.GraphicsPipelineState.ColorMaskComponent', int]) -> 'QSGMaterialRhiShader.GraphicsPipelineState.ColorMask': ...
-            def __and__(self, other: typing.Union['QSGMaterialRhiShader.GraphicsPipelineState.ColorMask', 'QSGMaterialRhiShader.GraphicsPipelineState.ColorMaskComponent', int]) -> 'QSGMaterialRhiShader.GraphicsPipelineState.ColorMask': ...
-            def __xor__(self, other: typing.Union['QSGMaterialRhiShader.GraphicsPipelineState.ColorMask', 'QSGMaterialRhiShader.GraphicsPipelineState.ColorMaskComponent', int]) -> 'QSGMaterialRhiShader.GraphicsPipelineState.ColorMask': ...
-            def __ror__ (self, other: 'QSGMaterialRhiShader.GraphicsPipelineState.ColorMaskComponent') -> 'QSGMaterialRhiShader.GraphicsPipelineState.ColorMask': ...
-            def __rand__(self, other: 'QSGMaterialRhiShader.GraphicsPipelineState.ColorMaskComponent') -> 'QSGMaterialRhiShader.GraphicsPipelineState.ColorMask': ...
-            def __rxor__(self, other: 'QSGMaterialRhiShader.GraphicsPipelineState.ColorMaskComponent') -> 'QSGMaterialRhiShader.GraphicsPipelineState.ColorMask': ...
+        class ColorMask(QtCore._QFlags['QSGMaterialRhiShader.GraphicsPipelineState.ColorMaskComponent']): ...
 
         @typing.overload
         def __init__(self) -> None: ...
         @typing.overload
         def __init__(self, a0: 'QSGMaterialRhiShader.GraphicsPipelineState') -> None: ...
 
-    class Flags(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QSGMaterialRhiShader.Flags', 'QSGMaterialRhiShader.Flag']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QSGMaterialRhiShader.Flags') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QSGMaterialRhiShader.Flags': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QSGMaterialRhiShader.Flags', 'QSGMaterialRhiShader.Flag', int]) -> 'QSGMaterialRhiShader.Flags': ...
-        def __and__(self, other: typing.Union['QSGMaterialRhiShader.Flags', 'QSGMaterialRhiShader.Flag', int]) -> 'QSGMaterialRhiShader.Flags': ...
-        def __xor__(self, other: typing.Union['QSGMaterialRhiShader.Flags', 'QSGMaterialRhiShader.Flag', int]) -> 'QSGMaterialRhiShader.Flags': ...
-        def __ror__ (self, other: 'QSGMaterialRhiShader.Flag') -> 'QSGMaterialRhiShader.Flags': ...
-        def __rand__(self, other: 'QSGMaterialRhiShader.Flag') -> 'QSGMaterialRhiShader.Flags': ...
-        def __rxor__(self, other: 'QSGMaterialRhiShader.Flag') -> 'QSGMaterialRhiShader.Flags': ...
+    class Flags(QtCore._QFlags['QSGMaterialRhiShader.Flag']): ...
 
     def __init__(self) -> None: ...
 
@@ -1637,51 +1385,9 @@ class QSGRendererInterface(sip.simplewrapper):
     MetalRhi = ...  # type: QSGRendererInterface.GraphicsApi
     NullRhi = ...  # type: QSGRendererInterface.GraphicsApi
 
-    class ShaderCompilationTypes(sip.simplewrapper):
+    class ShaderCompilationTypes(QtCore._QFlags['QSGRendererInterface.ShaderCompilationType']): ...
 
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QSGRendererInterface.ShaderCompilationTypes', 'QSGRendererInterface.ShaderCompilationType']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QSGRendererInterface.ShaderCompilationTypes') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QSGRendererInterface.ShaderCompilationTypes': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QSGRendererInterface.ShaderCompilationTypes', 'QSGRendererInterface.ShaderCompilationType', int]) -> 'QSGRendererInterface.ShaderCompilationTypes': ...
-        def __and__(self, other: typing.Union['QSGRendererInterface.ShaderCompilationTypes', 'QSGRendererInterface.ShaderCompilationType', int]) -> 'QSGRendererInterface.ShaderCompilationTypes': ...
-        def __xor__(self, other: typing.Union['QSGRendererInterface.ShaderCompilationTypes', 'QSGRendererInterface.ShaderCompilationType', int]) -> 'QSGRendererInterface.ShaderCompilationTypes': ...
-        def __ror__ (self, other: 'QSGRendererInterface.ShaderCompilationType') -> 'QSGRendererInterface.ShaderCompilationTypes': ...
-        def __rand__(self, other: 'QSGRendererInterface.ShaderCompilationType') -> 'QSGRendererInterface.ShaderCompilationTypes': ...
-        def __rxor__(self, other: 'QSGRendererInterface.ShaderCompilationType') -> 'QSGRendererInterface.ShaderCompilationTypes': ...
-
-    class ShaderSourceTypes(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QSGRendererInterface.ShaderSourceTypes', 'QSGRendererInterface.ShaderSourceType']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QSGRendererInterface.ShaderSourceTypes') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QSGRendererInterface.ShaderSourceTypes': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QSGRendererInterface.ShaderSourceTypes', 'QSGRendererInterface.ShaderSourceType', int]) -> 'QSGRendererInterface.ShaderSourceTypes': ...
-        def __and__(self, other: typing.Union['QSGRendererInterface.ShaderSourceTypes', 'QSGRendererInterface.ShaderSourceType', int]) -> 'QSGRendererInterface.ShaderSourceTypes': ...
-        def __xor__(self, other: typing.Union['QSGRendererInterface.ShaderSourceTypes', 'QSGRendererInterface.ShaderSourceType', int]) -> 'QSGRendererInterface.ShaderSourceTypes': ...
-        def __ror__ (self, other: 'QSGRendererInterface.ShaderSourceType') -> 'QSGRendererInterface.ShaderSourceTypes': ...
-        def __rand__(self, other: 'QSGRendererInterface.ShaderSourceType') -> 'QSGRendererInterface.ShaderSourceTypes': ...
-        def __rxor__(self, other: 'QSGRendererInterface.ShaderSourceType') -> 'QSGRendererInterface.ShaderSourceTypes': ...
+    class ShaderSourceTypes(QtCore._QFlags['QSGRendererInterface.ShaderSourceType']): ...
 
     @staticmethod
     def isApiRhiBased(api: 'QSGRendererInterface.GraphicsApi') -> bool: ...
@@ -1731,51 +1437,9 @@ class QSGRenderNode(QSGNode):
     ViewportState = ...  # type: QSGRenderNode.StateFlag
     RenderTargetState = ...  # type: QSGRenderNode.StateFlag
 
-    class StateFlags(sip.simplewrapper):
+    class StateFlags(QtCore._QFlags['QSGRenderNode.StateFlag']): ...
 
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QSGRenderNode.StateFlags', 'QSGRenderNode.StateFlag']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QSGRenderNode.StateFlags') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QSGRenderNode.StateFlags': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QSGRenderNode.StateFlags', 'QSGRenderNode.StateFlag', int]) -> 'QSGRenderNode.StateFlags': ...
-        def __and__(self, other: typing.Union['QSGRenderNode.StateFlags', 'QSGRenderNode.StateFlag', int]) -> 'QSGRenderNode.StateFlags': ...
-        def __xor__(self, other: typing.Union['QSGRenderNode.StateFlags', 'QSGRenderNode.StateFlag', int]) -> 'QSGRenderNode.StateFlags': ...
-        def __ror__ (self, other: 'QSGRenderNode.StateFlag') -> 'QSGRenderNode.StateFlags': ...
-        def __rand__(self, other: 'QSGRenderNode.StateFlag') -> 'QSGRenderNode.StateFlags': ...
-        def __rxor__(self, other: 'QSGRenderNode.StateFlag') -> 'QSGRenderNode.StateFlags': ...
-
-    class RenderingFlags(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QSGRenderNode.RenderingFlags', 'QSGRenderNode.RenderingFlag']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QSGRenderNode.RenderingFlags') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QSGRenderNode.RenderingFlags': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QSGRenderNode.RenderingFlags', 'QSGRenderNode.RenderingFlag', int]) -> 'QSGRenderNode.RenderingFlags': ...
-        def __and__(self, other: typing.Union['QSGRenderNode.RenderingFlags', 'QSGRenderNode.RenderingFlag', int]) -> 'QSGRenderNode.RenderingFlags': ...
-        def __xor__(self, other: typing.Union['QSGRenderNode.RenderingFlags', 'QSGRenderNode.RenderingFlag', int]) -> 'QSGRenderNode.RenderingFlags': ...
-        def __ror__ (self, other: 'QSGRenderNode.RenderingFlag') -> 'QSGRenderNode.RenderingFlags': ...
-        def __rand__(self, other: 'QSGRenderNode.RenderingFlag') -> 'QSGRenderNode.RenderingFlags': ...
-        def __rxor__(self, other: 'QSGRenderNode.RenderingFlag') -> 'QSGRenderNode.RenderingFlags': ...
+    class RenderingFlags(QtCore._QFlags['QSGRenderNode.RenderingFlag']): ...
 
     class RenderState(sip.simplewrapper):
 
@@ -1829,28 +1493,7 @@ class QSGSimpleTextureNode(QSGGeometryNode):
     MirrorHorizontally = ...  # type: QSGSimpleTextureNode.TextureCoordinatesTransformFlag
     MirrorVertically = ...  # type: QSGSimpleTextureNode.TextureCoordinatesTransformFlag
 
-    class TextureCoordinatesTransformMode(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QSGSimpleTextureNode.TextureCoordinatesTransformMode', 'QSGSimpleTextureNode.TextureCoordinatesTransformFlag']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QSGSimpleTextureNode.TextureCoordinatesTransformMode') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QSGSimpleTextureNode.TextureCoordinatesTransformMode': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QSGSimpleTextureNode.TextureCoordinatesTransformMode', 'QSGSimpleTextureNode.TextureCoordinatesTransformFlag', int]) -> 'QSGSimpleTextureNode.TextureCoordinatesTransformMode': ...
-        def __and__(self, other: typing.Union['QSGSimpleTextureNode.TextureCoordinatesTransformMode', 'QSGSimpleTextureNode.TextureCoordinatesTransformFlag', int]) -> 'QSGSimpleTextureNode.TextureCoordinatesTransformMode': ...
-        def __xor__(self, other: typing.Union['QSGSimpleTextureNode.TextureCoordinatesTransformMode', 'QSGSimpleTextureNode.TextureCoordinatesTransformFlag', int]) -> 'QSGSimpleTextureNode.TextureCoordinatesTransformMode': ...
-        def __ror__ (self, other: 'QSGSimpleTextureNode.TextureCoordinatesTransformFlag') -> 'QSGSimpleTextureNode.TextureCoordinatesTransformMode': ...
-        def __rand__(self, other: 'QSGSimpleTextureNode.TextureCoordinatesTransformFlag') -> 'QSGSimpleTextureNode.TextureCoordinatesTransformMode': ...
-        def __rxor__(self, other: 'QSGSimpleTextureNode.TextureCoordinatesTransformFlag') -> 'QSGSimpleTextureNode.TextureCoordinatesTransformMode': ...
+    class TextureCoordinatesTransformMode(QtCore._QFlags['QSGSimpleTextureNode.TextureCoordinatesTransformFlag']): ...
 
     def __init__(self) -> None: ...
 
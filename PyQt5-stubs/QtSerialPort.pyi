@@ -189,51 +189,9 @@ class QSerialPort(QtCore.QIODevice):
     Output = ...  # type: QSerialPort.Direction
     AllDirections = ...  # type: QSerialPort.Direction
 
-    class Directions(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QSerialPort.Directions', 'QSerialPort.Direction']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QSerialPort.Directions') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QSerialPort.Directions': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QSerialPort.Directions', 'QSerialPort.Direction', int]) -> 'QSerialPort.Directions': ...
-        def __and__(self, other: typing.Union['QSerialPort.Directions', 'QSerialPort.Direction', int]) -> 'QSerialPort.Directions': ...
-        def __xor__(self, other: typing.Union['QSerialPort.Directions', 'QSerialPort.Direction', int]) -> 'QSerialPort.Directions': ...
-        def __ror__ (self, other: 'QSerialPort.Direction') -> 'QSerialPort.Directions': ...
-        def __rand__(self, other: 'QSerialPort.Direction') -> 'QSerialPort.Directions': ...
-        def __rxor__(self, other: 'QSerialPort.Direction') -> 'QSerialPort.Directions': ...
-
-    class PinoutSignals(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QSerialPort.PinoutSignals', 'QSerialPort.PinoutSignal']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QSerialPort.PinoutSignals') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QSerialPort.PinoutSignals': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QSerialPort.PinoutSignals', 'QSerialPort.PinoutSignal', int]) -> 'QSerialPort.PinoutSignals': ...
-        def __and__(self, other: typing.Union['QSerialPort.PinoutSignals', 'QSerialPort.PinoutSignal', int]) -> 'QSerialPort.PinoutSignals': ...
-        def __xor__(self, other: typing.Union['QSerialPort.PinoutSignals', 'QSerialPort.PinoutSignal', int]) -> 'QSerialPort.PinoutSignals': ...
-        def __ror__ (self, other: 'QSerialPort.PinoutSignal') -> 'QSerialPort.PinoutSignals': ...
-        def __rand__(self, other: 'QSerialPort.PinoutSignal') -> 'QSerialPort.PinoutSignals': ...
-        def __rxor__(self, other: 'QSerialPort.PinoutSignal') -> 'QSerialPort.PinoutSignals': ...
+    class Directions(QtCore._QFlags['QSerialPort.Direction']): ...
+
+    class PinoutSignals(QtCore._QFlags['QSerialPort.PinoutSignal']): ...
 
     @typing.overload
     def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
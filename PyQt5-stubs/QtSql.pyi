@@ -732,25 +732,4 @@ class QSql(sip.simplewrapper):
     BeforeFirstRow = ...  # type: QSql.Location
     AfterLastRow = ...  # type: QSql.Location
 
-    class ParamType(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QSql.ParamType', 'QSql.ParamTypeFlag']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QSql.ParamType') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QSql.ParamType': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QSql.ParamType', 'QSql.ParamTypeFlag', int]) -> 'QSql.ParamType': ...
-        def __and__(self, other: typing.Union['QSql.ParamType', 'QSql.ParamTypeFlag', int]) -> 'QSql.ParamType': ...
-        def __xor__(self, other: typing.Union['QSql.ParamType', 'QSql.ParamTypeFlag', int]) -> 'QSql.ParamType': ...
-        def __ror__ (self, other: 'QSql.ParamTypeFlag') -> 'QSql.ParamType': ...
-        def __rand__(self, other: 'QSql.ParamTypeFlag') -> 'QSql.ParamType': ...
-        def __rxor__(self, other: 'QSql.ParamTypeFlag') -> 'QSql.ParamType': ...
+    class ParamType(QtCore._QFlags['QSql.ParamTypeFlag']): ...
@@ -303,28 +303,7 @@ class QWebEngineUrlScheme(sip.simplewrapper):
     Host = ...  # type: QWebEngineUrlScheme.Syntax
     Path = ...  # type: QWebEngineUrlScheme.Syntax
 
-    class Flags(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QWebEngineUrlScheme.Flags', 'QWebEngineUrlScheme.Flag']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QWebEngineUrlScheme.Flags') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QWebEngineUrlScheme.Flags': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QWebEngineUrlScheme.Flags', 'QWebEngineUrlScheme.Flag', int]) -> 'QWebEngineUrlScheme.Flags': ...
-        def __and__(self, other: typing.Union['QWebEngineUrlScheme.Flags', 'QWebEngineUrlScheme.Flag', int]) -> 'QWebEngineUrlScheme.Flags': ...
-        def __xor__(self, other: typing.Union['QWebEngineUrlScheme.Flags', 'QWebEngineUrlScheme.Flag', int]) -> 'QWebEngineUrlScheme.Flags': ...
-        def __ror__ (self, other: 'QWebEngineUrlScheme.Flag') -> 'QWebEngineUrlScheme.Flags': ...
-        def __rand__(self, other: 'QWebEngineUrlScheme.Flag') -> 'QWebEngineUrlScheme.Flags': ...
-        def __rxor__(self, other: 'QWebEngineUrlScheme.Flag') -> 'QWebEngineUrlScheme.Flags': ...
+    class Flags(QtCore._QFlags['QWebEngineUrlScheme.Flag']): ...
 
     @typing.overload
     def __init__(self) -> None: ...
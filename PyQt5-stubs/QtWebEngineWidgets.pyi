@@ -175,51 +175,9 @@ class QWebEngineContextMenuData(sip.simplewrapper):
     MediaTypeFile = ...  # type: QWebEngineContextMenuData.MediaType
     MediaTypePlugin = ...  # type: QWebEngineContextMenuData.MediaType
 
-    class MediaFlags(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QWebEngineContextMenuData.MediaFlags', 'QWebEngineContextMenuData.MediaFlag']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QWebEngineContextMenuData.MediaFlags') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QWebEngineContextMenuData.MediaFlags': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QWebEngineContextMenuData.MediaFlags', 'QWebEngineContextMenuData.MediaFlag', int]) -> 'QWebEngineContextMenuData.MediaFlags': ...
-        def __and__(self, other: typing.Union['QWebEngineContextMenuData.MediaFlags', 'QWebEngineContextMenuData.MediaFlag', int]) -> 'QWebEngineContextMenuData.MediaFlags': ...
-        def __xor__(self, other: typing.Union['QWebEngineContextMenuData.MediaFlags', 'QWebEngineContextMenuData.MediaFlag', int]) -> 'QWebEngineContextMenuData.MediaFlags': ...
-        def __ror__ (self, other: 'QWebEngineContextMenuData.MediaFlag') -> 'QWebEngineContextMenuData.MediaFlags': ...
-        def __rand__(self, other: 'QWebEngineContextMenuData.MediaFlag') -> 'QWebEngineContextMenuData.MediaFlags': ...
-        def __rxor__(self, other: 'QWebEngineContextMenuData.MediaFlag') -> 'QWebEngineContextMenuData.MediaFlags': ...
-
-    class EditFlags(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QWebEngineContextMenuData.EditFlags', 'QWebEngineContextMenuData.EditFlag']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QWebEngineContextMenuData.EditFlags') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QWebEngineContextMenuData.EditFlags': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QWebEngineContextMenuData.EditFlags', 'QWebEngineContextMenuData.EditFlag', int]) -> 'QWebEngineContextMenuData.EditFlags': ...
-        def __and__(self, other: typing.Union['QWebEngineContextMenuData.EditFlags', 'QWebEngineContextMenuData.EditFlag', int]) -> 'QWebEngineContextMenuData.EditFlags': ...
-        def __xor__(self, other: typing.Union['QWebEngineContextMenuData.EditFlags', 'QWebEngineContextMenuData.EditFlag', int]) -> 'QWebEngineContextMenuData.EditFlags': ...
-        def __ror__ (self, other: 'QWebEngineContextMenuData.EditFlag') -> 'QWebEngineContextMenuData.EditFlags': ...
-        def __rand__(self, other: 'QWebEngineContextMenuData.EditFlag') -> 'QWebEngineContextMenuData.EditFlags': ...
-        def __rxor__(self, other: 'QWebEngineContextMenuData.EditFlag') -> 'QWebEngineContextMenuData.EditFlags': ...
+    class MediaFlags(QtCore._QFlags['QWebEngineContextMenuData.MediaFlag']): ...
+
+    class EditFlags(QtCore._QFlags['QWebEngineContextMenuData.EditFlag']): ...
 
     @typing.overload
     def __init__(self) -> None: ...
@@ -600,28 +558,7 @@ class QWebEnginePage(QtCore.QObject):
     InsertOrderedList = ...  # type: QWebEnginePage.WebAction
     InsertUnorderedList = ...  # type: QWebEnginePage.WebAction
 
-    class FindFlags(sip.simplewrapper):
-
-        @typing.overload
-        def __init__(self) -> None: ...
-        @typing.overload
-        def __init__(self, f: typing.Union['QWebEnginePage.FindFlags', 'QWebEnginePage.FindFlag']) -> None: ...
-        @typing.overload
-        def __init__(self, a0: 'QWebEnginePage.FindFlags') -> None: ...
-        @typing.overload
-        def __init__(self, f: int) -> None: ...
-
-        def __hash__(self) -> int: ...
-        def __bool__(self) -> int: ...
-        def __invert__(self) -> 'QWebEnginePage.FindFlags': ...
-        def __index__(self) -> int: ...
-        def __int__(self) -> int: ...
-        def __or__ (self, other: typing.Union['QWebEnginePage.FindFlags', 'QWebEnginePage.FindFlag', int]) -> 'QWebEnginePage.FindFlags': ...
-        def __and__(self, other: typing.Union['QWebEnginePage.FindFlags', 'QWebEnginePage.FindFlag', int]) -> 'QWebEnginePage.FindFlags': ...
-        def __xor__(self, other: typing.Union['QWebEnginePage.FindFlags', 'QWebEnginePage.FindFlag', int]) -> 'QWebEnginePage.FindFlags': ...
-        def __ror__ (self, other: 'QWebEnginePage.FindFlag') -> 'QWebEnginePage.FindFlags': ...
-        def __rand__(self, other: 'QWebEnginePage.FindFlag') -> 'QWebEnginePage.FindFlags': ...
-        def __rxor__(self, other: 'QWebEnginePage.FindFlag') -> 'QWebEnginePage.FindFlags': ...
+    class FindFlags(QtCore._QFlags['QWebEnginePage.FindFlag']): ...
 
     @typing.overload
     def __init__(self, parent: typing.Optional[QtCore.QObject] = ...) -> None: ...
@@ -0,0 +1,239 @@
+"""Measure the cost of the stubs for the type checkers.
+
+Every case file of benchmarks/cases is checked by mypy, with a cold and a
+warm cache, and by pyright when it is installed. The wall time, the peak
+RSS of the type checker and the size of the mypy cache are written as JSON,
+which can be compared to the results of another commit.
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+import typing
+
+BENCHMARKS_DIR = Path(__file__).parent
+CASES_DIR = BENCHMARKS_DIR / "cases"
+DEFAULT_RESULTS_DIR = BENCHMARKS_DIR / "results"
+DEFAULT_THRESHOLD = 0.10
+
+# metrics compared between two results, the other ones are informative
+COMPARED_METRICS = ["wall_time", "peak_rss_kb"]
+
+Measure = typing.Dict[str, typing.Optional[float]]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    # noinspection PyTypeChecker
+    parser.add_argument('-o', '--output', type=Path,
+                        help="JSON file receiving the results. Defaults to "
+                             "benchmarks/results/<commit>.json")
+    # noinspection PyTypeChecker
+    parser.add_argument('-r', '--repeat', type=int, default=3,
+                        help="Number of runs of each benchmark, the median is "
+                             "kept")
+    # noinspection PyTypeChecker
+    parser.add_argument('--checkers', type=lambda value: value.split(","),
+                        default=["mypy", "pyright"],
+                        help="Comma separated list of type checkers")
+    # noinspection PyTypeChecker
+    parser.add_argument('--cases', type=lambda value: value.split(","),
+                        help="Comma separated list of cases, ie "
+                             "qtcore,app. Defaults to all")
+    # noinspection PyTypeChecker
+    parser.add_argument('--baseline', type=Path,
+                        help="Results of a previous commit to compare with")
+    # noinspection PyTypeChecker
+    parser.add_argument('--compare', nargs=2, type=Path,
+                        metavar=("BASELINE", "RESULTS"),
+                        help="Only compare two existing results")
+    # noinspection PyTypeChecker
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="Relative increase reported as a regression. "
+                             f"Defaults to {DEFAULT_THRESHOLD}")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+
+    if args.compare:
+        baseline, results = (json.loads(path.read_text(encoding="utf-8"))
+                             for path in args.compare)
+        sys.exit(1 if compare(baseline, results, args.threshold) else 0)
+
+    cases = sorted(path.stem for path in CASES_DIR.glob("*.py"))
+    if args.cases:
+        unknown_cases = set(args.cases) - set(cases)
+        if unknown_cases:
+            raise SystemExit(f"Unknown cases: {', '.join(sorted(unknown_cases))}")
+        cases = [case for case in cases if case in args.cases]
+
+    results = run_benchmarks(args.checkers, cases, args.repeat)
+    output = args.output or DEFAULT_RESULTS_DIR / f"{results['commit'][:12]}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=4, sort_keys=True) + "\n",
+                      encoding="utf-8")
+    print(f"Results written to {output}")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        sys.exit(1 if compare(baseline, results, args.threshold) else 0)
+
+
+def run_benchmarks(checkers: typing.List[str], cases: typing.List[str],
+                   repeat: int) -> typing.Dict[str, typing.Any]:
+    """Run every benchmark and return the results with their context."""
+    benchmarks: typing.Dict[str, Measure] = {}
+    versions: typing.Dict[str, str] = {}
+
+    if "mypy" in checkers:
+        versions["mypy"] = run_command(
+            [sys.executable, "-m", "mypy", "--version"]).strip()
+        for case in cases:
+            cold, warm = bench_mypy(CASES_DIR / f"{case}.py", repeat)
+            benchmarks[f"mypy-cold/{case}"] = cold
+            benchmarks[f"mypy-warm/{case}"] = warm
+            print_measure(f"mypy-cold/{case}", cold)
+            print_measure(f"mypy-warm/{case}", warm)
+
+    if "pyright" in checkers:
+        pyright = shutil.which("pyright")
+        if pyright is None:
+            print("Warning! pyright is not installed, skipping it")
+        else:
+            versions["pyright"] = run_command([pyright, "--version"]).strip()
+            for case in cases:
+                measure = bench_pyright(pyright, CASES_DIR / f"{case}.py", repeat)
+                benchmarks[f"pyright/{case}"] = measure
+                print_measure(f"pyright/{case}", measure)
+
+    return {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "versions": versions,
+        "benchmarks": benchmarks,
+    }
+
+
+def bench_mypy(case: Path, repeat: int) -> typing.Tuple[Measure, Measure]:
+    """Check the case with an empty mypy cache, then with the cache of the
+    first run."""
+    cold_runs, warm_runs = [], []
+    for _ in range(repeat):
+        with tempfile.TemporaryDirectory(prefix="pyqt5-stubs-bench-") as cache_dir:
+            command = [sys.executable, "-m", "mypy", "--incremental",
+                       "--cache-dir", cache_dir, os.fspath(case)]
+            cold_runs.append(measure_command(command))
+            cold_runs[-1]["cache_size_kb"] = directory_size(Path(cache_dir)) / 1024
+            warm_runs.append(measure_command(command))
+    return median_measure(cold_runs), median_measure(warm_runs)
+
+
+def bench_pyright(pyright: str, case: Path, repeat: int) -> Measure:
+    """pyright does not keep any cache between two runs."""
+    return median_measure([measure_command([pyright, os.fspath(case)])
+                           for _ in range(repeat)])
+
+
+def measure_command(command: typing.List[str]) -> Measure:
+    """Run the type checker and measure its wall time and peak RSS.
+
+    The run is made from the benchmarks directory, so that the configuration
+    of the project does not apply. The peak RSS is only available on Unix.
+    """
+    with tempfile.TemporaryFile() as output:
+        start = time.perf_counter()
+        process = subprocess.Popen(command, cwd=BENCHMARKS_DIR,
+                                   stdout=output, stderr=subprocess.STDOUT)
+        peak_rss_kb: typing.Optional[float] = None
+        if hasattr(os, "wait4"):
+            _, status, rusage = os.wait4(process.pid, 0)
+            process.returncode = (os.WEXITSTATUS(status) if os.WIFEXITED(status)
+                                  else -os.WTERMSIG(status))
+            # kilobytes on Linux, bytes on macOS
+            peak_rss_kb = rusage.ru_maxrss
+            if sys.platform == "darwin":
+                peak_rss_kb /= 1024
+        else:
+            process.wait()
+        wall_time = time.perf_counter() - start
+
+        if process.returncode not in (0, 1):
+            # 1 is the type checker reporting errors, which is still measured
+            output.seek(0)
+            raise RuntimeError(f"{' '.join(command)} failed:\n"
+                               f"{output.read().decode('utf-8', 'replace')}")
+
+    return {"wall_time": wall_time, "peak_rss_kb": peak_rss_kb}
+
+
+def median_measure(measures: typing.List[Measure]) -> Measure:
+    median: Measure = {}
+    for metric in measures[0]:
+        values = [measure[metric] for measure in measures]
+        median[metric] = (None if None in values
+                          else statistics.median(typing.cast(typing.List[float], values)))
+    return median
+
+
+def directory_size(path: Path) -> int:
+    return sum(file.stat().st_size for file in path.rglob("*") if file.is_file())
+
+
+def run_command(command: typing.List[str]) -> str:
+    return subprocess.run(command, check=True, stdout=subprocess.PIPE,
+                          universal_newlines=True).stdout
+
+
+def git_commit() -> str:
+    try:
+        return run_command(["git", "-C", os.fspath(BENCHMARKS_DIR),
+                            "rev-parse", "HEAD"]).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def print_measure(name: str, measure: Measure) -> None:
+    print(f"{name:<24} " + "  ".join(
+        f"{metric}={value:.2f}" if value is not None else f"{metric}=n/a"
+        for metric, value in measure.items()))
+
+
+def compare(baseline: typing.Dict[str, typing.Any],
+            results: typing.Dict[str, typing.Any], threshold: float) -> bool:
+    """Print the evolution of every benchmark.
+
+    Return True if a metric increased by more than the threshold.
+    """
+    print(f"Comparing {results['commit'][:12]} to {baseline['commit'][:12]}")
+    regression = False
+    for name, measure in sorted(results["benchmarks"].items()):
+        baseline_measure = baseline["benchmarks"].get(name)
+        if baseline_measure is None:
+            print(f"{name:<24} new benchmark")
+            continue
+        for metric in COMPARED_METRICS:
+            old, new = baseline_measure.get(metric), measure.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            status = ""
+            if change > threshold:
+                status = "  REGRESSION"
+                regression = True
+            print(f"{name:<24} {metric:<12} {old:10.2f} -> {new:10.2f} "
+                  f"({change:+.1%}){status}")
+    return regression
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Representative application: a main window with a model/view, signals,
+flags and a few widgets."""
+import sys
+from typing import List, Optional
+
+from PyQt5.QtCore import (QAbstractListModel, QModelIndex, QObject, Qt,
+                          QTimer, QVariant, pyqtSignal, pyqtSlot)
+from PyQt5.QtGui import QColor, QFont, QIcon, QKeySequence, QPainter
+from PyQt5.QtWidgets import (QAction, QApplication, QDialog,
+                             QDialogButtonBox, QHBoxLayout, QLabel,
+                             QLineEdit, QListView, QMainWindow, QMessageBox,
+                             QPushButton, QVBoxLayout, QWidget)
+
+
+class TaskModel(QAbstractListModel):
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self.tasks: List[str] = []
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return len(self.tasks)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> QVariant:
+        if not index.isValid():
+            return QVariant()
+        if role == Qt.DisplayRole:
+            return QVariant(self.tasks[index.row()])
+        if role == Qt.ForegroundRole:
+            return QVariant(QColor(Qt.darkBlue))
+        return QVariant()
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def add_task(self, task: str) -> None:
+        row = len(self.tasks)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.tasks.append(task)
+        self.endInsertRows()
+
+
+class TaskDialog(QDialog):
+
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self.edit = QLineEdit(self)
+        buttons = QDialogButtonBox(
+            QDialogButtonBox.Ok | QDialogButtonBox.Cancel, parent=self)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        layout = QVBoxLayout(self)
+        layout.addWidget(QLabel("Task:", self))
+        layout.addWidget(self.edit)
+        layout.addWidget(buttons)
+
+
+class MainWindow(QMainWindow):
+
+    taskAdded = pyqtSignal(str)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.model = TaskModel(self)
+        self.view = QListView(self)
+        self.view.setModel(self.model)
+        self.view.setFont(QFont("Sans", 10, QFont.Bold))
+
+        add_button = QPushButton(QIcon(), "Add", self)
+        add_button.clicked.connect(self.on_add)
+
+        central = QWidget(self)
+        layout = QHBoxLayout(central)
+        layout.addWidget(self.view)
+        layout.addWidget(add_button, alignment=Qt.AlignTop | Qt.AlignRight)
+        self.setCentralWidget(central)
+
+        action = QAction("&Quit", self)
+        action.setShortcut(QKeySequence(Qt.CTRL + Qt.Key_Q))
+        action.triggered.connect(self.close)
+        self.menuBar().addMenu("&File").addAction(action)
+
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.on_timeout)
+        self.timer.start(1000)
+
+    @pyqtSlot()
+    def on_add(self) -> None:
+        dialog = TaskDialog(self)
+        if dialog.exec_() == QDialog.Accepted:
+            self.model.add_task(dialog.edit.text())
+            self.taskAdded.emit(dialog.edit.text())
+
+    def on_timeout(self) -> None:
+        self.statusBar().showMessage(f"{self.model.rowCount()} tasks")
+
+    def paintEvent(self, event: object) -> None:
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.end()
+
+    def closeEvent(self, event: object) -> None:
+        answer = QMessageBox.question(
+            self, "Quit", "Really quit?", QMessageBox.Yes | QMessageBox.No)
+        if answer != QMessageBox.Yes:
+            return
+
+
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+    window = MainWindow()
+    window.show()
+    sys.exit(app.exec_())
@@ -0,0 +1 @@
+from PyQt5 import QtGui
@@ -0,0 +1,214 @@
+"""Profile the cost of each stub module for mypy.
+
+Every stub module is checked by mypy in isolation (a program importing only
+this module, with its dependencies) and all together in the full graph. For
+each module, the time spent by mypy in parsing, semantic analysis and type
+checking is reported with the number of symbols, the number of overloads
+and the number of stub modules importing it (fan-in).
+
+The phases are timed by instrumenting mypy, which is only possible with a
+mypy which is not compiled with mypyc:
+
+    pip install --no-binary mypy mypy
+"""
+import argparse
+import ast
+import contextlib
+import functools
+import json
+import time
+from pathlib import Path
+import typing
+
+import mypy.build
+import mypy.semanal_main
+from mypy.errors import CompileError
+from mypy.modulefinder import BuildSource
+from mypy.options import Options
+
+STUBS_DIR = Path(__file__).parent.parent / "PyQt5-stubs"
+
+PHASES = ["parse", "semanal", "check"]
+
+# columns of the table, the timings are in seconds
+COLUMNS = ["isolated_total", "isolated_own", "graph_parse", "graph_semanal",
+           "graph_check", "graph_own", "symbols", "overloads", "fan_in"]
+
+Timings = typing.Dict[str, typing.Dict[str, float]]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    # noinspection PyTypeChecker
+    parser.add_argument('modules', nargs='*',
+                        help="Stub modules to profile in isolation, ie QtCore. "
+                             "Defaults to all")
+    # noinspection PyTypeChecker
+    parser.add_argument('-o', '--output', type=Path,
+                        help="JSON file receiving the profile")
+    # noinspection PyTypeChecker
+    parser.add_argument('-s', '--sort', choices=COLUMNS, default="graph_own",
+                        help="Column sorting the table, in decreasing order. "
+                             "Defaults to graph_own")
+    # noinspection PyTypeChecker
+    parser.add_argument('--no-isolation', action='store_true',
+                        help="Only profile the full graph")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+
+    if not mypy.build.__file__.endswith(".py"):
+        raise SystemExit("mypy is compiled and can not be instrumented, install "
+                         "it with: pip install --no-binary mypy mypy")
+
+    all_modules = sorted(path.stem for path in STUBS_DIR.glob("*.pyi")
+                         if path.stem != "__init__")
+    modules = args.modules or all_modules
+    unknown_modules = set(modules) - set(all_modules)
+    if unknown_modules:
+        raise SystemExit(f"Unknown modules: {', '.join(sorted(unknown_modules))}")
+
+    profile = {module: stub_statistics(module) for module in all_modules}
+
+    print(f"Checking the full graph of {len(all_modules)} modules")
+    graph_timings, graph, _ = profile_build(all_modules)
+    for module in all_modules:
+        timings = graph_timings.get(f"PyQt5.{module}", {})
+        for phase in PHASES:
+            profile[module][f"graph_{phase}"] = timings.get(phase, 0.0)
+        profile[module]["graph_own"] = sum(timings.values())
+        profile[module]["fan_in"] = sum(
+            1 for state in graph.values()
+            if state.id.startswith("PyQt5.") and state.id != f"PyQt5.{module}"
+            and f"PyQt5.{module}" in state.dependencies)
+
+    if not args.no_isolation:
+        for module in modules:
+            print(f"Checking {module} in isolation")
+            timings, _, total = profile_build([module])
+            profile[module]["isolated_total"] = total
+            profile[module]["isolated_own"] = sum(
+                timings.get(f"PyQt5.{module}", {}).values())
+
+    print_table(profile, args.sort)
+    if args.output:
+        args.output.write_text(json.dumps(profile, indent=4, sort_keys=True) + "\n",
+                               encoding="utf-8")
+        print(f"Profile written to {args.output}")
+
+
+def stub_statistics(module: str) -> typing.Dict[str, typing.Any]:
+    """Count the symbols and the overloads of the stub."""
+    tree = ast.parse((STUBS_DIR / f"{module}.pyi").read_text(encoding="utf-8"))
+    symbols = overloads = 0
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AnnAssign)):
+            symbols += 1
+        elif isinstance(node, ast.Assign):
+            symbols += len(node.targets)
+        if isinstance(node, ast.FunctionDef) and any(
+                is_overload(decorator) for decorator in node.decorator_list):
+            overloads += 1
+    return {"symbols": symbols, "overloads": overloads}
+
+
+def is_overload(decorator: ast.expr) -> bool:
+    """Match @overload and @typing.overload"""
+    if isinstance(decorator, ast.Attribute):
+        return (decorator.attr == "overload"
+                and isinstance(decorator.value, ast.Name)
+                and decorator.value.id == "typing")
+    return isinstance(decorator, ast.Name) and decorator.id == "overload"
+
+
+def profile_build(modules: typing.List[str]
+                  ) -> typing.Tuple[Timings, typing.Dict[str, typing.Any], float]:
+    """Check the stub modules with mypy, without any cache.
+
+    Return the time spent in each phase per module, the graph of the
+    modules and the total time of the check.
+    """
+    options = Options()
+    options.incremental = False
+    sources = [BuildSource(None, f"PyQt5.{module}", None) for module in modules]
+
+    timings: Timings = {}
+    start = time.perf_counter()
+    with instrument_mypy(timings):
+        try:
+            result = mypy.build.build(sources, options)
+        except CompileError as exc:
+            raise SystemExit("\n".join(exc.messages))
+    total = time.perf_counter() - start
+    for message in result.errors:
+        print(message)
+    return timings, result.graph, total
+
+
+@contextlib.contextmanager
+def instrument_mypy(timings: Timings) -> typing.Iterator[None]:
+    """Accumulate the time of every phase of mypy per module.
+
+    Parsing includes the first pass of semantic analysis, checking includes
+    the type checking passes and their post-processing.
+    """
+    def timed(phase: str, get_module: typing.Callable[..., str],
+              func: typing.Callable[..., typing.Any]) -> typing.Callable[..., typing.Any]:
+        @functools.wraps(func)
+        def wrapper(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                module_timings = timings.setdefault(get_module(*args), {})
+                module_timings[phase] = (module_timings.get(phase, 0.0)
+                                         + time.perf_counter() - start)
+        return wrapper
+
+    state_methods = {
+        "parse_file": "parse",
+        "type_check_first_pass": "check",
+        "type_check_second_pass": "check",
+        "finish_passes": "check",
+    }
+    originals = {name: getattr(mypy.build.State, name) for name in state_methods}
+    original_semanal = mypy.semanal_main.semantic_analyze_target
+    try:
+        for name, phase in state_methods.items():
+            setattr(mypy.build.State, name,
+                    timed(phase, lambda state, *args: state.id, originals[name]))
+        # called for the top level and for each function of the module
+        mypy.semanal_main.semantic_analyze_target = timed(  # type: ignore
+            "semanal", lambda target, state, *args: state.id, original_semanal)
+        yield
+    finally:
+        for name, original in originals.items():
+            setattr(mypy.build.State, name, original)
+        mypy.semanal_main.semantic_analyze_target = original_semanal  # type: ignore
+
+
+def print_table(profile: typing.Dict[str, typing.Dict[str, typing.Any]],
+                sort: str) -> None:
+    columns = [column for column in COLUMNS
+               if any(column in values for values in profile.values())]
+    print(f"{'module':<22}" + "".join(f"{column:>15}" for column in columns))
+    for module, values in sorted(profile.items(),
+                                 key=lambda item: item[1].get(sort, 0),
+                                 reverse=True):
+        cells = []
+        for column in columns:
+            value = values.get(column)
+            if value is None:
+                cells.append(f"{'-':>15}")
+            elif isinstance(value, float):
+                cells.append(f"{value:>15.3f}")
+            else:
+                cells.append(f"{value:>15}")
+        print(f"{module:<22}" + "".join(cells))
+
+
+if __name__ == "__main__":
+    main()
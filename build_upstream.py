@@ -1,21 +1,75 @@
 import argparse
+import concurrent.futures
+import functools
+import hashlib
 import io
+import json
+import os
 import re
+import shutil
+import subprocess
 import tarfile
+import tempfile
+import threading
+import time
 from pathlib import Path
 import typing
 
 import docker
 from docker import DockerClient
 from docker.models.images import Image
-from docker.utils.json_stream import json_stream
 
 DEFAULT_DOCKERFILE = Path("Dockerfile")
 DEFAULT_OUTPUT_DIR = Path("PyQt5-stubs")
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "pyqt5-stubs"
+DEFAULT_MANIFEST = Path("upstream_manifest.json")
+FULL_BUILD_SIP_COMMAND = "sip-install"
+
+# Name of an upstream source tarball, ie PyQtChart-5.15.5.tar.gz
+SDIST_NAME_RE = re.compile(r'^(?P<project>[A-Za-z0-9_]+)-(?P<version>[^-]+)'
+                           r'\.tar\.gz$')
+
+# Dockerfile stage holding the dependencies shared by all the other stages
+BASE_STAGE = "build-dep"
+
+# Dockerfile stage of each upstream package: the ARG holding its version
+# and the stub modules it provides
+STAGES: typing.Dict[str, typing.Tuple[str, typing.List[str]]] = {
+    "pyqt5": ("PYQT_VERSION", [
+        "QAxContainer", "QtBluetooth", "QtCore", "QtDBus", "QtDesigner",
+        "QtGui", "QtHelp", "QtLocation", "QtMacExtras", "QtMultimedia",
+        "QtMultimediaWidgets", "QtNetwork", "QtNfc", "QtOpenGL",
+        "QtPositioning", "QtPrintSupport", "QtQml", "QtQuick", "QtQuick3D",
+        "QtQuickWidgets", "QtRemoteObjects", "QtSensors", "QtSerialPort",
+        "QtSql", "QtSvg", "QtTest", "QtWebChannel", "QtWebSockets",
+        "QtWidgets", "QtWinExtras", "QtX11Extras", "QtXml", "QtXmlPatterns",
+    ]),
+    "sip": ("SIP_VERSION", ["sip"]),
+    "pyqt-3d": ("PYQT_3D_VERSION", [
+        "Qt3DAnimation", "Qt3DCore", "Qt3DExtras", "Qt3DInput", "Qt3DLogic",
+        "Qt3DRender",
+    ]),
+    "pyqt-chart": ("PYQT_CHART_VERSION", ["QtChart"]),
+    "pyqt-data-visualization": ("PYQT_DATA_VISUALIZATION_VERSION",
+                                ["QtDataVisualization"]),
+    "pyqt-purchasing": ("PYQT_PURCHASING_VERSION", ["QtPurchasing"]),
+    "pyqt-web-engine": ("PYQT_WEB_ENGINE_VERSION", [
+        "QtWebEngine", "QtWebEngineCore", "QtWebEngineWidgets",
+    ]),
+    "pyqt-network-auth": ("PYQT_NETWORK_AUTH_VERSION", ["QtNetworkAuth"]),
+}
+
+MODULE_STAGES = {module: stage
+                 for stage, (_, modules) in STAGES.items()
+                 for module in modules}
+
+# Version and sha256 of a generated stub
+StubInfo = typing.Tuple[str, str]
 
 
 def parse_args() -> argparse.Namespace:
-    parser = argparse.ArgumentParser(description="Build PyQt stubs in Docker")
+    parser = argparse.ArgumentParser(
+        description="Build PyQt stubs in Docker or locally")
 
     # noinspection PyTypeChecker
     parser.add_argument('-d', '--dockerfile', type=Path,
@@ -31,95 +85,531 @@ def parse_args() -> argparse.Namespace:
     # noinspection PyTypeChecker
     parser.add_argument('-j', '--jobs', type=int,
                         default=1,
-                        help="The number of jobs to launch in parallel. "
+                        help="The number of make jobs to launch in parallel "
+                             "(only used with --full-build). "
                              "Defaults to 1")
 
+    # noinspection PyTypeChecker
+    parser.add_argument('-p', '--parallel-stages', type=int,
+                        default=min(len(STAGES), os.cpu_count() or 1),
+                        help="The number of Dockerfile stages to build in "
+                             "parallel. Defaults to the number of stages, "
+                             "bounded by the number of cores")
+
     # noinspection PyTypeChecker
     parser.add_argument('--no-cache',
                         action='store_true',
-                        help="Do not use Docker caches. Defaults to false")
+                        help="Do not use Docker caches. Requires Docker 23 "
+                             "or newer. Defaults to false")
 
-    return parser.parse_args()
+    # noinspection PyTypeChecker
+    parser.add_argument('--full-build',
+                        action='store_true',
+                        help="Compile and install the PyQt packages instead "
+                             "of only generating their stubs. Much slower. "
+                             "Defaults to false")
 
+    # noinspection PyTypeChecker
+    parser.add_argument('--skip-unchanged',
+                        action='store_true',
+                        help="Do not rewrite output stubs whose content is "
+                             "unchanged, so that their mtime is preserved. "
+                             "Defaults to false")
 
-def main():
-    args = parse_args()
+    # noinspection PyTypeChecker
+    parser.add_argument('--only',
+                        type=lambda value: value.split(','),
+                        help="Comma separated list of modules, ie "
+                             "QtChart,QtDataVisualization. Only the "
+                             "Dockerfile stages providing them are built and "
+                             "only their stubs are extracted")
 
-    docker_client = docker.from_env()
+    # noinspection PyTypeChecker
+    parser.add_argument('--manifest', type=Path,
+                        default=DEFAULT_MANIFEST,
+                        help="JSON file recording the upstream version and "
+                             "the sha256 of each generated stub, used to "
+                             "report which stubs changed. "
+                             f"Defaults to {DEFAULT_MANIFEST}")
 
-    image_id = build_image(docker_client, args.dockerfile, args.jobs, args.no_cache)
+    # noinspection PyTypeChecker
+    parser.add_argument('--local',
+                        action='store_true',
+                        help="Generate the stubs with the sip and qmake "
+                             "installed on this machine instead of Docker. "
+                             "Requires --sdist. Defaults to false")
 
-    extract_output(docker_client, image_id, args.output_dir)
+    # noinspection PyTypeChecker
+    parser.add_argument('--sdist', type=Path,
+                        action='append', default=[],
+                        help="Pre-downloaded source tarball of an upstream "
+                             "package (PyQt5, sip, PyQt3D, PyQtChart, ...). "
+                             "Can be repeated. Only used with --local")
 
+    # noinspection PyTypeChecker
+    parser.add_argument('--cache-dir', type=Path,
+                        default=DEFAULT_CACHE_DIR,
+                        help="Directory where --local keeps the tarballs and "
+                             "their generated stubs, keyed by sha256. "
+                             f"Defaults to {DEFAULT_CACHE_DIR}")
 
-def build_image(docker_client: DockerClient, dockerfile: Path, jobs: int, no_cache: bool) -> str:
-    image_name = "pyqt5-stubs"
+    # noinspection PyTypeChecker
+    parser.add_argument('--qmake',
+                        default=shutil.which("qmake-qt5") or "qmake",
+                        help="qmake executable used by --local. Defaults to "
+                             "qmake-qt5 if available, otherwise qmake")
 
-    # Using low-level API so that we can log as it occurs instead of only
-    # after build has finished/failed
-    resp = docker_client.api.build(
-        path=str(dockerfile.parent),
-        rm=True,
-        tag=image_name,
-        buildargs={"MAKEFLAGS": f"-j{jobs}"},
-        nocache=no_cache)
+    args = parser.parse_args()
+    if args.sdist and not args.local:
+        parser.error("--sdist can only be used with --local")
+    if args.local and not args.sdist:
+        parser.error("--local requires at least one --sdist")
+    for module in args.only or []:
+        if module not in MODULE_STAGES:
+            parser.error(f"Unknown module for --only: {module}")
 
-    image_id: str = typing.cast(str, None)
-    for chunk in json_stream(resp):
-        if 'error' in chunk:
-            message = f"Error while building Dockerfile for " \
-                      f"{image_name}:\n{chunk['error']}"
-            print(message)
-            raise DockerBuildError(message)
+    return args
 
-        elif 'stream' in chunk:
-            print(chunk['stream'].rstrip('\n'))
-            # Taken from the high level API implementation of build
-            match = re.search(r'(^Successfully built |sha256:)([0-9a-f]+)$',
-                              chunk['stream'])
-            if match:
-                image_id = match.group(2)
 
-    if not image_id:
-        message = f"Unknown Error while building Dockerfile for " \
-                  f"{image_name}. Build did not return an image ID"
-        raise DockerBuildError(message)
+def main():
+    args = parse_args()
 
-    return image_id
+    dockerfile_args = read_dockerfile_args(args.dockerfile)
 
+    stub_names = None
+    if args.only:
+        stub_names = {f"{module}.pyi" for module in args.only}
 
-def extract_output(docker_client: DockerClient, image_id: str,
-                   output_dir: Path) -> None:
-    image = docker_client.images.get(image_id)
-    container = docker_client.containers.create(image)
+    if args.local:
+        stubs = build_local(args.sdist, args.cache_dir, args.qmake, args.jobs,
+                            args.full_build,
+                            dockerfile_args["SIP_ABI_VERSION"],
+                            args.output_dir, args.skip_unchanged, stub_names)
+        update_manifest(args.manifest, stubs)
+        return
 
-    # Get archive tar bytes from the container as a sequence of bytes
-    package_tar_byte_gen: typing.Generator[bytes, None, None]
-    package_tar_byte_gen, _ = container.get_archive("/output/",
-                                                    chunk_size=None)
+    docker_client = docker.from_env()
 
-    # Concat all the chunks together
-    package_tar_bytes: bytes
-    package_tar_bytes = b"".join(package_tar_byte_gen)
+    if args.only:
+        targets = sorted({MODULE_STAGES[module] for module in args.only})
+    else:
+        targets = list(STAGES)
+
+    image_ids = build_stages(args.dockerfile, targets, args.jobs,
+                             args.no_cache, args.full_build,
+                             args.parallel_stages)
+
+    stub_hashes = {}
+    for target in targets:
+        stub_hashes.update(extract_output(docker_client, image_ids[target],
+                                          args.output_dir,
+                                          args.skip_unchanged, stub_names))
+
+    stubs = {}
+    for stub_name, sha256 in stub_hashes.items():
+        stage = MODULE_STAGES.get(Path(stub_name).stem)
+        version = dockerfile_args[STAGES[stage][0]] if stage else "unknown"
+        stubs[stub_name] = (version, sha256)
+
+    update_manifest(args.manifest, stubs)
+
+
+def build_stages(dockerfile: Path, targets: typing.List[str], jobs: int,
+                 no_cache: bool, full_build: bool,
+                 parallel_stages: int) -> typing.Dict[str, str]:
+    """Build each target stage of the Dockerfile with BuildKit
+
+    The shared base stage is built first, then the targets are built in
+    parallel by at most parallel_stages workers. Returns the image ID of
+    each target.
+    """
+    buildargs = {"MAKEFLAGS": f"-j{jobs}"}
+    if full_build:
+        # The Dockerfile defaults to running only the sip code generator
+        buildargs["SIP_BUILD_COMMAND"] = FULL_BUILD_SIP_COMMAND
+
+    if no_cache:
+        check_no_cache_filter()
+
+    build_start = time.monotonic()
+
+    # Build the base first so that the parallel builds share its cache
+    # instead of racing to create it
+    _, base_duration = build_stage(dockerfile, BASE_STAGE, buildargs,
+                                   no_cache)
+    durations = {BASE_STAGE: base_duration}
+
+    image_ids = {}
+    with concurrent.futures.ThreadPoolExecutor(parallel_stages) as executor:
+        futures = {
+            executor.submit(build_stage, dockerfile, target, buildargs,
+                            no_cache): target
+            for target in targets
+        }
+        for future in concurrent.futures.as_completed(futures):
+            target = futures[future]
+            image_ids[target], durations[target] = future.result()
+
+    wall_time = time.monotonic() - build_start
+
+    # BuildKit runs the build steps inside the Docker daemon, so only the
+    # wall-clock time of each docker build is measured here, not its CPU time
+    print("Build summary (wall-clock time):")
+    for stage, duration in sorted(durations.items(),
+                                  key=lambda item: item[1], reverse=True):
+        print(f"    {stage:<25} {duration:8.1f}s")
+    stage_time = sum(durations.values())
+    print(f"    total:             {wall_time:.1f}s")
+    print(f"    sum of stage time: {stage_time:.1f}s "
+          f"({stage_time / wall_time:.1f} stages busy on average, "
+          f"{parallel_stages} workers, {os.cpu_count()} cores)")
+
+    return image_ids
+
+
+def check_no_cache_filter() -> None:
+    """Check that docker build supports --no-cache-filter, used by --no-cache
+
+    It requires Docker 23 or newer (BuildKit 0.10).
+    """
+    env = dict(os.environ, DOCKER_BUILDKIT="1")
+    result = subprocess.run(["docker", "build", "--help"], env=env,
+                            stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                            universal_newlines=True)
+    if "--no-cache-filter" not in result.stdout:
+        raise DockerBuildError("--no-cache requires docker build "
+                               "--no-cache-filter, available from Docker 23 "
+                               "(BuildKit 0.10)")
+
+
+_print_lock = threading.Lock()
+
+
+def build_stage(dockerfile: Path, target: str,
+                buildargs: typing.Dict[str, str],
+                no_cache: bool) -> typing.Tuple[str, float]:
+    """Build one stage of the Dockerfile with BuildKit
+
+    The build log is streamed with the stage name as prefix. Returns the
+    image ID and the duration of the build.
+    """
+    image_name = f"pyqt5-stubs-{target}"
+    start = time.monotonic()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        iid_file = Path(temp_dir) / "iid"
+        command = ["docker", "build",
+                   "--file", str(dockerfile),
+                   "--target", target,
+                   "--tag", image_name,
+                   "--iidfile", str(iid_file),
+                   "--progress", "plain"]
+        for name, value in buildargs.items():
+            command += ["--build-arg", f"{name}={value}"]
+        if no_cache and target == BASE_STAGE:
+            command.append("--no-cache")
+        elif no_cache:
+            # --no-cache would also rebuild the base stage, which was just
+            # rebuilt by build_stages(), in every parallel build
+            command += ["--no-cache-filter", target]
+        command.append(str(dockerfile.parent))
+
+        # Using the docker command line because the Python API does not
+        # support BuildKit
+        env = dict(os.environ, DOCKER_BUILDKIT="1")
+        process = subprocess.Popen(command, env=env,
+                                   stdout=subprocess.PIPE,
+                                   stderr=subprocess.STDOUT,
+                                   universal_newlines=True)
+        for line in typing.cast(typing.IO[str], process.stdout):
+            with _print_lock:
+                print(f"[{target}] {line.rstrip()}")
+
+        if process.wait() != 0:
+            message = f"Error while building Dockerfile for {image_name}"
+            print(message)
+            raise DockerBuildError(message)
 
-    # Create a tarfile from the tar bytes
-    tar_file_object = io.BytesIO(package_tar_bytes)
-    package_tar = tarfile.open(fileobj=tar_file_object)
+        if not iid_file.exists():
+            message = f"Unknown Error while building Dockerfile for " \
+                      f"{image_name}. Build did not return an image ID"
+            raise DockerBuildError(message)
 
-    # Extract the files from the tarfile to the disk
-    for tar_deb_info in package_tar.getmembers():
-        # Ignore directories
-        if not tar_deb_info.isfile():
-            continue
+        image_id = iid_file.read_text().strip()
 
-        # Directory that will contain the output files
-        output_dir.mkdir(parents=True, exist_ok=True)
+    return image_id, time.monotonic() - start
 
-        # Filename (without outer directory)
-        tar_deb_info.name = Path(tar_deb_info.name).name
 
-        # Extract
-        package_tar.extract(tar_deb_info, output_dir)
+def extract_output(docker_client: DockerClient, image_id: str,
+                   output_dir: Path,
+                   skip_unchanged: bool = False,
+                   stub_names: typing.Optional[typing.Set[str]] = None
+                   ) -> typing.Dict[str, str]:
+    """Extract the stubs of the /output/ directory of the image
+
+    The archive is streamed from Docker and each stub is written as soon as
+    it is read. If stub_names is provided, the other stubs are ignored.
+    Returns the sha256 of each extracted stub.
+    """
+    image = docker_client.images.get(image_id)
+    container = docker_client.containers.create(image)
+    try:
+        # Get archive tar bytes from the container as a sequence of bytes
+        package_tar_byte_gen: typing.Generator[bytes, None, None]
+        package_tar_byte_gen, _ = container.get_archive("/output/",
+                                                        chunk_size=None)
+
+        # Read the tar bytes as a stream instead of concatenating all the
+        # chunks
+        tar_file_object = io.BufferedReader(
+            ChunkStream(package_tar_byte_gen))
+
+        stub_hashes = {}
+        written_stubs = 0
+        unchanged_stubs = 0
+        with tarfile.open(fileobj=tar_file_object, mode="r|*") as package_tar:
+            # Extract the files from the tarfile to the disk
+            for tar_deb_info in package_tar:
+                # Ignore directories
+                if not tar_deb_info.isfile():
+                    continue
+
+                # Directory that will contain the output files
+                output_dir.mkdir(parents=True, exist_ok=True)
+
+                # Filename (without outer directory)
+                stub_name = Path(tar_deb_info.name).name
+                if stub_names is not None and stub_name not in stub_names:
+                    continue
+
+                stub_file = package_tar.extractfile(tar_deb_info)
+                stub_content = typing.cast(typing.IO[bytes], stub_file).read()
+                stub_hashes[stub_name] = hashlib.sha256(
+                    stub_content).hexdigest()
+                if write_stub(stub_content, output_dir / stub_name,
+                              skip_unchanged):
+                    written_stubs += 1
+                else:
+                    unchanged_stubs += 1
+    finally:
+        # Also remove the container when the archive can not be read
+        container.remove()
+
+    print(f"Extracted {written_stubs} stubs, "
+          f"skipped {unchanged_stubs} unchanged stubs")
+    return stub_hashes
+
+
+def write_stub(content: bytes, path: Path, skip_unchanged: bool) -> bool:
+    """Write the stub content to path
+
+    With skip_unchanged, an existing file with the same sha256 is left alone
+    so that its mtime (and the mypy caches depending on it) stay valid.
+    Returns whether the file was written.
+    """
+    if skip_unchanged and path.is_file():
+        if file_sha256(path) == hashlib.sha256(content).hexdigest():
+            return False
+
+    path.write_bytes(content)
+    return True
+
+
+class ChunkStream(io.RawIOBase):
+    """Read-only file object over an iterable of bytes chunks"""
+
+    def __init__(self, chunks: typing.Iterable[bytes]):
+        super().__init__()
+        self._chunks = iter(chunks)
+        self._pending = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: typing.Any) -> int:
+        while not self._pending:
+            try:
+                self._pending = memoryview(next(self._chunks))
+            except StopIteration:
+                return 0
+
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+def read_dockerfile_args(dockerfile: Path) -> typing.Dict[str, str]:
+    """Return the default value of every ARG declared in the Dockerfile"""
+    dockerfile_args = {}
+    for line in dockerfile.read_text().splitlines():
+        match = re.match(r'^ARG\s+(\w+)="([^"]*)"', line)
+        if match:
+            dockerfile_args[match.group(1)] = match.group(2)
+
+    return dockerfile_args
+
+
+def file_sha256(path: Path) -> str:
+    sha256 = hashlib.sha256()
+    with path.open("rb") as file:
+        for chunk in iter(functools.partial(file.read, 1 << 20), b""):
+            sha256.update(chunk)
+
+    return sha256.hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def local_sip_version() -> str:
+    """Version of the local sip, which is part of the generated stubs"""
+    result = subprocess.run(["sip-build", "-V"], check=True,
+                            stdout=subprocess.PIPE, universal_newlines=True)
+    return result.stdout.strip()
+
+
+@functools.lru_cache(maxsize=None)
+def local_qt_version(qmake: str) -> str:
+    """Version of the Qt installation of qmake, which sip reads to select
+    the features of the generated stubs"""
+    result = subprocess.run([qmake, "-query", "QT_VERSION"], check=True,
+                            stdout=subprocess.PIPE, universal_newlines=True)
+    return result.stdout.strip()
+
+
+def build_local(sdists: typing.List[Path], cache_dir: Path, qmake: str,
+                jobs: int, full_build: bool, sip_abi_version: str,
+                output_dir: Path, skip_unchanged: bool = False,
+                stub_names: typing.Optional[typing.Set[str]] = None
+                ) -> typing.Dict[str, StubInfo]:
+    """Generate the stubs of each source tarball without Docker
+
+    Tarballs and the stubs generated from them are kept in cache_dir, keyed
+    by the sha256 of the tarball and the versions of sip and Qt, so that a
+    repeated run only hashes the tarballs and copies the cached stubs. The
+    network is never used.
+    Returns the upstream version and the sha256 of each stub.
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    stubs = {}
+    for sdist in sdists:
+        match = SDIST_NAME_RE.match(sdist.name)
+        if not match:
+            raise LocalBuildError(f"Unexpected source tarball name: "
+                                  f"{sdist.name}")
+        project = match.group("project")
+
+        digest, cached_sdist = cache_sdist(sdist, cache_dir)
+        if project == "sip":
+            stub_dir = cache_dir / "stubs" / digest
+        else:
+            stub_dir = (cache_dir / "stubs"
+                        / f"{digest}-sip{local_sip_version()}"
+                          f"-qt{local_qt_version(qmake)}")
+
+        if stub_dir.is_dir():
+            print(f"Using cached stubs of {sdist.name}")
+        else:
+            print(f"Generating stubs of {sdist.name}")
+            generate_local_stubs(project, cached_sdist, sdist.name, stub_dir,
+                                 qmake, jobs, full_build, sip_abi_version)
+
+        for stub in sorted(stub_dir.glob("*.pyi")):
+            if stub_names is not None and stub.name not in stub_names:
+                continue
+
+            stub_content = stub.read_bytes()
+            stubs[stub.name] = (match.group("version"),
+                                hashlib.sha256(stub_content).hexdigest())
+            write_stub(stub_content, output_dir / stub.name, skip_unchanged)
+
+    return stubs
+
+
+def cache_sdist(sdist: Path, cache_dir: Path) -> typing.Tuple[str, Path]:
+    """Copy the tarball into the content-addressed cache
+
+    Returns the sha256 of the tarball and the path of its cached copy.
+    """
+    digest = file_sha256(sdist)
+    cached_sdist = cache_dir / "sdist" / f"{digest}.tar.gz"
+    if not cached_sdist.exists():
+        cached_sdist.parent.mkdir(parents=True, exist_ok=True)
+        partial_sdist = cached_sdist.with_name(cached_sdist.name + ".partial")
+        shutil.copyfile(sdist, partial_sdist)
+        partial_sdist.replace(cached_sdist)
+
+    return digest, cached_sdist
+
+
+def generate_local_stubs(project: str, sdist: Path, sdist_name: str,
+                         stub_dir: Path, qmake: str, jobs: int,
+                         full_build: bool, sip_abi_version: str) -> None:
+    """Run the local sip over the tarball and store its stubs in stub_dir
+
+    sdist is the cached copy of the tarball, sdist_name the name of the
+    original tarball, used in the messages.
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        with tarfile.open(sdist) as sdist_tar:
+            sdist_tar.extractall(temp_dir)
+
+        # Tarballs contain a single top level directory
+        source_dir, = Path(temp_dir).iterdir()
+
+        if project == "sip":
+            # Same selection as the sip stage of the Dockerfile
+            stubs = [path for path in source_dir.rglob("*.pyi")
+                     if path.parent.name == sip_abi_version]
+        else:
+            command = ["sip-build",
+                       "--qmake", qmake,
+                       "--pep484-pyi",
+                       "--build-dir", "./build",
+                       "--verbose"]
+            if project == "PyQt5":
+                command.append("--confirm-license")
+            if not full_build:
+                command.append("--no-make")
+
+            env = dict(os.environ, MAKEFLAGS=f"-j{jobs}")
+            result = subprocess.run(command, cwd=source_dir, env=env)
+            if result.returncode != 0:
+                raise LocalBuildError(f"sip-build failed for {sdist_name}")
+
+            stubs = list(source_dir.rglob("*.pyi"))
+
+        # Fill a temporary directory first so that an interrupted run does
+        # not leave an incomplete cache entry behind
+        partial_dir = stub_dir.with_name(stub_dir.name + ".partial")
+        shutil.rmtree(partial_dir, ignore_errors=True)
+        partial_dir.mkdir(parents=True)
+        for stub in stubs:
+            shutil.copyfile(stub, partial_dir / stub.name)
+        partial_dir.replace(stub_dir)
+
+
+def update_manifest(manifest_path: Path,
+                    stubs: typing.Dict[str, StubInfo]) -> None:
+    """Record the generated stubs in the manifest and report the changes"""
+    manifest: typing.Dict[str, typing.Dict[str, str]] = {}
+    if manifest_path.exists():
+        manifest = json.loads(manifest_path.read_text())
+
+    changed_stubs = []
+    for stub_name, (version, sha256) in sorted(stubs.items()):
+        previous = manifest.get(stub_name)
+        if previous is None or previous["sha256"] != sha256:
+            changed_stubs.append(stub_name)
+        manifest[stub_name] = {"version": version, "sha256": sha256}
+
+    manifest_path.write_text(json.dumps(manifest, indent=4, sort_keys=True)
+                             + "\n")
+
+    print(f"{len(changed_stubs)} of {len(stubs)} stubs changed "
+          f"since the previous generation")
+    for stub_name in changed_stubs:
+        print(f"    {stub_name}")
 
 
 class DockerBuildError(RuntimeError):
@@ -127,5 +617,10 @@ class DockerBuildError(RuntimeError):
         self.message = message
 
 
+class LocalBuildError(RuntimeError):
+    def __init__(self, message):
+        self.message = message
+
+
 if __name__ == '__main__':
     main()
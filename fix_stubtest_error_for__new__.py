@@ -1,8 +1,17 @@
-from typing import Callable, Dict, Any, List, Optional
+import argparse
+import dataclasses
+import sys
+from typing import (Callable, Dict, Any, Iterable, Iterator, List, Optional,
+                    Set, TextIO, Tuple)
 
 import libcst as cst
 import libcst.matchers as matchers
 
+from fixer_cache import FixerCache
+
+# Bump when the output of the fixer changes, to invalidate the fixer cache
+INT_ENUM_FIXER_VERSION = '1'
+
 stubtest_output = '''
 error: PyQt5.QtBluetooth.QBluetoothDeviceInfo.Field.__new__ is inconsistent, stub argument "__x" differs from runtime argument "value"
 Stub: at line 181
@@ -649,75 +658,268 @@ Runtime: at line 631 in file D:\program\python38\lib\enum.py
 def (cls, value)
 '''
 
+# key marking a node of the class trie as a class to fix
+TARGET_CLASS = ''
+
+
 class TransformToIntEnumInheritance(cst.CSTTransformer):
+    '''Fix all the given classes of a module in a single traversal.
+
+    The full class names are held in a trie of nested dicts, so that the
+    classes which do not contain any target are not traversed.
+    '''
 
-    def __init__(self, full_class: str):
+    def __init__(self, *full_classes: str):
         super().__init__()
         self.full_name_stack: List[str] = []
-        self.target_class = full_class.split('.')
+        self.class_trie: Dict[str, Any] = {}
+        for full_class in full_classes:
+            node = self.class_trie
+            for name in full_class.split('.'):
+                node = node.setdefault(name, {})
+            node[TARGET_CLASS] = full_class
+        # trie node of each class being visited, None outside of the trie
+        self.trie_stack: List[Optional[Dict[str, Any]]] = [self.class_trie]
+
+        self.targets = set(full_classes)
+        self.fixed: List[str] = []
+        self.already_fixed: List[str] = []
+        self.not_int: List[str] = []
+
+    @property
+    def not_found(self) -> List[str]:
+        return sorted(self.targets - set(self.fixed) - set(self.already_fixed)
+                      - set(self.not_int))
+
+    def summary(self) -> str:
+        summary = '%d classes fixed, %d already fixed, %d not found' % (
+            len(self.fixed), len(self.already_fixed), len(self.not_found))
+        if self.not_int:
+            summary += ', %d not inheriting from int' % len(self.not_int)
+        return summary
+
+    def visit_FunctionDef(self, node: cst.FunctionDef) -> Optional[bool]:
+        # no class to fix inside functions
+        return False
 
     def visit_ClassDef(self, node: cst.ClassDef) -> Optional[bool]:
         self.full_name_stack.append( node.name.value )
-        return None
+        parent = self.trie_stack[-1]
+        trie_node = parent.get(node.name.value) if parent is not None else None
+        self.trie_stack.append(trie_node)
+        # skip the classes outside of the trie
+        return trie_node is not None
 
     def leave_ClassDef(self, original_node: cst.ClassDef, updated_node: cst.ClassDef) -> cst.ClassDef:
-        class_found = False
-
-        if self.full_name_stack == self.target_class:
-            class_found = True
-
+        trie_node = self.trie_stack.pop()
         self.full_name_stack.pop()
 
-        if not class_found:
+        if trie_node is None or TARGET_CLASS not in trie_node:
             return updated_node
+        full_class = trie_node[TARGET_CLASS]
 
         if len(updated_node.bases) == 1:
-            if updated_node.bases[0].value.value == 'IntEnum':
-                print('Already fixed!')
+            if matchers.matches(updated_node.bases[0].value,
+                                matchers.Name('IntEnum')
+                                | matchers.Attribute(value=matchers.Name('enum'),
+                                                     attr=matchers.Name('IntEnum'))):
+                self.already_fixed.append(full_class)
                 return updated_node
 
-            if updated_node.bases[0].value.value == 'int':
-                print('Fixing...')
+            if matchers.matches(updated_node.bases[0].value, matchers.Name('int')):
+                self.fixed.append(full_class)
                 return updated_node.with_changes(
                     bases=(updated_node.bases[0].with_changes(
                         value=updated_node.bases[0].value.with_changes(value='IntEnum')),)
                 )
 
+        self.not_int.append(full_class)
         return updated_node
 
 
 
 
-def fix_stub_class_inheritance_to_int_enum(stub_path: str, full_class: str) -> None:
-    '''Fix the stub by replacing "SomeClass(int)" to "SomeClass(IntEnum)"'''
-    # open stub file
-    # run transformer
-    # save stubfile
+def fix_stub_class_inheritance_to_int_enum(stub_path: str, *full_classes: str) -> None:
+    '''Fix the stub by replacing "SomeClass(int)" to "SomeClass(IntEnum)"
+
+    The stub is parsed and written once, whatever the number of classes.
+    '''
     with open(stub_path, "r", encoding="utf-8") as fhandle:
         stub_tree = cst.parse_module(fhandle.read())
 
-    print('Fixing module %s class %s' % (stub_path, full_class))
-    transformer = TransformToIntEnumInheritance(full_class)
+    for full_class in full_classes:
+        print('Fixing module %s class %s' % (stub_path, full_class))
+    transformer = TransformToIntEnumInheritance(*full_classes)
     modified_tree = stub_tree.visit(transformer)
+    print('%s: %s' % (stub_path, transformer.summary()))
+    for full_class in transformer.not_found:
+        print('Warning! Class %s not found in %s' % (full_class, stub_path))
 
+    if not transformer.fixed:
+        return
     with open(stub_path, "w", encoding="utf-8") as fhandle:
         fhandle.write(modified_tree.code)
     print('Updated: %s' % stub_path)
 
 
-def main():
+@dataclasses.dataclass
+class StubtestError:
+    '''One error reported by stubtest'''
+
+    # full name of the symbol, ie PyQt5.QtCore.QByteArray.Base64Option.__new__
+    symbol: str
+
+    # ie "inconsistent" or "not present at runtime"
+    kind: str
+
+    # rest of the error line
+    message: str
+
+    stub_line: Optional[int] = None
+    stub_signature: str = ''
+    runtime_location: str = ''
+    runtime_signature: str = ''
+
+    @property
+    def module_name(self) -> Optional[str]:
+        '''ie QtCore, None for an error about the PyQt5 package itself'''
+        parts = self.symbol.split('.')
+        if len(parts) < 2:
+            return None
+        return parts[1]
+
+    @property
+    def stub_path(self) -> str:
+        return 'PyQt5-stubs/%s.pyi' % self.module_name
+
+
+def _parse_error_line(line: str) -> StubtestError:
+    '''Parse "error: <symbol> <message>"'''
+    symbol, _, message = line[len('error: '):].rstrip('\n').partition(' ')
+    if message.startswith('is '):
+        kind = message[len('is '):].split(',')[0]
+    else:
+        kind = message.split(',')[0]
+    return StubtestError(symbol, kind, message)
+
+
+def iter_stubtest_errors(lines: Iterable[str]) -> Iterator[StubtestError]:
+    '''Parse the output of stubtest incrementally.
+
+    An error is yielded as soon as its block ends, so the output can be
+    piped live from stubtest.
+    '''
+    error: Optional[StubtestError] = None
+    # section of the error block the next lines belong to
+    section = ''
+    for line in lines:
+        line = line.rstrip('\n')
+        if line.startswith('error: '):
+            if error is not None:
+                yield error
+            error = _parse_error_line(line)
+            section = ''
+        elif error is None:
+            # summary lines, ie "Found 12 errors (checked 55 modules)"
+            continue
+        elif not line.strip():
+            yield error
+            error = None
+        elif line.startswith('Stub: '):
+            section = 'stub'
+            location = line[len('Stub: '):]
+            if location.startswith('at line '):
+                error.stub_line = int(location.split(' ')[2])
+        elif line.startswith('Runtime: '):
+            section = 'runtime'
+            error.runtime_location = line[len('Runtime: '):]
+        elif line.startswith('Inferred signature: '):
+            # mypy's reading of the stub signature, not needed by the fixes
+            section = ''
+        elif section == 'stub':
+            error.stub_signature += line
+        elif section == 'runtime':
+            error.runtime_signature += line
+    if error is not None:
+        yield error
+
+
+def iter_errors_per_module(errors: Iterable[StubtestError]
+                           ) -> Iterator[Tuple[str, List[StubtestError]]]:
+    '''Group the consecutive errors of the same module.
+
+    stubtest reports the modules one after the other, so each module is
+    yielded once as soon as its errors are complete. The errors about the
+    PyQt5 package itself are skipped.
+    '''
+    module_errors: List[StubtestError] = []
+    for error in errors:
+        if error.module_name is None:
+            continue
+        if module_errors and module_errors[0].stub_path != error.stub_path:
+            yield module_errors[0].stub_path, module_errors
+            module_errors = []
+        module_errors.append(error)
+    if module_errors:
+        yield module_errors[0].stub_path, module_errors
+
+
+def int_enum_classes(errors: Iterable[StubtestError]) -> Set[str]:
+    '''Return the full class names of the enums with a __new__ error'''
+    return set('.'.join(error.symbol.split('.')[2:-1])
+               for error in errors
+               if error.symbol.endswith('.__new__')
+               and error.kind == 'inconsistent')
+
+
+def parse_stubtest_output(output: str) -> Set[Tuple[str, str]]:
+    '''Return the (stub path, full class name) of every __new__ error'''
     fixes = set([])
+    for stub_path, errors in iter_errors_per_module(
+            iter_stubtest_errors(output.splitlines())):
+        for full_class_name in int_enum_classes(errors):
+            fixes.add( (stub_path, full_class_name) )
+    return fixes
 
-    for line in stubtest_output.split('\n'):
-        if line.startswith('error: ') \
-                and '__new__ is inconsistent,' in line:
-            class_info = line.split(' ')[1]
-            stub_module = 'PyQt5-stubs/%s.pyi' % class_info.split('.')[1]
-            full_class_name = '.'.join(class_info.split('.')[2:-1])
-            fixes.add( (stub_module, full_class_name) )
 
-    for stub, full_class in list(fixes):
-        fix_stub_class_inheritance_to_int_enum(stub, full_class)
+def main():
+    parser = argparse.ArgumentParser(description='Make the enums reported by '
+                                     'stubtest for __new__ inherit from IntEnum')
+    parser.add_argument('stubtest_output', nargs='?',
+                        help='File containing the output of stubtest, '
+                             '"-" to read it from stdin, ie '
+                             '"stubtest PyQt5 | python %(prog)s -". '
+                             'Defaults to the output embedded in this script')
+    args = parser.parse_args()
+
+    cache = FixerCache('int_enum', INT_ENUM_FIXER_VERSION)
+
+    input_file: Optional[TextIO] = None
+    if args.stubtest_output == '-':
+        lines: Iterable[str] = sys.stdin
+    elif args.stubtest_output:
+        input_file = open(args.stubtest_output, 'r', encoding='utf-8')
+        lines = input_file
+    else:
+        lines = stubtest_output.splitlines()
+
+    try:
+        for stub, errors in iter_errors_per_module(iter_stubtest_errors(lines)):
+            classes = int_enum_classes(errors)
+            if not classes:
+                continue
+            # the classes to fix are part of the input of the fixer
+            extra_input = '\n'.join(sorted(classes))
+            if cache.is_up_to_date(stub, extra_input):
+                continue
+            fix_stub_class_inheritance_to_int_enum(stub, *sorted(classes))
+            cache.record(stub, extra_input)
+    finally:
+        if input_file is not None:
+            input_file.close()
+
+    cache.save()
+    print(cache.summary())
 
 
 if __name__ == '__main__':
@@ -0,0 +1,73 @@
+"""On-disk cache of the stub files already processed by the fixer scripts.
+
+For each fixer, the cache records the sha256 of every stub file as it was
+written by the last run, together with the version of the fixer. A stub
+whose content and fixer version still match does not need to be parsed
+again.
+"""
+import hashlib
+import json
+import os
+from typing import Any, Dict
+
+DEFAULT_CACHE_PATH = ".fixer_cache.json"
+
+
+class FixerCache:
+    """Record of the stub files already processed by one fixer."""
+
+    def __init__(self, fixer: str, version: str, path: str = DEFAULT_CACHE_PATH):
+        self.fixer = fixer
+        self.version = version
+        self.path = path
+        self.processed = 0
+        self.skipped = 0
+
+        self._all_entries: Dict[str, Any] = {}
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as fhandle:
+                self._all_entries = json.load(fhandle)
+
+        entry = self._all_entries.get(fixer, {})
+        self._files: Dict[str, str] = {}
+        if entry.get("version") == version:
+            self._files = dict(entry["files"])
+
+    @staticmethod
+    def digest(stub_path: str, extra_input: str = "") -> str:
+        """Hash the stub content and any other input of the fixer."""
+        sha256 = hashlib.sha256()
+        with open(stub_path, "rb") as fhandle:
+            sha256.update(fhandle.read())
+        sha256.update(extra_input.encode("utf-8"))
+        return sha256.hexdigest()
+
+    def is_up_to_date(self, stub_path: str, extra_input: str = "") -> bool:
+        """Check if the stub is unchanged since this fixer processed it."""
+        key = os.path.normpath(stub_path)
+        if self._files.get(key) == self.digest(stub_path, extra_input):
+            self.skipped += 1
+            return True
+        return False
+
+    def record(self, stub_path: str, extra_input: str = "") -> None:
+        """Record the stub as processed, once it has been written."""
+        key = os.path.normpath(stub_path)
+        self._files[key] = self.digest(stub_path, extra_input)
+        self.processed += 1
+
+    def save(self) -> None:
+        """Write the cache back to the disk."""
+        self._all_entries[self.fixer] = {
+            "version": self.version,
+            "files": dict(sorted(self._files.items())),
+        }
+        with open(self.path, "w", encoding="utf-8") as fhandle:
+            json.dump(self._all_entries, fhandle, indent=4, sort_keys=True)
+
+    def summary(self) -> str:
+        """Describe how many stubs were processed and skipped."""
+        return (
+            f"{self.processed} stubs processed, "
+            f"{self.skipped} unchanged stubs skipped"
+        )
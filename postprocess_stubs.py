@@ -0,0 +1,264 @@
+"""Script that applies all the stub fixers in a single pass.
+
+Each stub module is parsed once with libcst, every registered fixer is run
+over the same tree and the module is written back once.
+"""
+import argparse
+import dataclasses
+import os
+import sys
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Set
+
+import libcst as cst
+
+from fixer_cache import FixerCache
+from fix_stubtest_error_for__new__ import (
+    TransformToIntEnumInheritance,
+    parse_stubtest_output,
+    stubtest_output,
+)
+from signal_fixer import (
+    TypingTransformer,
+    load_signal_index,
+    should_fix_signals,
+    signal_index_key,
+)
+
+if TYPE_CHECKING:
+    # imported lazily at runtime from QFLAGS_DIR, since it imports all of
+    # PyQt5. mypy finds it with MYPYPATH=tests/qflags
+    from generate_qflags_stubs_and_tests import QFlagLocationInfo
+
+STUBS_DIR = "PyQt5-stubs"
+# Bump when the output of a fixer changes, to invalidate the fixer cache
+POSTPROCESS_VERSION = "2"
+QFLAGS_DIR = os.path.join("tests", "qflags")
+DEFAULT_QFLAGS_RESULT = os.path.join(QFLAGS_DIR, "qflags_process_result.json")
+
+
+@dataclasses.dataclass
+class FixerContext:
+    """Data shared by all the fixers, gathered once before the first module."""
+
+    # full class names of the enums to derive from IntEnum, per module name
+    int_enum_classes: Dict[str, Set[str]] = dataclasses.field(
+        default_factory=dict
+    )
+
+    # flags whose qflag operations have to be present, per module name
+    qflags: Dict[str, List["QFlagLocationInfo"]] = dataclasses.field(
+        default_factory=dict
+    )
+
+    # directory caching the signal index of each PyQt5 module
+    signal_index_dir: Optional[str] = None
+
+
+Fixer = Callable[[FixerContext, str, cst.Module], cst.Module]
+
+# fixers run on every module, in registration order
+FIXERS: Dict[str, Fixer] = {}
+
+
+def register_fixer(name: str) -> Callable[[Fixer], Fixer]:
+    """Register a fixer in the post-processing chain."""
+
+    def decorator(fixer: Fixer) -> Fixer:
+        FIXERS[name] = fixer
+        return fixer
+
+    return decorator
+
+
+@register_fixer("signals")
+def fix_signals(
+    context: FixerContext, mod_name: str, tree: cst.Module
+) -> cst.Module:
+    """Turn the methods which are signals into pyqtSignal attributes."""
+    if not should_fix_signals(f"{mod_name}.pyi"):
+        return tree
+    try:
+        transformer = TypingTransformer(
+            mod_name, load_signal_index(mod_name, context.signal_index_dir)
+        )
+    except ImportError as exc:
+        # ie platform specific modules like QtWinExtras
+        print(f"Warning! Could not fix signals of {mod_name}: {exc}")
+        return tree
+    return tree.visit(transformer)
+
+
+@register_fixer("int_enum")
+def fix_int_enum(
+    context: FixerContext, mod_name: str, tree: cst.Module
+) -> cst.Module:
+    """Make the enums reported by stubtest inherit from IntEnum."""
+    classes = context.int_enum_classes.get(mod_name)
+    if not classes:
+        return tree
+    transformer = TransformToIntEnumInheritance(*sorted(classes))
+    tree = tree.visit(transformer)
+    print(f"{mod_name}: {transformer.summary()}")
+    return tree
+
+
+@register_fixer("qflags")
+def fix_qflags(
+    context: FixerContext, mod_name: str, tree: cst.Module
+) -> cst.Module:
+    """Make the flags already processed by the qflags generator inherit their
+    operations from the generic QFlags base, defined in QtCore."""
+    flags = context.qflags.get(mod_name)
+    if not flags:
+        return tree
+
+    import generate_qflags_stubs_and_tests as qflags_gen
+
+    if mod_name == "QtCore":
+        tree = qflags_gen.add_qflags_base(tree)
+
+    for flag_info in flags:
+        gen_result, error_msg, tree = qflags_gen.complete_qflag_stubs(
+            tree, flag_info
+        )
+        if gen_result == qflags_gen.QFlagGenResult.ErrorDuringProcessing:
+            print(f"Warning! Could not fix QFlag {flag_info.qflag_class}: "
+                  f"{error_msg}")
+    return tree
+
+
+def load_qflags(
+    qflags_result_json: str,
+) -> Dict[str, List["QFlagLocationInfo"]]:
+    """Read the flags processed by the qflags generator, per module name."""
+    sys.path.insert(0, QFLAGS_DIR)
+    import generate_qflags_stubs_and_tests as qflags_gen
+
+    qflags: Dict[str, List["QFlagLocationInfo"]] = {}
+    for flag_info in qflags_gen.read_processed_qflags(qflags_result_json):
+        qflags.setdefault(flag_info.module_name, []).append(flag_info)
+    return qflags
+
+
+def cache_input(
+    fixer_names: List[str], context: FixerContext, mod_name: str
+) -> str:
+    """Describe the inputs of the fixers for one module, besides the stub."""
+    lines = [",".join(fixer_names)]
+    lines.extend(sorted(context.int_enum_classes.get(mod_name, ())))
+    lines.extend(
+        sorted(
+            f"{flag_info.qflag_class},{flag_info.enum_class}"
+            for flag_info in context.qflags.get(mod_name, ())
+        )
+    )
+    if "signals" in fixer_names and should_fix_signals(f"{mod_name}.pyi"):
+        lines.append(signal_index_key(mod_name, context.signal_index_dir))
+    return "\n".join(lines)
+
+
+def process_module(
+    path: str, fixers: List[Fixer], context: FixerContext
+) -> bool:
+    """Parse the stub once, run all the fixers and write it once.
+
+    Return True if the stub has been modified.
+    """
+    mod_name = os.path.basename(path).replace(".pyi", "")
+    with open(path, "r", encoding="utf-8") as fhandle:
+        code = fhandle.read()
+
+    tree = cst.parse_module(code)
+    for fixer in fixers:
+        tree = fixer(context, mod_name, tree)
+
+    if tree.code == code:
+        return False
+
+    with open(path, "w", encoding="utf-8") as fhandle:
+        fhandle.write(tree.code)
+    return True
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "modules",
+        nargs="*",
+        help="Stub modules to process, ie QtCore. Defaults to all",
+    )
+    parser.add_argument(
+        "--fixers",
+        type=lambda value: value.split(","),
+        default=list(FIXERS),
+        help="Comma separated list of fixers to run. "
+        f"Defaults to {','.join(FIXERS)}",
+    )
+    parser.add_argument(
+        "--stubtest-output",
+        help="File containing the output of stubtest, used by the int_enum "
+        "fixer. Defaults to the output embedded in "
+        "fix_stubtest_error_for__new__.py",
+    )
+    parser.add_argument(
+        "--qflags-result",
+        default=DEFAULT_QFLAGS_RESULT,
+        help="Result file of the qflags generator, used by the qflags "
+        f"fixer. Defaults to {DEFAULT_QFLAGS_RESULT}",
+    )
+    parser.add_argument(
+        "--signal-index-dir",
+        help="Directory caching the signals of each PyQt5 module as JSON, "
+        "used by the signals fixer",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Process all the modules, even the ones unchanged since the "
+        "last run",
+    )
+    args = parser.parse_args()
+
+    unknown_fixers = set(args.fixers) - set(FIXERS)
+    if unknown_fixers:
+        parser.error(f"Unknown fixers: {', '.join(sorted(unknown_fixers))}")
+
+    context = FixerContext(signal_index_dir=args.signal_index_dir)
+    if "int_enum" in args.fixers:
+        if args.stubtest_output:
+            with open(args.stubtest_output, "r", encoding="utf-8") as fhandle:
+                fixes = parse_stubtest_output(fhandle.read())
+        else:
+            fixes = parse_stubtest_output(stubtest_output)
+        for stub_path, full_class in fixes:
+            mod_name = os.path.basename(stub_path).replace(".pyi", "")
+            context.int_enum_classes.setdefault(mod_name, set()).add(
+                full_class
+            )
+    if "qflags" in args.fixers:
+        context.qflags = load_qflags(args.qflags_result)
+
+    fixer_names = [name for name in FIXERS if name in args.fixers]
+    fixers = [FIXERS[name] for name in fixer_names]
+    cache = FixerCache("postprocess_stubs", POSTPROCESS_VERSION)
+    modules = args.modules or sorted(
+        file.replace(".pyi", "")
+        for file in os.listdir(STUBS_DIR)
+        if file.endswith(".pyi")
+    )
+    for mod_name in modules:
+        path = os.path.join(STUBS_DIR, f"{mod_name}.pyi")
+        extra_input = cache_input(fixer_names, context, mod_name)
+        if not args.force and cache.is_up_to_date(path, extra_input):
+            continue
+        print("Processing " + mod_name)
+        if process_module(path, fixers, context):
+            print("Updated " + path)
+        cache.record(path, extra_input)
+
+    cache.save()
+    print(cache.summary())
+
+
+if __name__ == "__main__":
+    main()
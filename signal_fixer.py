@@ -1,36 +1,103 @@
 """Script that will check stub files and fix signal annotations."""
+import argparse
 import importlib
+import json
 import os
-from types import ModuleType
-from typing import List, Optional, Union, cast, Iterable
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional, Set, Tuple, Union, cast, Iterable
 
 import libcst as cst
 
-from PyQt5 import QtCore
+from fixer_cache import FixerCache
 
+# Bump when the output of the fixer changes, to invalidate the fixer cache
+SIGNAL_FIXER_VERSION = "1"
 
-def is_signal(module: ModuleType, cls_name: str, func_name: str) -> bool:
-    """Check if a method of the given Qt class is a signal."""
-    if cls_name == "QGeoPositionInfoSource" and func_name == "error":
-        # this is a fix for the broken error method.
-        return False
-    cls = getattr(module, cls_name)
-    try:
-        func = getattr(cls, func_name)
-    except AttributeError:
-        print(f"Warning! Could not find {cls_name}.{func_name}")
-        return False
-    return isinstance(func, QtCore.pyqtSignal)
+# Signal names of each class of a PyQt5 module, by class name. Classes
+# without any signal are not listed.
+SignalIndex = Dict[str, List[str]]
+
+
+def should_fix_signals(file: str) -> bool:
+    """Check if the signals of the given stub file should be fixed."""
+    return not (
+        file.startswith("QtWebKit")
+        or file in ["QtX11Extras.pyi", "sip.pyi", "__init__.pyi"]
+    )
+
+
+def build_signal_index(mod_name: str) -> SignalIndex:
+    """Find the signals of all the classes of a PyQt5 module at once."""
+    from PyQt5 import QtCore
+
+    module = importlib.import_module(f"PyQt5.{mod_name}")
+    index: SignalIndex = {}
+    for cls_name, cls in sorted(vars(module).items()):
+        if not isinstance(cls, type):
+            continue
+        signals = [
+            attr
+            for attr in sorted(dir(cls))
+            if isinstance(getattr(cls, attr, None), QtCore.pyqtSignal)
+        ]
+        if cls_name == "QGeoPositionInfoSource" and "error" in signals:
+            # this is a fix for the broken error method.
+            signals.remove("error")
+        if signals:
+            index[cls_name] = signals
+    return index
+
+
+def load_signal_index(mod_name: str, index_dir: Optional[str]) -> SignalIndex:
+    """Return the signal index of a PyQt5 module.
+
+    If index_dir is provided, the index is read from index_dir/<module>.json
+    when present, so that PyQt5 is not imported at all, and is saved there
+    otherwise.
+    """
+    if index_dir is None:
+        return build_signal_index(mod_name)
+
+    path = os.path.join(index_dir, f"{mod_name}.json")
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as fhandle:
+            return cast(SignalIndex, json.load(fhandle))
+
+    index = build_signal_index(mod_name)
+    os.makedirs(index_dir, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as fhandle:
+        json.dump(index, fhandle, indent=4, sort_keys=True)
+    return index
+
+
+def signal_index_key(mod_name: str, index_dir: Optional[str]) -> str:
+    """Describe the signal index of a PyQt5 module, for the fixer cache.
+
+    The index read from index_dir is described by its content, an index
+    built from the installed PyQt5 by the version of PyQt5.
+    """
+    if index_dir is None:
+        from PyQt5.QtCore import PYQT_VERSION_STR
+
+        return f"PyQt5 {PYQT_VERSION_STR}"
+
+    index = load_signal_index(mod_name, index_dir)
+    return json.dumps(index, sort_keys=True)
 
 
 class TypingTransformer(cst.CSTTransformer):
     """TypingTransformer that visits classes and methods."""
 
-    def __init__(self, mod_name: str):
+    def __init__(self, mod_name: str, signal_index: Optional[SignalIndex] = None):
         super().__init__()
         self._last_class: List[cst.ClassDef] = []
-        self._fixed_signals: List[str] = []
-        self._module: ModuleType = importlib.import_module(f"PyQt5.{mod_name}")
+        self._fixed_signals: Set[str] = set()
+        if signal_index is None:
+            signal_index = build_signal_index(mod_name)
+        self._signals: Dict[str, Set[str]] = {
+            cls_name: set(signals) for cls_name, signals in signal_index.items()
+        }
 
     def visit_ClassDef(self, node: cst.ClassDef) -> Optional[bool]:
         """Put a class on top of the stack when visiting."""
@@ -51,14 +118,15 @@ class TypingTransformer(cst.CSTTransformer):
             return original_node
 
         f_name = original_node.name.value
-        if is_signal(self._module, self._last_class[-1].name.value, f_name):
-            full_name = f"{self._last_class[-1].name.value}.{f_name}"
+        cls_name = self._last_class[-1].name.value
+        if f_name in self._signals.get(cls_name, ()):
+            full_name = f"{cls_name}.{f_name}"
             if full_name in self._fixed_signals:
                 # Handle the use-case of overloaded signals, that are defined
                 # multiple time because of their different signal arguments
                 # i.e.: QComboBox.highlighted
                 return cst.RemovalSentinel.REMOVE
-            self._fixed_signals.append(full_name)
+            self._fixed_signals.add(full_name)
             stmt = f"{f_name}: typing.ClassVar[QtCore.pyqtSignal]"
             node = cst.parse_statement(stmt)
             if original_node.leading_lines:
@@ -87,21 +155,97 @@ class TypingTransformer(cst.CSTTransformer):
         return updated_node
 
 
-if __name__ == "__main__":
-    for file in os.listdir("PyQt5-stubs"):
-        if file.startswith("QtWebKit") or file in [
-            "QtX11Extras.pyi",
-            "sip.pyi",
-            "__init__.pyi",
-        ]:
-            continue
-        print("Fixing signals in " + file)
-        path = os.path.join("PyQt5-stubs", file)
-        with open(path, "r", encoding="utf-8") as fhandle:
-            stub_tree = cst.parse_module(fhandle.read())
+def fix_signals_in_file(
+    file: str, index_dir: Optional[str] = None
+) -> Tuple[str, float]:
+    """Fix the signals of one stub file of PyQt5-stubs.
+
+    Return the file name and the time spent on it, in seconds.
+    """
+    start = time.perf_counter()
+    path = os.path.join("PyQt5-stubs", file)
+    with open(path, "r", encoding="utf-8") as fhandle:
+        stub_tree = cst.parse_module(fhandle.read())
+
+    mod_name = file.replace(".pyi", "")
+    transformer = TypingTransformer(
+        mod_name, load_signal_index(mod_name, index_dir)
+    )
+    modified_tree = stub_tree.visit(transformer)
+
+    with open(path, "w", encoding="utf-8") as fhandle:
+        fhandle.write(modified_tree.code)
+    return file, time.perf_counter() - start
 
-        transformer = TypingTransformer(file.replace(".pyi", ""))
-        modified_tree = stub_tree.visit(transformer)
 
-        with open(path, "w", encoding="utf-8") as fhandle:
-            fhandle.write(modified_tree.code)
+def main() -> None:
+    """Fix the signals of all the stub files."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of stub files processed in parallel. Defaults to 1",
+    )
+    parser.add_argument(
+        "--signal-index-dir",
+        help="Directory caching the signals of each PyQt5 module as JSON. "
+        "Modules with a cached index are fixed without importing PyQt5",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Fix all the stub files, even the ones unchanged since the "
+        "last run",
+    )
+    args = parser.parse_args()
+    cache = FixerCache("signal_fixer", SIGNAL_FIXER_VERSION)
+
+    index_keys = {
+        file: signal_index_key(file[: -len(".pyi")], args.signal_index_dir)
+        for file in os.listdir("PyQt5-stubs")
+        if should_fix_signals(file)
+    }
+    files = [
+        file
+        for file, index_key in index_keys.items()
+        if args.force
+        or not cache.is_up_to_date(
+            os.path.join("PyQt5-stubs", file), index_key
+        )
+    ]
+    # Start with the largest files so that they do not end up last, alone
+    files.sort(
+        key=lambda file: os.path.getsize(os.path.join("PyQt5-stubs", file)),
+        reverse=True,
+    )
+
+    start = time.perf_counter()
+    if args.jobs > 1:
+        with ProcessPoolExecutor(args.jobs) as executor:
+            futures = [
+                executor.submit(
+                    fix_signals_in_file, file, args.signal_index_dir
+                )
+                for file in files
+            ]
+            for future in as_completed(futures):
+                file, duration = future.result()
+                cache.record(
+                    os.path.join("PyQt5-stubs", file), index_keys[file]
+                )
+                print(f"Fixed signals in {file} ({duration:.1f}s)")
+    else:
+        for file in files:
+            print("Fixing signals in " + file)
+            file, duration = fix_signals_in_file(file, args.signal_index_dir)
+            cache.record(os.path.join("PyQt5-stubs", file), index_keys[file])
+            print(f"Fixed signals in {file} ({duration:.1f}s)")
+    cache.save()
+    print(cache.summary())
+    print(f"Total time: {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
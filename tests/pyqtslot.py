@@ -18,7 +18,7 @@ def func_str(s: str) -> str:
 def func_toto(s: str) -> int:
     return 33
 
-n = None
+n: None = None
 n = func_none("test")
 
 i = 0
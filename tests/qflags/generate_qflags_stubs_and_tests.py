@@ -1,11 +1,21 @@
-from typing import List, Tuple, Dict, Union, Any, Optional, cast
+from typing import List, Tuple, Dict, Deque, Sequence, Union, Any, Optional, cast
 
+import collections
+import concurrent.futures
+import contextlib
 import dataclasses
 import functools
+import glob
+import hashlib
+import io
 import json
 import os
+import pickle
+import re
+import shutil
 import sys
 import subprocess
+import tempfile
 import traceback
 from enum import Enum
 
@@ -25,6 +35,7 @@ from PyQt5 import (QtCore, QtWidgets, QtGui, QtNetwork, QtDBus, QtOpenGL,
 try:
     import libcst as cst
     import libcst.matchers as matchers
+    from libcst._version import __version__ as LIBCST_VERSION
 except ImportError:
     raise ImportError('You need libcst to run the missing stubs generation\n'
                       'Please run the command:\n\tpython -m pip install libcst')
@@ -88,19 +99,75 @@ USAGE = '''Usage 1: {prog} analyse_grep_results <grep result filename> --group <
     of the qflags. Possible modules groups are:
     - {groups}
     
-Usage 2: {prog} gen_qflag_stub (<number>|all) (--auto-commit)
+Usage 2: {prog} gen_qflag_stub (<number>|all) (--batch <size>) (--jobs <number>) (--auto-commit)
     Using file qflag_to_process.json, process qflags and modify the PyQt modules.
     The output of this processing is available in qflags_process_result.json
     
     If <number> is not provided, defaults to 1. If "all" is provied, all qflags
     are processed.
     
-    If --auto-commit is specified, a git commit is performed after each successful QFlag validation
+    With --batch, the qflags are processed by batches of <size> qflags, validated with a
+    single pytest and mypy run. The batch is bisected only when the validation fails.
+    Defaults to 1.
+
+    With --jobs, the modules are processed in parallel by <number> worker processes. Each worker
+    processes all the qflags of one module and validates them against a private copy of the stubs,
+    so that the modules processed by the other workers do not interfere. Defaults to 1.
+
+    If --auto-commit is specified, a git commit is performed after each successful batch validation,
+    or after each module with --jobs
+
+    The result of each qflag is appended to qflags_process_result.jsonl as soon as it is known,
+    and qflags_process_result.json is written at the end of the processing. If the processing
+    is interrupted, the next one resumes from the results of qflags_process_result.jsonl .
+
+Usage 3: {prog} convert_to_qflags_base <qflag process results>
+    Make the QFlags classes listed in <qflag process results> which still define all their
+    operations inherit them from the generic QFlags base of QtCore.
+
+Usage 4: {prog} export_results
+    Write the results of qflags_process_result.jsonl left by an interrupted processing to
+    qflags_process_result.json
 
 '''.format(prog=sys.argv[0], groups='\n    - '.join(MODULE_GROUPS.keys()))
 
 
 
+# the generic base of all the QFlags classes, defined in QtCore.pyi
+QFLAGS_BASE = 'QtCore._QFlags'
+
+# the methods of a QFlags class which are provided by QFLAGS_BASE
+QFLAGS_BASE_METHODS = ('__init__', '__hash__', '__bool__', '__invert__', '__index__', '__int__',
+                       '__or__', '__and__', '__xor__', '__ror__', '__rand__', '__rxor__')
+
+# the definition of QFLAGS_BASE, added to QtCore.pyi when missing
+QFLAGS_BASE_STUB = '''
+_QFlagsEnumT = typing.TypeVar('_QFlagsEnumT', bound=int)
+_QFlagsT = typing.TypeVar('_QFlagsT', bound='_QFlags[typing.Any]')
+
+class _QFlags(sip.simplewrapper, typing.Generic[_QFlagsEnumT]):
+
+    @typing.overload
+    def __init__(self) -> None: ...
+    @typing.overload
+    def __init__(self, f: typing.Union['_QFlags[_QFlagsEnumT]', _QFlagsEnumT]) -> None: ...
+    @typing.overload
+    def __init__(self, f: int) -> None: ...
+
+    def __hash__(self) -> int: ...
+    def __bool__(self) -> int: ...
+    def __invert__(self: _QFlagsT) -> _QFlagsT: ...
+    def __index__(self) -> int: ...
+    def __int__(self) -> int: ...
+    def __or__ (self: _QFlagsT, other: typing.Union[_QFlagsT, _QFlagsEnumT, int]) -> _QFlagsT: ...
+    def __and__(self: _QFlagsT, other: typing.Union[_QFlagsT, _QFlagsEnumT, int]) -> _QFlagsT: ...
+    def __xor__(self: _QFlagsT, other: typing.Union[_QFlagsT, _QFlagsEnumT, int]) -> _QFlagsT: ...
+    def __ror__ (self: _QFlagsT, other: _QFlagsEnumT) -> _QFlagsT: ...
+    def __rand__(self: _QFlagsT, other: _QFlagsEnumT) -> _QFlagsT: ...
+    def __rxor__(self: _QFlagsT, other: _QFlagsEnumT) -> _QFlagsT: ...
+'''
+
+
 def log_progress(s: str) -> None:
     print('>>>>>>>>>>>>>>', s)
 
@@ -163,6 +230,89 @@ def json_encode_qflaglocationinfo(flag_loc_info: object) -> Union[object, Dict[s
     return d
 
 
+@dataclasses.dataclass
+class StubClassDecl:
+    """A class declared in a stub module"""
+    module_name: str
+    # class name qualified with its enclosing classes, like 'Qt.KeyboardModifiers'
+    full_name: str
+    # dotted name of the first base class, like 'sip.simplewrapper'
+    base: str
+
+
+# the bases of the classes which may be a qflag class or the enum class of a qflag
+QFLAG_CLASS_BASES = ('sip.simplewrapper', 'sip.wrapper', QFLAGS_BASE)
+ENUM_CLASS_BASES = ('int', 'enum.IntEnum')
+
+
+# a class declaration in a stub, with its indentation and the dotted name of its first base
+STUB_CLASS_DECL_RE = re.compile(r'^( *)class (\w+)(?:\(([\w.]*))?')
+
+
+def index_stub_classes(qt_modules: List[str]) -> Dict[str, List[StubClassDecl]]:
+    """Scan each stub module once and index all its classes, nested ones included, by class name.
+
+    The declarations of a class name are listed in the order of the modules, then in the order
+    of the module source.
+    """
+    class_index: Dict[str, List[StubClassDecl]] = {}
+    for mod_name in qt_modules:
+        with open('../../PyQt5-stubs/%s.pyi' % mod_name, encoding='utf8') as f:
+            mod_content = f.read()
+
+        # the indentation and name of the classes enclosing the current line
+        enclosing_classes: List[Tuple[int, str]] = []
+        for line in mod_content.splitlines():
+            statement = line.lstrip(' ')
+            if not statement or statement.startswith('#'):
+                continue
+            # every statement, not only a class declaration, ends the classes indented as much
+            # as itself, ie an if block following a nested class in the body of a class
+            indent = len(line) - len(statement)
+            while enclosing_classes and enclosing_classes[-1][0] >= indent:
+                enclosing_classes.pop()
+            match = STUB_CLASS_DECL_RE.match(line)
+            if match is None:
+                continue
+            class_name, base = match.group(2), match.group(3) or ''
+            full_name = '.'.join([name for _indent, name in enclosing_classes] + [class_name])
+            class_index.setdefault(class_name, []).append(StubClassDecl(mod_name, full_name, base))
+            enclosing_classes.append((indent, class_name))
+    return class_index
+
+
+def stub_class_decls_per_module(class_index: Dict[str, List[StubClassDecl]], class_name: str,
+                                bases: Tuple[str, ...]) -> Dict[str, List[StubClassDecl]]:
+    """Return the declarations of the class name with one of the bases, per module name"""
+    decls_per_module: Dict[str, List[StubClassDecl]] = {}
+    for decl in class_index.get(class_name, []):
+        if decl.base in bases:
+            decls_per_module.setdefault(decl.module_name, []).append(decl)
+    return decls_per_module
+
+
+def pair_qflag_and_enum_decls(qflag_decls: List[StubClassDecl], enum_decls: List[StubClassDecl]
+                              ) -> List[Tuple[StubClassDecl, StubClassDecl]]:
+    """Pair each declaration of a qflag class of a module with the declaration of its enum class,
+    the one declared in the same enclosing class.
+
+    A qflag class without an enum class in its enclosing class is left out. Raise ValueError if
+    there are several of them.
+    """
+    decl_pairs = []
+    for qflag_decl in qflag_decls:
+        enclosing_name = qflag_decl.full_name.rpartition('.')[0]
+        qflag_enum_decls = [enum_decl for enum_decl in enum_decls
+                            if enum_decl.full_name.rpartition('.')[0] == enclosing_name]
+        if len(qflag_enum_decls) > 1:
+            raise ValueError('Enum class of %s is ambiguous in module %s: %s' % (
+                qflag_decl.full_name, qflag_decl.module_name,
+                ', '.join(enum_decl.full_name for enum_decl in qflag_enum_decls)))
+        if qflag_enum_decls:
+            decl_pairs.append((qflag_decl, qflag_enum_decls[0]))
+    return decl_pairs
+
+
 def identify_qflag_location(fname_grep_result: str,
                             qt_modules: List[str]
                             ) -> List[ QFlagLocationInfo ]:
@@ -194,59 +344,41 @@ def identify_qflag_location(fname_grep_result: str,
             else:
                 parsed_qflags[(qflag_class, enum_class)] = QFlagLocationInfo(qflag_class, enum_class, grep_line=(grep_line,))
 
-    # fill up modules with content
-    qt_modules_content = [ (mod_name, open('../../PyQt5-stubs/%s.pyi' % mod_name, encoding='utf8').read())
-                           for mod_name in qt_modules]
+    class_index = index_stub_classes(qt_modules)
 
     # associate a qflag enum/class with a mapping from module to QFlagLocationInfo
-    module_mapping: Dict[ Tuple[str, str], Dict[str, QFlagLocationInfo]] = {}
+    module_mapping: Dict[ Tuple[str, str], Dict[str, List[QFlagLocationInfo]]] = {}
     flag_not_found = []
 
     for qflag_key, flag_info in parsed_qflags.items():
-        decl_qflag_class = 'class %s(sip.simplewrapper' % flag_info.qflag_class
-        decl_qflag_class2 = 'class %s(sip.wrapper' % flag_info.qflag_class
-        decl_enum_class = 'class %s(int' % flag_info.enum_class
+        qflag_decls = stub_class_decls_per_module(class_index, flag_info.qflag_class, QFLAG_CLASS_BASES)
+        enum_decls = stub_class_decls_per_module(class_index, flag_info.enum_class, ENUM_CLASS_BASES)
         module_found = False
-        for mod_name, mod_content in qt_modules_content:
-
-            if (decl_qflag_class in mod_content or decl_qflag_class2 in mod_content) \
-                    and decl_enum_class in mod_content:
-                # we have found one module
+        for mod_name in qt_modules:
+            decl_pairs = pair_qflag_and_enum_decls(qflag_decls.get(mod_name, []),
+                                                   enum_decls.get(mod_name, []))
+            if decl_pairs:
+                # we have found one module, where this flag happens once per pair
                 module_found = True
-                # print('Adding QFlags %s to module %s' % (flag_info.qflag_class, mod_name))
-                if qflag_key not in module_mapping:
-                    module_mapping[qflag_key] = {}
-                else:
-                    pass
-                mod_map = module_mapping[qflag_key]
-
-                if mod_name in mod_map:
-                    raise ValueError('Not supposed to happen!')
-
-                # register the number of time where this flag happens in this specific module
-                mod_map[mod_name] = dataclasses.replace(flag_info)  # this means a fresh copy of flag_info
-                mod_map[mod_name].module_count = 1
-
-                count_qflag_class = mod_content.count(decl_qflag_class)
-                count_enum_class = mod_content.count(decl_enum_class)
-                if count_qflag_class > 1 and count_enum_class > 1:
-                    # print('QFlag present more than once, adding it more than once')
-                    mod_map[mod_name].module_count += min(count_qflag_class, count_enum_class) - 1
+                mod_map = module_mapping.setdefault(qflag_key, {})
+                mod_map[mod_name] = [
+                    dataclasses.replace(flag_info,
+                                        qflag_full_class_name=qflag_decl.full_name,
+                                        enum_full_class_name=enum_decl.full_name,
+                                        module_count=len(decl_pairs),
+                                        module_idx=idx,
+                                        module_name=mod_name,
+                                        module_path='../../PyQt5-stubs/%s.pyi' % mod_name)
+                    for idx, (qflag_decl, enum_decl) in enumerate(decl_pairs)]
 
         if not module_found:
             flag_not_found.append(qflag_key)
 
-    # now, we flatten the structure by recreating one QFlagLocationInfo per module location
-
+    # now, we flatten the structure, with one QFlagLocationInfo per module location
     all_qflags: List[QFlagLocationInfo] = []
     for mod_map in module_mapping.values():
-        for mod_name, flag_info in mod_map.items():
-            idx = 0
-            while idx < flag_info.module_count:
-                all_qflags.append(dataclasses.replace(flag_info, module_idx=idx,
-                                                      module_name=mod_name,
-                                                      module_path='../../PyQt5-stubs/%s.pyi' % mod_name))
-                idx += 1
+        for mod_flags in mod_map.values():
+            all_qflags.extend(mod_flags)
 
     for qflag_key in flag_not_found:
         all_qflags.append(parsed_qflags[qflag_key])
@@ -340,134 +472,260 @@ def extract_qflags_to_process(qflags_modules_analysis_json: str,
         json.dump(result, f, indent=4)
 
 
-def process_qflag(qflag_to_process_json: str, qflag_result_json: str, auto_commit: bool) -> int:
-    """Read the qflags to process from the json file
+class QFlagProgressStore:
+    """The results of the qflags processing, indexed by flag.
 
-    Process one qflag, by either:
-    * identifying that this flag is already processed and add the flag to qflags_alraedy_done
-    * identifying a reason why this flag can't be processed and adding the flag to qflags_processed_error
-    * performing the qflag ajustment process:
+    The results are read from the json result file, then from an append-only log of the results
+    recorded since the json file was last exported. The log is named after the json file, with
+    a .jsonl extension.
+    """
+
+    RESULT_LISTS = ('qflag_already_done', 'qflag_processed_done', 'qflag_process_error')
+
+    def __init__(self, result_json: str, log: bool = True) -> None:
+        self.result_json = result_json
+        self.log_path = os.path.splitext(result_json)[0] + '.jsonl'
+        # when False, the results are only kept in memory, ie in a worker of process_qflags_per_module()
+        self.log = log
+        self.results: Dict[str, List[Dict]] = {result_list: [] for result_list in self.RESULT_LISTS}
+        # the result list of each flag
+        self.index: Dict[Tuple[str, int, str, str], str] = {}
+        # the results added since the store was loaded
+        self.added: List[Tuple[str, Dict]] = []
+
+        if os.path.exists(result_json):
+            with open(result_json) as f:
+                for result_list, flag_info_dicts in json.load(f).items():
+                    for flag_info_dict in flag_info_dicts:
+                        self._add(result_list, flag_info_dict)
+
+        if os.path.exists(self.log_path):
+            with open(self.log_path) as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        self._add(entry['result'], entry['flag'])
+
+    @staticmethod
+    def flag_key(flag_info_dict: Dict) -> Tuple[str, int, str, str]:
+        return (flag_info_dict['module_name'], flag_info_dict['module_idx'],
+                flag_info_dict['qflag_class'], flag_info_dict['enum_class'])
+
+    def __contains__(self, flag_info_dict: Dict) -> bool:
+        return self.flag_key(flag_info_dict) in self.index
+
+    def _add(self, result_list: str, flag_info_dict: Dict) -> bool:
+        """Add the flag to the result list, unless it already has a result.
+
+        The log replayed after an interrupted export contains results already in the json file.
+        """
+        key = self.flag_key(flag_info_dict)
+        if key in self.index:
+            return False
+        self.index[key] = result_list
+        self.results.setdefault(result_list, []).append(flag_info_dict)
+        return True
+
+    def add(self, result_list: str, flag_info_dict: Dict) -> None:
+        """Record the result of the flag and append it to the log, if enabled"""
+        if not self._add(result_list, flag_info_dict):
+            return
+        self.added.append((result_list, flag_info_dict))
+        if self.log:
+            with open(self.log_path, 'a') as f:
+                f.write(json.dumps({'result': result_list, 'flag': flag_info_dict}) + '\n')
+
+    def processed_flags(self) -> List[Dict]:
+        """Return the flags which have been processed successfully or were already done"""
+        return self.results['qflag_processed_done'] + self.results['qflag_already_done']
+
+    def export(self) -> None:
+        """Write all the results to the json result file and empty the log"""
+        with open(self.result_json, 'w') as f:
+            json.dump(self.results, f, indent=4)
+        if os.path.exists(self.log_path):
+            os.unlink(self.log_path)
+
+
+def process_qflags(qflags_to_process: Deque[Dict], store: 'QFlagProgressStore', auto_commit: bool,
+                   batch_size: int = 1) -> int:
+    """Process the next qflags of qflags_to_process, read from qflags_to_process.json
+
+    Process a batch of batch_size qflags. Each qflag is either:
+    * identified as already processed and added to qflags_alraedy_done
+    * identified with a reason why this flag can't be processed and added to qflags_processed_error
+    * going through the qflag ajustment process:
         * generate a test file for this qflag usage
         * change the .pyi module for this qflag for supporting all the qflag operations
-        * run pytest on the result
-        * run mypy on the result
-        * run the tox on result
-        * add the flag to qflag_processed_done
 
-    * auto_commit: if True, a git commit is performed after each successful QFlag validation
+    The test files generated for the batch are then validated all together, with one pytest
+    run and one mypy run. If the validation fails, the batch is bisected to find the failing
+    qflags, their module changes are reverted and their test files are removed. The other
+    qflags are added to qflag_processed_done.
+
+    The results are recorded in the store.
+
+    * auto_commit: if True, a git commit is performed after each successful batch validation
 
     Return number of remaining flags to process (0 when everything done)
     """
+    flags = next_qflags_to_process(qflags_to_process, store, batch_size)
+    if not flags:
+        # we have exhausted the list of qflag to process
+        return 0
 
-    with open(qflag_to_process_json) as f:
-        d = json.load(f)
+    # the classes replaced for each flag, by id of flag_info, to revert the changes of the failing flags
+    batch_edits: Dict[int, List['QFlagClassEdit']] = {}
+    generated_flags = []
+    for flag_info in flags:
+        log_progress('Processing %s and %s in module %s, index %d' %
+                     (flag_info.qflag_class, flag_info.enum_class, flag_info.module_name, flag_info.module_idx))
+
+        # check that the qflag is actually in the module
+        # Note that flag_info is modified in-place with additional info:
+        # enum_value1, enum_value2, full_enum_class_name, full_qflag_class_name
+        gen_result, error_msg, edits = generate_missing_stubs(flag_info)
+        if gen_result == QFlagGenResult.CodeModifiedSuccessfully:
+            generate_qflag_test_file(flag_info)
+            generated_flags.append(flag_info)
+            batch_edits[id(flag_info)] = edits
+        else:
+            record_qflag_result(store, flag_info, gen_result, error_msg)
+
+    # each module is written once, with the changes of all the flags of the batch
+    write_pending_modules()
+
+    if generated_flags:
+        validated_flags, failures = validate_qflags(generated_flags, batch_edits)
+        for flag_info in validated_flags:
+            record_qflag_result(store, flag_info, QFlagGenResult.CodeModifiedSuccessfully, '')
+        for flag_info, error_msg in failures:
+            record_qflag_result(store, flag_info, QFlagGenResult.ErrorDuringProcessing, error_msg)
+
+        if auto_commit and validated_flags:
+            commit_qflags(validated_flags)
+
+    # return True to indicate that more flags may be processed
+    log_progress('.')
+    return len(qflags_to_process)
 
-    qflags_to_process = d['qflags_to_process']
-
-    result_json: Dict[str, List[Dict]] = {
-        'qflag_already_done': [],
-        'qflag_processed_done': [],
-        'qflag_process_error': [],
-    }
-
-    if os.path.exists(qflag_result_json):
-        with open(qflag_result_json, 'r') as f:
-            result_json = json.loads(f.read())
-
-    def qflag_already_processed(flag_info: QFlagLocationInfo) -> bool:
-        """Return True if the qflag is already included in one of the result lists
-        of result_json"""
-        flag_desc = (flag_info.module_name, flag_info.module_idx,
-                     flag_info.qflag_class, flag_info.enum_class)
-        already_done_set = set( (flag_info_dict['module_name'],
-                                 flag_info_dict['module_idx'],
-                         flag_info_dict['qflag_class'],
-                         flag_info_dict['enum_class'])
-                        for flag_info_dict in result_json['qflag_already_done'])
-        processed_done_set = set( (flag_info_dict['module_name'],
-                                   flag_info_dict['module_idx'],
-                                   flag_info_dict['qflag_class'],
-                                   flag_info_dict['enum_class'])
-                                  for flag_info_dict in result_json['qflag_processed_done'])
-        process_error_set = set( (flag_info_dict['module_name'],
-                                  flag_info_dict['module_idx'],
-                                  flag_info_dict['qflag_class'],
-                         flag_info_dict['enum_class'])
-                            for flag_info_dict in result_json['qflag_process_error'])
-        if flag_desc in already_done_set or flag_desc in processed_done_set or flag_desc in process_error_set:
-            return True
-        return False
 
-    while len(qflags_to_process) != 0:
-        flag_info_dict = qflags_to_process.pop(0)
+def commit_qflags(flags: List[QFlagLocationInfo]) -> None:
+    """Perform a git commit of the modules and the test files of the flags"""
+    log_progress('Performing git commit')
+    if len(flags) == 1:
+        commit_msg = 'QFlag operations for %s, %s in module %s' % (
+            flags[0].qflag_full_class_name, flags[0].enum_full_class_name, flags[0].module_name)
+    else:
+        commit_msg = 'QFlag operations for %d flags\n\n%s' % (len(flags), '\n'.join(
+            '* %s, %s in module %s' % (flag_info.qflag_full_class_name, flag_info.enum_full_class_name,
+                                       flag_info.module_name)
+            for flag_info in flags))
+    subprocess.run(['git', 'add']
+                   + [gen_test_fname(flag_info) for flag_info in flags]
+                   + sorted(set(flag_info.module_path for flag_info in flags)))
+    subprocess.run(['git', 'commit', '-m', commit_msg])
+
+
+def process_qflags_per_module(flags: List[QFlagLocationInfo], store: 'QFlagProgressStore', auto_commit: bool,
+                              batch_size: int, jobs: int) -> None:
+    """Process the flags with a pool of jobs worker processes, one module per worker.
+
+    Each worker owns the file of its module: the flags of a module are processed sequentially,
+    by batches of batch_size flags, by the same worker (see process_module_qflags()). The results
+    of a worker are merged into the store when all the flags of its module are processed, and
+    committed if auto_commit is set. Git is only run by this process.
+    """
+    flags_per_module: Dict[str, List[Dict]] = {}
+    for flag_info in flags:
+        flags_per_module.setdefault(flag_info.module_path, []).append(dataclasses.asdict(flag_info))
+
+    with tempfile.TemporaryDirectory(prefix='qflags-stubs-') as snapshot_dir:
+        # the stubs as they are before the processing, validated by the workers with their own module
+        shutil.copytree('../../PyQt5-stubs', os.path.join(snapshot_dir, 'PyQt5'))
+
+        with concurrent.futures.ProcessPoolExecutor(jobs) as executor:
+            futures = {executor.submit(process_module_qflags, module_path, module_flags, store.result_json,
+                                       batch_size, snapshot_dir): module_path
+                       for module_path, module_flags in flags_per_module.items()}
+            for future in concurrent.futures.as_completed(futures):
+                module_results = future.result()
+                for result_list, flag_info_dict in module_results:
+                    store.add(result_list, flag_info_dict)
+                log_progress('Module %s processed: %d flags' % (futures[future], len(module_results)))
+
+                validated_flags = [QFlagLocationInfo(**flag_info_dict)
+                                   for result_list, flag_info_dict in module_results
+                                   if result_list == 'qflag_processed_done']
+                if auto_commit and validated_flags:
+                    commit_qflags(validated_flags)
+
+
+def process_module_qflags(module_path: str, flag_info_dicts: List[Dict], qflag_result_json: str,
+                          batch_size: int, snapshot_dir: str) -> List[Tuple[str, Dict]]:
+    """Process the flags of the module at module_path, in a worker process.
+
+    The module is modified in a private copy of the stubs of snapshot_dir, which mypy uses
+    instead of the installed stubs. So the validation of the flags sees the other modules as they
+    were before the processing, whatever the other workers are doing. The module is written back
+    to module_path at the end.
+
+    Return the results of the flags, as pairs of result list and flag info
+    """
+    store = QFlagProgressStore(qflag_result_json, log=False)
+    with tempfile.TemporaryDirectory(prefix='qflags-stubs-') as stubs_dir:
+        shutil.copytree(os.path.join(snapshot_dir, 'PyQt5'), os.path.join(stubs_dir, 'PyQt5'))
+        private_module_path = os.path.join(stubs_dir, 'PyQt5', os.path.basename(module_path))
+        qflags_to_process = collections.deque(dict(flag_info_dict, module_path=private_module_path)
+                                              for flag_info_dict in flag_info_dicts)
+
+        old_environ = dict(os.environ)
+        os.environ['MYPYPATH'] = stubs_dir
+        os.environ['MYPY_CACHE_DIR'] = os.path.join(stubs_dir, '.mypy_cache')
+        try:
+            while len(qflags_to_process) != 0:
+                process_qflags(qflags_to_process, store, False, batch_size)
+        finally:
+            os.environ.clear()
+            os.environ.update(old_environ)
+
+        shutil.copyfile(private_module_path, module_path)
+    save_cst_module_cache()
+
+    return [(result_list, dict(flag_info_dict, module_path=module_path))
+            for result_list, flag_info_dict in store.added]
+
+
+def next_qflags_to_process(qflags_to_process: Deque[Dict], store: 'QFlagProgressStore',
+                           nb: int) -> List[QFlagLocationInfo]:
+    """Pop from qflags_to_process the next nb flags which do not have a result in the store"""
+    flags: List[QFlagLocationInfo] = []
+    while len(qflags_to_process) != 0 and len(flags) < nb:
+        flag_info_dict = qflags_to_process.popleft()
+        if flag_info_dict in store:
+            continue
         flag_info = QFlagLocationInfo(**flag_info_dict)
         flag_info.grep_line = tuple(flag_info.grep_line)    # to make it hashable
-        if not qflag_already_processed(flag_info):
-            break
-    else:
-        # we have exhausted the list of qflag to process
-        return 0
+        flags.append(flag_info)
+    return flags
 
-    log_progress('Processing %s and %s in module %s, index %d' %
-             (flag_info.qflag_class, flag_info.enum_class, flag_info.module_name, flag_info.module_idx))
 
-    # check that the qflag is actually in the module
-    gen_result, error_msg, old_mod_content = generate_missing_stubs(flag_info)
+def record_qflag_result(store: 'QFlagProgressStore', flag_info: QFlagLocationInfo,
+                        gen_result: 'QFlagGenResult', error_msg: str) -> None:
+    """Add the flag to the result list of the store matching gen_result"""
     flag_info_dict = dataclasses.asdict(flag_info)
-    test_qflag_fname = gen_test_fname(flag_info)
 
-    # Note that flag_info has been modified in-place with additional info:
-    # enum_value1, enum_value2, full_enum_class_name, full_qflag_class_name
     if gen_result == QFlagGenResult.CodeModifiedSuccessfully:
-        generate_qflag_test_file(flag_info)
-        log_progress('Running pytest %s' % test_qflag_fname)
-        p = subprocess.run(['pytest', '-v', '--capture=no', test_qflag_fname])
-        if p.returncode != 0:
-            error_msg += 'pytest failed:\n'
-            # Re-run the same command to capture the output in the error message
-            # in the first run, the stdout/stderr was simply displayed and not captured
-            # here, we want to capture it and not display it
-            p = subprocess.run(['pytest', '-v', '--capture=no', test_qflag_fname],
-                               stdout=subprocess.PIPE, stderr=subprocess.STDOUT, encoding='utf8')
-            error_msg += p.stdout
-            gen_result = QFlagGenResult.ErrorDuringProcessing
-            log_progress('Restoring module content')
-            with open(flag_info.module_path, 'w') as f:
-                f.write(old_mod_content)
-            os.unlink(test_qflag_fname)
-        else:
-            log_progress('Running mypy %s' % test_qflag_fname)
-            p = subprocess.run(['mypy', test_qflag_fname])
-            if p.returncode != 0:
-                error_msg += 'mypy failed\n'
-                # Re-run the same command to capture the output in the error message
-                # in the first run, the stdout/stderr was simply displayed and not captured
-                # here, we want to capture it and not display it
-                p = subprocess.run(['mypy', test_qflag_fname],
-                                   stdout=subprocess.PIPE, stderr=subprocess.STDOUT, encoding='utf8')
-                error_msg += p.stdout
-                gen_result = QFlagGenResult.ErrorDuringProcessing
-                log_progress('Restoring module content')
-                with open(flag_info.module_path, 'w') as f:
-                    f.write(old_mod_content)
-                os.unlink(test_qflag_fname)
-            else:
-                log_progress('validation completed successfully')
-                result_json['qflag_processed_done'].append(flag_info_dict)
-
-                if auto_commit:
-                    log_progress('Performing git commit')
-                    subprocess.run(['git', 'add', test_qflag_fname, flag_info.module_path])
-                    subprocess.run(['git', 'commit', '-m', 'QFlag operations for %s, %s in module %s' %
-                          (flag_info.qflag_full_class_name, flag_info.enum_full_class_name, flag_info.module_name)])
+        store.add('qflag_processed_done', flag_info_dict)
 
     if gen_result == QFlagGenResult.CodeAlreadyModified:
         # qflag methods are already there, check that the test filename is here too
+        test_qflag_fname = gen_test_fname(flag_info)
         if os.path.exists(test_qflag_fname):
             log_progress('QFlag %s %s already supported by %s' % (flag_info.qflag_class,
                                                                   flag_info.enum_class,
                                                                   flag_info.module_name))
-            result_json['qflag_already_done'].append(flag_info_dict)
+            store.add('qflag_already_done', flag_info_dict)
         else:
             error_msg += 'QFlag methods presents but test file %s is missing\n' % test_qflag_fname
             gen_result = QFlagGenResult.ErrorDuringProcessing
@@ -477,35 +735,220 @@ def process_qflag(qflag_to_process_json: str, qflag_result_json: str, auto_commi
                                                               flag_info.enum_class))
         print(error_msg)
         flag_info_dict['error'] = error_msg.splitlines()
-        result_json['qflag_process_error'].append(flag_info_dict)
+        store.add('qflag_process_error', flag_info_dict)
 
-    # save our processing result
-    with open(qflag_result_json, 'w') as f:
-        json.dump(result_json, f, indent=4)
 
-    # return True to indicate that more flags may be processed
-    log_progress('.')
-    return len(qflags_to_process)
+def validate_qflags(flags: List[QFlagLocationInfo], batch_edits: Dict[int, List['QFlagClassEdit']]
+                    ) -> Tuple[List[QFlagLocationInfo], List[Tuple[QFlagLocationInfo, str]]]:
+    """Validate the stubs and the test files generated for the flags, all together.
+
+    If the validation fails, the failing flags are found by bisection. Their test files are removed
+    and their classes are reverted to the ones recorded in batch_edits.
+
+    Return the validated flags and the failing flags with the output of their validation
+    """
+    failures = find_failing_qflags(flags, batch_edits, apply_stubs=False)
+    if not failures:
+        log_progress('validation completed successfully')
+        return flags, []
+
+    failing_flags = [id(flag_info) for flag_info, _error_msg in failures]
+    validated_flags = [flag_info for flag_info in flags if id(flag_info) not in failing_flags]
+    for flag_info, _error_msg in failures:
+        os.unlink(gen_test_fname(flag_info))
+
+    log_progress('Reverting the classes of the failing flags')
+    apply_qflag_stubs(validated_flags, batch_edits)
+
+    if validated_flags:
+        # the flags validated separately by the bisection may still fail together
+        ok, error_msg = run_qflag_tests([gen_test_fname(flag_info) for flag_info in validated_flags])
+        if not ok:
+            log_progress('Validated flags fail together, restoring module content')
+            apply_qflag_stubs([], batch_edits)
+            for flag_info in validated_flags:
+                os.unlink(gen_test_fname(flag_info))
+            failures += [(flag_info, error_msg) for flag_info in validated_flags]
+            validated_flags = []
+
+    return validated_flags, failures
 
+
+def find_failing_qflags(flags: List[QFlagLocationInfo], batch_edits: Dict[int, List['QFlagClassEdit']],
+                        apply_stubs: bool = True) -> List[Tuple[QFlagLocationInfo, str]]:
+    """Bisect the flags to find the ones whose stubs or test files fail the validation.
+
+    If apply_stubs is True, only the stubs of the flags are applied to the modules before validating
+    them, the other classes of batch_edits are reverted.
+
+    Return the failing flags with the output of their validation
+    """
+    if apply_stubs:
+        apply_qflag_stubs(flags, batch_edits)
+
+    ok, error_msg = run_qflag_tests([gen_test_fname(flag_info) for flag_info in flags])
+    if ok:
+        return []
+
+    if len(flags) == 1:
+        return [(flags[0], error_msg)]
+
+    log_progress('Validation of %d flags failed, bisecting' % len(flags))
+    middle = len(flags) // 2
+    return find_failing_qflags(flags[:middle], batch_edits) \
+           + find_failing_qflags(flags[middle:], batch_edits)
+
+
+def apply_qflag_stubs(flags: List[QFlagLocationInfo], batch_edits: Dict[int, List['QFlagClassEdit']]) -> None:
+    """Put in the modules the classes generated for the flags and the original classes of the other
+    flags of batch_edits, then write the modules which changed"""
+    applied_flags = set(id(flag_info) for flag_info in flags)
+    for flag_id, edits in batch_edits.items():
+        for edit in edits:
+            if flag_id in applied_flags:
+                old_node, new_node = edit.original_node, edit.updated_node
+            else:
+                old_node, new_node = edit.updated_node, edit.original_node
+
+            mod_cst = retrieve_module_to_update(edit.module_name, edit.module_path)
+            if find_class_node_path(mod_cst, old_node) is not None:
+                local_cst_pending_modules[edit.module_name] = (
+                    edit.module_path, replace_class_node(mod_cst, old_node, new_node))
+
+    write_pending_modules()
+
+
+def run_qflag_tests(test_fnames: List[str]) -> Tuple[bool, str]:
+    """Run pytest then mypy on the test files, in this process.
+
+    Return whether both succeeded and the output of the failing one
+    """
+    import pytest
+    from mypy import api as mypy_api
+
+    log_progress('Running pytest on %d test files' % len(test_fnames))
+    pytest_output = io.StringIO()
+    with contextlib.redirect_stdout(pytest_output):
+        exit_code = pytest.main(['-v', '--capture=no'] + test_fnames)
+    print(pytest_output.getvalue())
+    if exit_code != 0:
+        return False, 'pytest failed:\n' + pytest_output.getvalue()
+
+    log_progress('Running mypy on %d test files' % len(test_fnames))
+    stdout, stderr, exit_code = mypy_api.run(test_fnames)
+    print(stdout + stderr)
+    if exit_code != 0:
+        return False, 'mypy failed\n' + stdout + stderr
+
+    return True, ''
+
+
+# the parsed modules are kept between two runs in this directory, see save_cst_module_cache()
+CST_CACHE_DIR = os.path.join('.cst_cache', 'libcst-%s' % LIBCST_VERSION)
+
+# for each module name, the hash of the module content and the parsed module
 local_cst_module_cache: Dict[str, Tuple[str, cst.Module]] = {}
 
+
+def hash_module_content(mod_content: str) -> str:
+    return hashlib.sha256(mod_content.encode('utf8')).hexdigest()
+
+
+def cst_cache_fname(mod_name: str, content_hash: str) -> str:
+    return os.path.join(CST_CACHE_DIR, '%s-%s.pickle' % (mod_name, content_hash))
+
+
 def retrieve_cst_parsed_module(mod_name: str, mod_content: str) -> cst.Module:
-    '''Return the cst parsed module and cache the result for each module name'''
+    '''Return the cst parsed module and cache the result for each module name
+
+    The parsed module is looked up by the hash of the module content, in memory then in the
+    cache directory written at the end of the previous runs.
+    '''
+    content_hash = hash_module_content(mod_content)
     if mod_name in local_cst_module_cache:
-        cached_mod_content, cached_parsed_module = local_cst_module_cache[mod_name]
-        if cached_mod_content == mod_content:
+        cached_hash, cached_parsed_module = local_cst_module_cache[mod_name]
+        if cached_hash == content_hash:
             log_progress('Returning cached %s parse results' % mod_name)
             return cached_parsed_module
         else:
             log_progress('Updating cache for module %s' % mod_name)
-    else:
-        log_progress('Parsing module %s and adding it to cache' % mod_name)
 
-    parsed_module = cst.parse_module(mod_content)
-    local_cst_module_cache[mod_name] = (mod_content, parsed_module)
+    parsed_module = load_cst_parsed_module(mod_name, content_hash)
+    if parsed_module is None:
+        log_progress('Parsing module %s and adding it to cache' % mod_name)
+        parsed_module = cst.parse_module(mod_content)
+    local_cst_module_cache[mod_name] = (content_hash, parsed_module)
     return parsed_module
 
 
+def cache_cst_parsed_module(mod_name: str, mod_content: str, parsed_module: cst.Module) -> None:
+    '''Cache a parsed module generated from a transformation, whose code is mod_content'''
+    local_cst_module_cache[mod_name] = (hash_module_content(mod_content), parsed_module)
+
+
+def load_cst_parsed_module(mod_name: str, content_hash: str) -> Optional[cst.Module]:
+    '''Return the parsed module saved in the cache directory, or None if it is not there'''
+    fname = cst_cache_fname(mod_name, content_hash)
+    if not os.path.exists(fname):
+        return None
+
+    log_progress('Loading module %s parse results from %s' % (mod_name, fname))
+    try:
+        with open(fname, 'rb') as f:
+            parsed_module = pickle.load(f)
+    except Exception:
+        log_progress('Could not load %s, the module is parsed again' % fname)
+        return None
+    return cast(cst.Module, parsed_module)
+
+
+# for each module name, the module path and the parsed module with the changes of the current batch,
+# which are not written yet, see write_pending_modules()
+local_cst_pending_modules: Dict[str, Tuple[str, cst.Module]] = {}
+
+
+def retrieve_module_to_update(mod_name: str, module_path: str) -> cst.Module:
+    '''Return the parsed module with the pending changes of the batch, or the parsed module file'''
+    if mod_name in local_cst_pending_modules:
+        log_progress('Returning module %s with pending changes' % mod_name)
+        return local_cst_pending_modules[mod_name][1]
+
+    log_progress('Opening module %s' % mod_name)
+    with open(module_path) as f:
+        mod_content = f.read()
+    return retrieve_cst_parsed_module(mod_name, mod_content)
+
+
+def write_pending_modules() -> None:
+    '''Write the modules with pending changes and cache them under their new content'''
+    for mod_name, (module_path, mod_cst) in local_cst_pending_modules.items():
+        log_progress('Saving updated module %s' % mod_name)
+        mod_content = mod_cst.code
+        with open(module_path, 'w') as f:
+            f.write(mod_content)
+        cache_cst_parsed_module(mod_name, mod_content, mod_cst)
+    local_cst_pending_modules.clear()
+
+
+def save_cst_module_cache() -> None:
+    '''Save the parsed modules cached in memory to the cache directory, for the next runs.
+
+    Only the last parsed module of each module name is kept.
+    '''
+    os.makedirs(CST_CACHE_DIR, exist_ok=True)
+    for mod_name, (content_hash, parsed_module) in local_cst_module_cache.items():
+        fname = cst_cache_fname(mod_name, content_hash)
+        if not os.path.exists(fname):
+            log_progress('Saving module %s parse results to %s' % (mod_name, fname))
+            with open(fname + '.tmp', 'wb') as f:
+                pickle.dump(parsed_module, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(fname + '.tmp', fname)
+
+        for old_fname in glob.glob(os.path.join(CST_CACHE_DIR, '%s-*.pickle' % mod_name)):
+            if old_fname != fname:
+                os.unlink(old_fname)
+
+
 class QFlagGenResult(Enum):
     """Enum indicating the result of generating the possibly missing stubs on the qflag classes"""
     CodeModifiedSuccessfully = 0
@@ -513,7 +956,7 @@ class QFlagGenResult(Enum):
     ErrorDuringProcessing = 2
 
 
-def generate_missing_stubs(flag_info: 'QFlagLocationInfo') -> Tuple[QFlagGenResult, str, str]:
+def generate_missing_stubs(flag_info: 'QFlagLocationInfo') -> Tuple[QFlagGenResult, str, List['QFlagClassEdit']]:
     """
     Check that the QFlag enum+class are present in the module and check whether they support
     all the advanced QFlag operations.
@@ -535,66 +978,48 @@ def generate_missing_stubs(flag_info: 'QFlagLocationInfo') -> Tuple[QFlagGenResu
         +       def __or__ (self, other: 'Qt.KeyboardModifier') -> 'Qt.KeyboardModifiers': ...  # type: ignore[override]
         +       def __ror__ (self, other: int) -> 'Qt.KeyboardModifiers': ...             # type: ignore[override, misc]
 
-    2. On the qflag class, add one more overload of __init__()
-        +       @typing.overload
-        +       def __init__(self, f: int) -> None: ...
+    2. On the qflag class, inherit all the operations from the generic QFlags base of QtCore,
+       instead of the methods generated by sip:
+        -   class KeyboardModifiers(sip.simplewrapper):
+        -       @typing.overload
+        -       def __init__(self) -> None: ...
+        -       [...]
+        -       def __int__(self) -> int: ...
+        +   class KeyboardModifiers(QtCore._QFlags['Qt.KeyboardModifier']): ...
 
-    3. On the qflag class, add more methods:
-        +   def __or__ (self, other: typing.Union['Qt.KeyboardModifiers', 'Qt.KeyboardModifier', int]) -> 'Qt.KeyboardModifiers': ...
-        +   def __and__(self, other: typing.Union['Qt.KeyboardModifiers', 'Qt.KeyboardModifier', int]) -> 'Qt.KeyboardModifiers': ...
-        +   def __xor__(self, other: typing.Union['Qt.KeyboardModifiers', 'Qt.KeyboardModifier', int]) -> 'Qt.KeyboardModifiers': ...
-        +   def __ror__ (self, other: 'Qt.KeyboardModifier') -> 'Qt.KeyboardModifiers': ...
-        +   def __rand__(self, other: 'Qt.KeyboardModifier') -> 'Qt.KeyboardModifiers': ...
-        +   def __rxor__(self, other: 'Qt.KeyboardModifier') -> 'Qt.KeyboardModifiers': ...
+    The module is not written: the changes are applied to the parsed module kept in memory, so
+    that the next flags of the same module do not parse it again. Call write_pending_modules()
+    to write it.
 
-    Returns a tuple of (QFlagGenResult, error_msg, mod_content):
+    Returns a tuple of (QFlagGenResult, error_msg, edits):
     * CodeModifiedSuccessfully:
         All modifications to the code of the module have been performed successfully.
         Error message is empty.
-        mod_content contains the full text of the module. If when performing verifications on this
-        change, it turns out that the change is not valid, you can restore the module to its
-        previous content using mod_content
+        edits contains the classes replaced in the module. If when performing verifications on this
+        change, it turns out that the change is not valid, you can revert the classes to their
+        original node with apply_qflag_stubs()
 
     * CodeAlreadyModified:
         All modifications to the code were already done, no processing done.
         Error message also indicates this information.
-        mod_content is empty (not useful)
+        edits is empty (not useful)
 
     * ErrorDuringProcessing:
         Some error occured during the processing, such as some modifications were partially done,
         class not found, class found multiple times, ...
 
         The detail of the error is provided in the second argument of the return value.
-        mod_content is empty (not useful)
+        edits is empty (not useful)
 """
-    log_progress('Opening module %s' % flag_info.module_name)
-    with open(flag_info.module_path) as f:
-        mod_content = f.read()
-
-    mod_cst = retrieve_cst_parsed_module(flag_info.module_name, mod_content)
-
-    log_progress('Looking for class %s and %s in module %s, index %d' %
-                 (flag_info.qflag_class, flag_info.enum_class, flag_info.module_name, flag_info.module_idx))
-    if len(flag_info.human_hint_enum_full_class_name) and len(flag_info.human_hint_qflag_full_class_name):
-        log_progress('Using hints: %s and %s' % (flag_info.human_hint_enum_full_class_name, flag_info.human_hint_qflag_full_class_name))
-    visitor = QFlagAndEnumFinder(flag_info.enum_class, flag_info.qflag_class,
-                                 flag_info.module_count, flag_info.module_idx,
-                                 flag_info.human_hint_enum_full_class_name,
-                                 flag_info.human_hint_qflag_full_class_name,
-                                 )
-    mod_cst.visit(visitor)
+    mod_cst = retrieve_module_to_update(flag_info.module_name, flag_info.module_path)
 
-    # storing the enum_values + full class name for further usage
-    flag_info.enum_full_class_name = visitor.enum_class_full_name
-    flag_info.enum_value1 = visitor.enum_value1
-    flag_info.enum_value2 = visitor.enum_value2
-    flag_info.qflag_full_class_name = visitor.qflag_class_full_name
+    visitor = find_qflag_and_enum(mod_cst, flag_info)
 
     if visitor.enum_class_full_name == '':
-        return (QFlagGenResult.ErrorDuringProcessing, 'Could not locate class %s' % visitor.enum_class_name, '')
+        return (QFlagGenResult.ErrorDuringProcessing, 'Could not locate class %s' % visitor.enum_class_name, [])
 
     if visitor.qflag_class_full_name == '':
-        return (QFlagGenResult.ErrorDuringProcessing, 'Could not locate class %s' % visitor.qflag_class_name, '')
+        return (QFlagGenResult.ErrorDuringProcessing, 'Could not locate class %s' % visitor.qflag_class_name, [])
 
     # evaluate exact behavior of QFlag
     try:
@@ -603,7 +1028,7 @@ def generate_missing_stubs(flag_info: 'QFlagLocationInfo') -> Tuple[QFlagGenResu
             qtmodule=flag_info.module_name,
             oneFlagName=flag_info.enum_full_class_name))
     except Exception as exc:
-        return (QFlagGenResult.ErrorDuringProcessing, traceback.format_exc(), '')
+        return (QFlagGenResult.ErrorDuringProcessing, traceback.format_exc(), [])
 
     flag_info.or_int_converts_to_multi = not eval('''type({qtmodule}.{oneFlagName}.{value1} | 33) == int'''.format(
         value1=flag_info.enum_value1, qtmodule = flag_info.module_name, oneFlagName = flag_info.enum_full_class_name))
@@ -621,8 +1046,69 @@ def generate_missing_stubs(flag_info: 'QFlagLocationInfo') -> Tuple[QFlagGenResu
     except TypeError:
         flag_info.supports_one_op_multi = False
 
+    gen_result = check_qflag_methods_present(visitor, flag_info)
+    if gen_result is not None:
+        return (gen_result, visitor.error_msg, [])
+
+    log_progress('Found %s and %s' % (flag_info.qflag_full_class_name, flag_info.enum_full_class_name))
+
+    print('enum behavior:')
+    print('- or_converts_to_multi: ', flag_info.or_converts_to_multi)
+    print('- or_int_converts_to_multi: ', flag_info.or_int_converts_to_multi)
+    print('- int_or_converts_to_multi: ', flag_info.int_or_converts_to_multi)
+    print('- supports_one_op_multi: ', flag_info.supports_one_op_multi)
+
+    updated_mod_cst, edits, error_msg = add_qflag_methods(mod_cst, visitor, flag_info)
+    if error_msg:
+        return (QFlagGenResult.ErrorDuringProcessing, error_msg, [])
+
+    # the next flag of this module is generated on the updated module, which is written with
+    # write_pending_modules()
+    local_cst_pending_modules[flag_info.module_name] = (flag_info.module_path, updated_mod_cst)
+
+    return (QFlagGenResult.CodeModifiedSuccessfully, '', edits)
+
+
+def find_qflag_and_enum(mod_cst: cst.Module, flag_info: QFlagLocationInfo) -> 'QFlagAndEnumFinder':
+    """Locate the qflag and enum classes of flag_info in the parsed module.
+
+    The classes are looked up by their full class names, from the human hints or else from the
+    analysis, and only by their index in the module when these are not known.
+
+    flag_info is completed in-place with the full class names and two enum values.
+    Return the visitor, which describes which qflag methods are already present.
+    """
+    log_progress('Looking for class %s and %s in module %s, index %d' %
+                 (flag_info.qflag_class, flag_info.enum_class, flag_info.module_name, flag_info.module_idx))
+    enum_full_class_name = flag_info.human_hint_enum_full_class_name or flag_info.enum_full_class_name
+    qflag_full_class_name = flag_info.human_hint_qflag_full_class_name or flag_info.qflag_full_class_name
+    if len(enum_full_class_name) and len(qflag_full_class_name):
+        log_progress('Using full class names: %s and %s' % (enum_full_class_name, qflag_full_class_name))
+    visitor = QFlagAndEnumFinder(flag_info.enum_class, flag_info.qflag_class,
+                                 flag_info.module_count, flag_info.module_idx,
+                                 enum_full_class_name,
+                                 qflag_full_class_name,
+                                 )
+    mod_cst.visit(visitor)
+
+    # storing the enum_values + full class name for further usage
+    flag_info.enum_full_class_name = visitor.enum_class_full_name
+    flag_info.enum_value1 = visitor.enum_value1
+    flag_info.enum_value2 = visitor.enum_value2
+    flag_info.qflag_full_class_name = visitor.qflag_class_full_name
+    return visitor
+
+
+def check_qflag_methods_present(visitor: 'QFlagAndEnumFinder',
+                                flag_info: QFlagLocationInfo) -> Optional[QFlagGenResult]:
+    """Check whether the qflag methods found by the visitor need to be generated.
+
+    Return None if the methods must be generated, CodeAlreadyModified if nothing is to be done
+    and ErrorDuringProcessing if the methods are partially present. In the latter case, the
+    details are added to visitor.error_msg
+    """
     if (visitor.enum_methods_present, visitor.qflag_method_present) == (MethodPresent.All, MethodPresent.All):
-        return (QFlagGenResult.CodeAlreadyModified, visitor.error_msg, '')
+        return QFlagGenResult.CodeAlreadyModified
 
     if (visitor.enum_methods_present, visitor.qflag_method_present) == (MethodPresent.All, MethodPresent.Not):
         visitor.error_msg += 'Enum methods are present but not QFlag methods\n'
@@ -636,37 +1122,138 @@ def generate_missing_stubs(flag_info: 'QFlagLocationInfo') -> Tuple[QFlagGenResu
             visitor.error_msg += 'QFlag methods are present but not Enum methods\n'
         else:
             # it's ok
-            return (QFlagGenResult.CodeAlreadyModified, visitor.error_msg, '')
+            return QFlagGenResult.CodeAlreadyModified
 
     if visitor.error_msg:
-        return (QFlagGenResult.ErrorDuringProcessing, visitor.error_msg, '')
+        return QFlagGenResult.ErrorDuringProcessing
 
-    log_progress('Found %s and %s' % (flag_info.qflag_full_class_name, flag_info.enum_full_class_name))
+    return None
 
-    print('enum behavior:')
-    print('- or_converts_to_multi: ', flag_info.or_converts_to_multi)
-    print('- or_int_converts_to_multi: ', flag_info.or_int_converts_to_multi)
-    print('- int_or_converts_to_multi: ', flag_info.int_or_converts_to_multi)
-    print('- supports_one_op_multi: ', flag_info.supports_one_op_multi)
 
+@dataclasses.dataclass
+class QFlagClassEdit:
+    """A class of a module replaced by the generation of the qflag methods, kept to revert it"""
+    module_name: str
+    module_path: str
+    original_node: cst.ClassDef
+    updated_node: cst.ClassDef
+
+
+def add_qflag_methods(mod_cst: cst.Module, visitor: 'QFlagAndEnumFinder',
+                      flag_info: QFlagLocationInfo) -> Tuple[cst.Module, List[QFlagClassEdit], str]:
+    """Add the qflag methods to the classes located by the visitor, following the
+    or behavior recorded in flag_info.
+
+    Only the two classes and the classes enclosing them are rebuilt, the rest of the module is
+    shared with mod_cst.
+
+    Return the updated module, the classes replaced and an error message, empty on success.
+    """
     log_progress('Updating module %s by adding new methods' % flag_info.module_name)
-    transformer = QFlagAndEnumUpdater(visitor.enum_class_name, visitor.enum_class_full_name,
-                                      visitor.qflag_class_name, visitor.qflag_class_full_name, flag_info.module_idx,
-                                      flag_info.human_hint_enum_full_class_name,
-                                      flag_info.human_hint_qflag_full_class_name,
-                                      flag_info.or_converts_to_multi,
-                                      flag_info.or_int_converts_to_multi,
-                                      flag_info.int_or_converts_to_multi)
-    updated_mod_cst = mod_cst.visit(transformer)
+    updater = QFlagAndEnumUpdater(visitor.enum_class_full_name, visitor.qflag_class_full_name,
+                                  flag_info.or_converts_to_multi,
+                                  flag_info.or_int_converts_to_multi,
+                                  flag_info.int_or_converts_to_multi)
+    assert visitor.enum_class_node is not None and visitor.qflag_class_node is not None
+    edits = [QFlagClassEdit(flag_info.module_name, flag_info.module_path, visitor.enum_class_node,
+                            updater.transform_enum_class(visitor.enum_class_node)),
+             QFlagClassEdit(flag_info.module_name, flag_info.module_path, visitor.qflag_class_node,
+                            updater.transform_qflag_class(visitor.qflag_class_node))]
+    edits = [edit for edit in edits if edit.updated_node is not edit.original_node]
+
+    updated_mod_cst = mod_cst
+    try:
+        for edit in edits:
+            updated_mod_cst = replace_class_node(updated_mod_cst, edit.original_node, edit.updated_node)
+    except ValueError as exc:
+        return mod_cst, [], str(exc)
+    return updated_mod_cst, edits, ''
+
+
+def nested_nodes(node: cst.CSTNode) -> List[cst.CSTNode]:
+    """Return the statements of a module or of a block, and the blocks of a compound statement,
+    ie the bodies, else clauses and except handlers of a class, an if or a try"""
+    if isinstance(node, (cst.Module, cst.IndentedBlock)):
+        return list(node.body)
+    if (not isinstance(node, (cst.BaseCompoundStatement, cst.Else, cst.ExceptHandler, cst.Finally))
+            or isinstance(node, cst.FunctionDef)):
+        # the stubs do not define classes inside functions
+        return []
+    nodes: List[cst.CSTNode] = []
+    for attr in ('body', 'handlers', 'orelse', 'finalbody'):
+        value = getattr(node, attr, None)
+        if isinstance(value, Sequence):
+            nodes.extend(value)
+        elif value is not None:
+            nodes.append(value)
+    return nodes
+
+
+def find_class_node_path(node: cst.CSTNode, class_node: cst.ClassDef) -> Optional[List[cst.CSTNode]]:
+    """Return the nodes leading from node to class_node, through the blocks of the enclosing
+    classes and compound statements, or None if class_node is not there"""
+    if node is class_node:
+        return [node]
+    for child in nested_nodes(node):
+        path = find_class_node_path(child, class_node)
+        if path is not None:
+            return [node] + path
+    return None
+
+
+def replace_child_node(parent: cst.CSTNode, child: cst.CSTNode, new_child: cst.CSTNode) -> cst.CSTNode:
+    """Return parent with its direct child replaced by new_child"""
+    for field in dataclasses.fields(parent):
+        value = getattr(parent, field.name)
+        if value is child:
+            return parent.with_changes(**{field.name: new_child})
+        if isinstance(value, Sequence) and any(item is child for item in value):
+            return parent.with_changes(**{field.name: [new_child if item is child else item
+                                                       for item in value]})
+    raise ValueError('Node %s is not a child of %s' % (type(child).__name__, type(parent).__name__))
+
+
+def replace_class_node(mod_cst: cst.Module, class_node: cst.ClassDef, new_class_node: cst.ClassDef) -> cst.Module:
+    """Replace the node class_node of the module with new_class_node.
+
+    This rebuilds only the classes and the blocks enclosing class_node, where a transformer would
+    rebuild every node of the module.
+    """
+    path = find_class_node_path(mod_cst, class_node)
+    if path is None:
+        raise ValueError('Class %s not found in module' % class_node.name.value)
+
+    new_node: cst.CSTNode = new_class_node
+    for parent, child in zip(reversed(path[:-1]), reversed(path[1:])):
+        new_node = replace_child_node(parent, child, new_node)
+    return cast(cst.Module, new_node)
 
-    if transformer.error_msg:
-        return (QFlagGenResult.ErrorDuringProcessing, visitor.error_msg, '')
 
-    log_progress('Saving updated module %s' % flag_info.module_name)
-    with open(flag_info.module_path, 'w') as f:
-        f.write(updated_mod_cst.code)
+def complete_qflag_stubs(mod_cst: cst.Module, flag_info: QFlagLocationInfo) -> Tuple[QFlagGenResult, str, cst.Module]:
+    """Add the missing qflag methods of an already processed flag to the parsed module.
 
-    return (QFlagGenResult.CodeModifiedSuccessfully, '', mod_content)
+    flag_info comes from qflags_process_result.json, so the or behavior of the flag is already
+    known and PyQt5 is not evaluated. This is used to restore the qflag operations on freshly
+    regenerated upstream stubs.
+
+    Return a tuple of (QFlagGenResult, error_msg, updated module)
+    """
+    visitor = find_qflag_and_enum(mod_cst, flag_info)
+    if visitor.enum_class_full_name == '':
+        return (QFlagGenResult.ErrorDuringProcessing, 'Could not locate class %s' % visitor.enum_class_name, mod_cst)
+
+    if visitor.qflag_class_full_name == '':
+        return (QFlagGenResult.ErrorDuringProcessing, 'Could not locate class %s' % visitor.qflag_class_name, mod_cst)
+
+    gen_result = check_qflag_methods_present(visitor, flag_info)
+    if gen_result is not None:
+        return (gen_result, visitor.error_msg, mod_cst)
+
+    updated_mod_cst, _edits, error_msg = add_qflag_methods(mod_cst, visitor, flag_info)
+    if error_msg:
+        return (QFlagGenResult.ErrorDuringProcessing, error_msg, mod_cst)
+
+    return (QFlagGenResult.CodeModifiedSuccessfully, '', updated_mod_cst)
 
 
 class MethodPresent(Enum):
@@ -693,7 +1280,8 @@ class QFlagAndEnumFinder(cst.CSTVisitor):
         self.enum_class_name = enum_class
         self.qflag_class_name = qflag_class
 
-        # human help for finding the class
+        # the full class names, from a human hint or from the analysis, used to find the classes
+        # instead of their index
         if human_hint_enum_full_class_name:
             self.human_hint_enum_full_class_name = human_hint_enum_full_class_name.split('.')
         else:
@@ -723,7 +1311,9 @@ class QFlagAndEnumFinder(cst.CSTVisitor):
         self.enum_value1 = ''
         self.enum_value2 = ''
 
-        # the node of the class, for debugging purpose
+        # the node of the classes, to update them in place (see replace_class_node())
+        self.enum_class_node: Optional[cst.ClassDef] = None
+        self.qflag_class_node: Optional[cst.ClassDef] = None
 
         # when filled, set to one of the MethodPresent values
         self.enum_methods_present = MethodPresent.Unset
@@ -753,6 +1343,7 @@ class QFlagAndEnumFinder(cst.CSTVisitor):
             if found_enum_class:
                 if self.check_enum_method_present(node):
                     self.enum_class_full_name = '.'.join(self.full_name_stack)
+                    self.enum_class_node = node
                     self.collect_enum_values(node)
                 return None
 
@@ -774,6 +1365,7 @@ class QFlagAndEnumFinder(cst.CSTVisitor):
             if found_qflag_class:
                 if self.check_qflag_method_present(node):
                     self.qflag_class_full_name = '.'.join(self.full_name_stack)
+                    self.qflag_class_node = node
                 return None
 
         return None
@@ -781,8 +1373,10 @@ class QFlagAndEnumFinder(cst.CSTVisitor):
 
     def check_enum_method_present(self, enum_node: cst.ClassDef) -> bool:
         """Check if the class contains method __or__ and __ror__ with one argument and if class
-        inherit from int"""
-        if len(enum_node.bases) == 0 or enum_node.bases[0].value.value != 'int':
+        inherit from int or enum.IntEnum"""
+        if len(enum_node.bases) == 0 or not matchers.matches(enum_node.bases[0].value, matchers.OneOf(
+                matchers.Name('int'),
+                matchers.Attribute(value=matchers.Name('enum'), attr=matchers.Name('IntEnum')))):
             # class does not inherit from int, not the one we are looking for
             return False
         has_or = matchers.findall(enum_node.body, matchers.FunctionDef(name=matchers.Name('__or__')))
@@ -835,7 +1429,13 @@ class QFlagAndEnumFinder(cst.CSTVisitor):
 
         def __init__(self, f: typing.Union['Qt.KeyboardModifiers', 'Qt.KeyboardModifier']) -> None:
         def __init__(self, f: typing.Union['Qt.KeyboardModifiers', 'Qt.KeyboardModifier', int]) -> None:
+
+        or if the class inherits all of them from the generic QFlags base.
         """
+        if len(qflag_node.bases) and is_qflags_base(qflag_node.bases[0]):
+            self.qflag_method_present = MethodPresent.All
+            return True
+
         if (len(qflag_node.bases) == 0
            or not (matchers.matches(qflag_node.bases[0],
                                          matchers.Arg(value=matchers.Attribute(value=matchers.Name('sip'),
@@ -892,96 +1492,21 @@ class QFlagAndEnumFinder(cst.CSTVisitor):
         self.full_name_stack.pop()
 
 
-class QFlagAndEnumUpdater(cst.CSTTransformer):
+class QFlagAndEnumUpdater:
+    """Generate the updated enum and qflag classes of a flag, located by QFlagAndEnumFinder"""
 
-    def __init__(self, enum_class: str, enum_full_name: str, qflag_class: str, qflag_full_name: str,
-                 module_idx: int,
-                 human_hint_enum_full_class_name: str,
-                 human_hint_qflag_full_class_name: str,
+    def __init__(self, enum_full_name: str, qflag_full_name: str,
                  or_converts_to_multi: bool,
                  or_int_converts_to_multi: bool,
                  int_or_converts_to_multi: bool) -> None:
-        super().__init__()
-
-        # used internally to generate the full class name
-        self.full_name_stack: List[str] = []
-
-        self.error_msg = ''
-
-        # the class name we are looking for
-        self.enum_class = enum_class
-        self.qflag_class = qflag_class
         self.enum_full_name = enum_full_name
         self.qflag_full_name = qflag_full_name
 
-        # human help for finding the class
-        self.human_hint_enum_full_class_name = ''
-        if human_hint_enum_full_class_name:
-            self.human_hint_enum_full_class_name = human_hint_enum_full_class_name.split('.')
-        self.human_hint_qflag_full_class_name = ''
-        if human_hint_qflag_full_class_name:
-            self.human_hint_qflag_full_class_name = human_hint_qflag_full_class_name.split('.')
-
-        # the index in this module of the  class we are looking for
-        self.module_idx = module_idx
-
-        # our current count of visit
-        self.visit_enum_idx = -1
-        self.visit_qflag_idx = -1
-
         self.or_converts_to_multi = or_converts_to_multi
         self.or_int_converts_to_multi = or_int_converts_to_multi
         self.int_or_converts_to_multi = int_or_converts_to_multi
 
-        # set when enum_methods_present is set to partial, to add more contect information
-        self.error_msg = ''
-
-    def visit_ClassDef(self, node: cst.ClassDef) -> Optional[bool]:
-        self.full_name_stack.append( node.name.value )
-        return None
-
-    def visit_FunctionDef(self, node: cst.FunctionDef) -> Optional[bool]:
-        self.full_name_stack.append( node.name.value )
-        return None
-
-    def leave_FunctionDef(self, node: cst.FunctionDef, updated_node: cst.FunctionDef) -> cst.FunctionDef:
-        self.full_name_stack.pop()
-        return updated_node
-
-    def leave_ClassDef(self, original_node: cst.ClassDef, updated_node: cst.ClassDef) -> cst.ClassDef:
-        found_enum_class = False
-        found_qflag_class = False
-
-        if self.human_hint_enum_full_class_name:
-            if self.human_hint_enum_full_class_name == self.full_name_stack:
-                found_enum_class = True
-        else:
-            if original_node.name.value == self.enum_class:
-                self.visit_enum_idx += 1
-                if self.visit_enum_idx == self.module_idx:
-                    found_enum_class = True
-
-        if self.human_hint_qflag_full_class_name:
-            if self.human_hint_qflag_full_class_name == self.full_name_stack:
-                found_qflag_class = True
-        else:
-            if original_node.name.value == self.qflag_class:
-                self.visit_qflag_idx += 1
-                if self.visit_qflag_idx == self.module_idx:
-                    found_qflag_class = True
-
-        self.full_name_stack.pop()
-
-        if found_enum_class:
-            return self.transform_enum_class(original_node, updated_node)
-
-        if found_qflag_class:
-            return self.transform_qflag_class(original_node, updated_node)
-
-        return updated_node
-
-
-    def transform_enum_class(self, original_node: cst.ClassDef, updated_node: cst.ClassDef) -> cst.ClassDef:
+    def transform_enum_class(self, enum_node: cst.ClassDef) -> cst.ClassDef:
         """Add the two methods __or__ and __ror__ to the class body"""
 
         # we keep comments separated to align them properly in the final file
@@ -998,7 +1523,7 @@ class QFlagAndEnumUpdater(cst.CSTTransformer):
             )
         elif or_behavior == (False, False, False):
             # no changes needed
-            return updated_node
+            return enum_node
         else:
             raise ValueError('Unsupported or behavior:', or_behavior)
 
@@ -1016,69 +1541,108 @@ class QFlagAndEnumUpdater(cst.CSTTransformer):
             for code, comment in new_methods_filled
         )
         new_methods_cst = tuple(cst.parse_statement(s) for s in new_methods_spaced)
-        return updated_node.with_changes(body=updated_node.body.with_changes(body=
+        return enum_node.with_changes(body=enum_node.body.with_changes(body=
              new_methods_cst \
-             + (updated_node.body.body[0].with_changes(leading_lines=
-                                                       updated_node.body.body[0].leading_lines +
-                                                       (cst.EmptyLine(),)),) \
-             + updated_node.body.body[1:] ) )
+             + (enum_node.body.body[0].with_changes(leading_lines=
+                                                    enum_node.body.body[0].leading_lines +
+                                                    (cst.EmptyLine(),)),) \
+             + enum_node.body.body[1:] ) )
 
 
-    def transform_qflag_class(self, original_node: cst.ClassDef, updated_node: cst.ClassDef) -> cst.ClassDef:
+    def transform_qflag_class(self, qflag_node: cst.ClassDef) -> cst.ClassDef:
         """
-        On the qflag class, add one more overload __init__() and add more methods
-        +       @typing.overload
-        +       def __init__(self, f: int) -> None: ...
+        On the qflag class, inherit all the methods from the generic QFlags base:
+        +       class KeyboardModifiers(QtCore._QFlags['Qt.KeyboardModifier']): ...
         """
-        init_methods = matchers.findall(updated_node.body, matchers.FunctionDef(name=matchers.Name('__init__')))
-        if len(init_methods) == 1:
-            # we do not handle the case where there is only one init function
-            # to handle it, we would need to do the following:
-            # * add an @typing.overload to the current init function
-            # * add a new init function
-            #
-            # This is not difficult, it's just that I don't think we have such cases
-            self.error_msg += 'Only one __init__ method in QFlag class %s, do not know how to transform it\n' % self.qflag_full_name
-            return updated_node
+        return derive_from_qflags_base(qflag_node, self.enum_full_name)
 
-        # find the last __init__() method index
-        last_init_idx = 0
-        nb_init_found = 0
-        for i, body_element in enumerate(updated_node.body.body):
-            if matchers.matches(body_element, matchers.FunctionDef(name=matchers.Name('__init__'))):
-                nb_init_found += 1
-                if nb_init_found == len(init_methods):
-                    last_init_idx = i
-                    break
-
-        if last_init_idx == 0:
-            self.error_msg += 'No __init__ method found in class %s' % self.qflag_full_name
-            return updated_node
 
+def is_qflags_base(base: cst.Arg) -> bool:
+    """Return True if the base is the generic QFlags base, like QtCore._QFlags['Qt.KeyboardModifier']"""
+    return matchers.matches(base, matchers.Arg(value=matchers.Subscript(
+        value=matchers.Attribute(value=matchers.Name('QtCore'), attr=matchers.Name('_QFlags')))))
 
-        cst_init = cst.parse_statement( '@typing.overload\ndef __init__(self, f: int) -> None: ...' )
-        updated_node = updated_node.with_changes(body=updated_node.body.with_changes(body=
-                                                 tuple(updated_node.body.body[:last_init_idx+1]) +
-                                                 (cst_init,) +
-                                                 tuple(updated_node.body.body[last_init_idx+1:])
-                                                 )
-                                             )
 
-        new_methods = (
-            "def __or__ (self, other: typing.Union['{qflag}', '{enum}', int]) -> '{qflag}': ...",
-            "def __and__(self, other: typing.Union['{qflag}', '{enum}', int]) -> '{qflag}': ...",
-            "def __xor__(self, other: typing.Union['{qflag}', '{enum}', int]) -> '{qflag}': ...",
-            "def __ror__ (self, other: '{enum}') -> '{qflag}': ...",
-            "def __rand__(self, other: '{enum}') -> '{qflag}': ...",
-            "def __rxor__(self, other: '{enum}') -> '{qflag}': ...",
-        )
-        new_methods_cst = tuple(
-            cst.parse_statement(s.format(enum=self.enum_full_name, qflag=self.qflag_full_name))
-            for s in new_methods
-        )
-        return updated_node.with_changes(body=updated_node.body.with_changes(body=
-                     tuple(updated_node.body.body) + new_methods_cst ) )
+def derive_from_qflags_base(qflag_node: cst.ClassDef, enum_full_name: str) -> cst.ClassDef:
+    """Make the qflag class inherit from the generic QFlags base parametrized with its enum.
+
+    The methods provided by the base are removed from the class, the class body is reduced
+    to an ellipsis when nothing else remains. A sip.wrapper base is kept, the generic base
+    already derives from sip.simplewrapper.
+    """
+    base_methods = matchers.FunctionDef(name=matchers.OneOf(*(matchers.Name(m) for m in QFLAGS_BASE_METHODS)))
+    body = [stmt for stmt in qflag_node.body.body if not matchers.matches(stmt, base_methods)]
+    if body:
+        new_body: cst.BaseSuite = qflag_node.body.with_changes(body=body)
+    else:
+        new_body = cst.SimpleStatementSuite(body=[cst.Expr(cst.Ellipsis())])
+    base = cst.parse_expression("%s['%s']" % (QFLAGS_BASE, enum_full_name))
+    sip_simplewrapper = matchers.Arg(value=matchers.Attribute(value=matchers.Name('sip'),
+                                                              attr=matchers.Name('simplewrapper')))
+    other_bases = [arg.with_changes(comma=cst.MaybeSentinel.DEFAULT) for arg in qflag_node.bases
+                   if not matchers.matches(arg, sip_simplewrapper) and not is_qflags_base(arg)]
+    return qflag_node.with_changes(bases=[cst.Arg(value=base)] + other_bases, body=new_body)
+
+
+def add_qflags_base(mod_cst: cst.Module) -> cst.Module:
+    """Add the definition of the generic QFlags base to the QtCore module, before its first class,
+    if it is not already present."""
+    if matchers.findall(mod_cst, matchers.ClassDef(name=matchers.Name('_QFlags'))):
+        return mod_cst
+
+    base_stub = list(cst.parse_module(QFLAGS_BASE_STUB).body)
+    base_stub[0] = base_stub[0].with_changes(leading_lines=[cst.EmptyLine(), cst.EmptyLine()])
+    body = list(mod_cst.body)
+    first_class_idx = next(i for i, stmt in enumerate(body) if isinstance(stmt, cst.ClassDef))
+    return mod_cst.with_changes(body=body[:first_class_idx] + list(base_stub) + body[first_class_idx:])
+
+
+def annotated_qflag_enum(class_node: cst.ClassDef) -> str:
+    """Return the enum class annotated on the argument of the __ror__ method of a qflag class
+    defining all its methods, like 'QClearBuffers.BufferType', or '' if there is none"""
+    if not isinstance(class_node.body, cst.IndentedBlock):
+        return ''
+    for stmt in class_node.body.body:
+        if not isinstance(stmt, cst.FunctionDef) or stmt.name.value != '__ror__':
+            continue
+        params = stmt.params.params
+        if len(params) != 2 or params[1].annotation is None:
+            return ''
+        annotation = params[1].annotation.annotation
+        if isinstance(annotation, cst.SimpleString):
+            return str(annotation.evaluated_value)
+        return cst.Module([]).code_for_node(annotation)
+    return ''
+
+
+class QFlagBaseConverter(cst.CSTTransformer):
+    """Make a qflag class defining all its methods inherit them from the generic QFlags base.
+
+    The enum class of the base is the one of the existing methods of the qflag class, so that
+    an enum class name present in several classes of the module is not mistaken.
+    """
+
+    def __init__(self, qflag_full_name: str) -> None:
+        super().__init__()
+        self.full_name_stack: List[str] = []
+        self.qflag_full_name = qflag_full_name
+        self.enum_full_name = ''
+        self.converted = False
 
+    def visit_ClassDef(self, node: cst.ClassDef) -> Optional[bool]:
+        self.full_name_stack.append(node.name.value)
+        return None
+
+    def leave_ClassDef(self, original_node: cst.ClassDef, updated_node: cst.ClassDef) -> cst.ClassDef:
+        full_name = '.'.join(self.full_name_stack)
+        self.full_name_stack.pop()
+        if full_name != self.qflag_full_name or (updated_node.bases and is_qflags_base(updated_node.bases[0])):
+            return updated_node
+        self.enum_full_name = annotated_qflag_enum(updated_node)
+        if not self.enum_full_name:
+            return updated_node
+        self.converted = True
+        return derive_from_qflags_base(updated_node, self.enum_full_name)
 
 
 @functools.lru_cache(maxsize=1)
@@ -1202,15 +1766,58 @@ def generate_qflags_to_process(qt_qflag_grep_result_fname: str, module_group: st
     log_progress('qflag file ready to process: %s' % qflags_to_process_json)
 
 
-def regen_test_files(qflag_process_results: str) -> None:
-    with open(qflag_process_results) as f:
-        results_content = f.read()
-    results = json.loads(results_content)
+def read_processed_qflags(qflag_process_results: str) -> List[QFlagLocationInfo]:
+    """Return the qflags which have been processed successfully or were already done,
+    including the results not exported yet to qflag_process_results"""
+    store = QFlagProgressStore(qflag_process_results)
+    return [QFlagLocationInfo(**flag_info_dict) for flag_info_dict in store.processed_flags()]
+
+
+def convert_to_qflags_base(qflag_process_results: str) -> None:
+    """Make the processed qflag classes, which define all their methods, inherit them from
+    the generic QFlags base instead"""
+    flags_per_module: Dict[str, List[QFlagLocationInfo]] = {}
+    for flag_info in read_processed_qflags(qflag_process_results):
+        flags_per_module.setdefault(flag_info.module_path, []).append(flag_info)
+
+    for module_path, flags in sorted(flags_per_module.items()):
+        with open(module_path) as f:
+            mod_content = f.read()
+        mod_cst = cst.parse_module(mod_content)
+
+        nb_converted = 0
+        for flag_info in flags:
+            visitor = find_qflag_and_enum(mod_cst, flag_info)
+            if visitor.qflag_method_present != MethodPresent.All:
+                log_progress('Skipping %s, its methods are not all present' % flag_info.qflag_class)
+                continue
+            qflag_bases = visitor.qflag_class_node.bases if visitor.qflag_class_node else ()
+            if qflag_bases and is_qflags_base(qflag_bases[0]):
+                # already converted
+                continue
+            converter = QFlagBaseConverter(visitor.qflag_class_full_name)
+            mod_cst = mod_cst.visit(converter)
+            if not converter.converted:
+                log_progress('Skipping %s, its __ror__ method has no enum annotation' % flag_info.qflag_class)
+                continue
+            if converter.enum_full_name != visitor.enum_class_full_name:
+                log_progress('Warning! %s uses the enum %s, not %s' % (
+                    visitor.qflag_class_full_name, converter.enum_full_name, visitor.enum_class_full_name))
+            nb_converted += 1
 
-    flags_to_process =  results['qflag_processed_done'] + results['qflag_already_done']
+        if os.path.basename(module_path) == 'QtCore.pyi':
+            mod_cst = add_qflags_base(mod_cst)
+
+        if mod_cst.code != mod_content:
+            with open(module_path, 'w') as f:
+                f.write(mod_cst.code)
+        log_progress('%s: %d qflag classes converted' % (module_path, nb_converted))
+
+
+def regen_test_files(qflag_process_results: str) -> None:
+    flags_to_process = read_processed_qflags(qflag_process_results)
     log_progress('%d test files to regenerate' % len(flags_to_process))
-    for flag_info_dict in flags_to_process:
-        flag_info = QFlagLocationInfo(**flag_info_dict)
+    for flag_info in flags_to_process:
         test_qflag_fname = gen_test_fname(flag_info)
         print('Updating', test_qflag_fname)
         generate_qflag_test_file(flag_info)
@@ -1227,6 +1834,13 @@ if __name__ == '__main__':
     if '--auto-commit' in sys.argv:
         auto_commit = True
 
+    batch_size = 1
+    if '--batch' in sys.argv:
+        batch_size = int(sys.argv[sys.argv.index('--batch') + 1])
+
+    jobs = 1
+    if '--jobs' in sys.argv:
+        jobs = int(sys.argv[sys.argv.index('--jobs') + 1])
 
     if sys.argv[1] == 'gen_qflag_stub':
         nb = 1
@@ -1239,14 +1853,31 @@ if __name__ == '__main__':
 
         qflags_to_process_json = 'qflags_to_process.json'
         qflag_result_json = 'qflags_process_result.json'
-        more_available = -1
-        while (nb > 0 or process_all) and (more_available == -1 or more_available > 0):
-            nb -= 1
-            more_available = process_qflag(qflags_to_process_json, qflag_result_json, auto_commit)
-            if more_available:
-                log_progress('Still %d flags to process' % more_available)
+        with open(qflags_to_process_json) as f:
+            qflags_to_process = collections.deque(json.load(f)['qflags_to_process'])
+        store = QFlagProgressStore(qflag_result_json)
+
+        if jobs > 1:
+            flags = next_qflags_to_process(qflags_to_process, store,
+                                           len(qflags_to_process) if process_all else nb)
+            process_qflags_per_module(flags, store, auto_commit, batch_size, jobs)
+        else:
+            more_available = -1
+            while (nb > 0 or process_all) and (more_available == -1 or more_available > 0):
+                nb_in_batch = batch_size if process_all else min(nb, batch_size)
+                nb -= nb_in_batch
+                more_available = process_qflags(qflags_to_process, store, auto_commit, nb_in_batch)
+                if more_available:
+                    log_progress('Still %d flags to process' % more_available)
+
+        # save our processing result
+        store.export()
+        save_cst_module_cache()
         log_progress('All qflags are processed.')
 
+    elif sys.argv[1] == 'export_results':
+        QFlagProgressStore('qflags_process_result.json').export()
+
     elif sys.argv[1] == 'analyse_grep_results':
         if len(sys.argv) <= 4 or sys.argv[3] != '--group':
             print('Error, you must provide the filename of the grep results and the group of modules to use\n')
@@ -1273,6 +1904,16 @@ if __name__ == '__main__':
         qflag_process_results = sys.argv[2]
         regen_test_files(qflag_process_results)
 
+    elif sys.argv[1] == 'convert_to_qflags_base':
+
+        if len(sys.argv) <= 2:
+            print('Error, you must provide the filename of the qflag-process-results\n')
+            print(USAGE)
+            sys.exit(1)
+
+        qflag_process_results = sys.argv[2]
+        convert_to_qflags_base(qflag_process_results)
+
     else:
         print('Error, invalid command line arguments\n')
         print(USAGE)
@@ -9,19 +9,19 @@ else:
 import pytest
 
 ### Specific part
-# file generated from qflags_test_template.py for QFlags class "QClearBuffers.BufferTypeFlags" and flag class "QBuffer.BufferType"
+# file generated from qflags_test_template.py for QFlags class "QClearBuffers.BufferTypeFlags" and flag class "QClearBuffers.BufferType"
 from PyQt5 import Qt3DRender
 
-OneFlagClass = Qt3DRender.QBuffer.BufferType
+OneFlagClass = Qt3DRender.QClearBuffers.BufferType
 MultiFlagClass = Qt3DRender.QClearBuffers.BufferTypeFlags
 
-oneFlagRefValue1 = Qt3DRender.QBuffer.BufferType.VertexBuffer
-oneFlagRefValue2 = Qt3DRender.QBuffer.BufferType.IndexBuffer
+oneFlagRefValue1 = Qt3DRender.QClearBuffers.BufferType.None_
+oneFlagRefValue2 = Qt3DRender.QClearBuffers.BufferType.ColorBuffer
 
 OR_CONVERTS_TO_MULTI: Literal[False] = False
 OR_INT_CONVERTS_TO_MULTI: Literal[False] = False
 INT_OR_CONVERTS_TO_MULTI: Literal[False] = False
-SUPPORTS_ONE_OP_MULTI: Literal[False] = False
+SUPPORTS_ONE_OP_MULTI: Literal[True] = True
 ### End of specific part
 
 def assert_type_of_value_int(value: int) -> None:
@@ -230,9 +230,9 @@ def test_on_multi_flag_class() -> None:
 	#########################################################1
 
 	if not SUPPORTS_ONE_OP_MULTI:
-		pytest.raises(TypeError, lambda: oneFlagValue1 | multiFlagValue1)  # type: ignore[operator]
-		pytest.raises(TypeError, lambda: oneFlagValue1 & multiFlagValue1)  # type: ignore[operator]
-		pytest.raises(TypeError, lambda: oneFlagValue1 ^ multiFlagValue1)  # type: ignore[operator]
+		pytest.raises(TypeError, lambda: oneFlagValue1 | multiFlagValue1)
+		pytest.raises(TypeError, lambda: oneFlagValue1 & multiFlagValue1)
+		pytest.raises(TypeError, lambda: oneFlagValue1 ^ multiFlagValue1)
 
 	pytest.raises(TypeError, lambda: 1 | multiFlagValue1 )	# type: ignore[operator]
 	pytest.raises(TypeError, lambda: 1 & multiFlagValue1 )	# type: ignore[operator]
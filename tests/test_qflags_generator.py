@@ -0,0 +1,47 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+QFLAGS_DIR = Path(__file__).parent / 'qflags'
+sys.path.insert(0, str(QFLAGS_DIR))
+import generate_qflags_stubs_and_tests as qflags_gen  # noqa: E402
+
+# Qt3DRender declares an enum BufferType both in QBuffer and in QClearBuffers
+CLEAR_BUFFERS_GREP_LINE = ('src\\render\\framegraph\\qclearbuffers.h:    '
+                           'Q_DECLARE_FLAGS(BufferTypeFlags, BufferType)\n')
+
+
+def test_identify_qflag_location_enclosing_class(tmp_path, monkeypatch):
+    """The enum of a qflag class is the one of its enclosing class"""
+    grep_result = tmp_path / 'qt3d-qflag-grep-result.txt'
+    grep_result.write_text(CLEAR_BUFFERS_GREP_LINE)
+    monkeypatch.chdir(QFLAGS_DIR)
+
+    flags = qflags_gen.identify_qflag_location(str(grep_result), ['Qt3DRender'])
+
+    assert [(flag_info.module_name, flag_info.qflag_full_class_name, flag_info.enum_full_class_name)
+            for flag_info in flags] == [
+        ('Qt3DRender', 'QClearBuffers.BufferTypeFlags', 'QClearBuffers.BufferType')]
+
+
+def test_identify_qflag_location_ambiguous_enum(tmp_path, monkeypatch):
+    """Several enums in the enclosing class of a qflag class are reported"""
+    grep_result = tmp_path / 'qt3d-qflag-grep-result.txt'
+    grep_result.write_text(CLEAR_BUFFERS_GREP_LINE)
+    stubs_dir = tmp_path / 'PyQt5-stubs'
+    stubs_dir.mkdir()
+    stubs_dir.joinpath('Qt3DRender.pyi').write_text(
+        'class QClearBuffers(QFrameGraphNode):\n'
+        '    if sys.version_info >= (3, 8):\n'
+        '        class BufferType(int): ...\n'
+        '    else:\n'
+        '        class BufferType(int): ...\n'
+        '    class BufferTypeFlags(sip.simplewrapper): ...\n')
+    # the stubs are read from ../../PyQt5-stubs
+    work_dir = tmp_path / 'tests' / 'qflags'
+    work_dir.mkdir(parents=True)
+    monkeypatch.chdir(work_dir)
+
+    with pytest.raises(ValueError, match='QClearBuffers.BufferTypeFlags'):
+        qflags_gen.identify_qflag_location(str(grep_result), ['Qt3DRender'])
@@ -1,11 +1,42 @@
+import ast
+import hashlib
 import os
+import re
+import shutil
+import sys
 from pathlib import Path
+from typing import Dict, FrozenSet, Iterator, List, Optional, Set, Tuple
 import pytest
-from mypy import api
+from mypy import api, modulefinder
+from mypy.build import default_data_dir
+from mypy.options import Options
+from mypy.version import __version__ as mypy_version
 from PyQt5.QtWidgets import QApplication
 
 
 TESTS_DIR = Path(__file__).parent
+STUBS_DIR = TESTS_DIR.parent / 'PyQt5-stubs'
+MYPY_CACHE_ROOT = TESTS_DIR.parent / '.mypy_cache'
+
+# ie "tests/qobject.py:12: error: ..." or "tests/qobject.py:12:5: note: ..."
+MYPY_MESSAGE_RE = re.compile(r'(?P<path>.+?\.py):\d+(:\d+)?: ')
+
+# status lines of mypy and dmypy which are not about the checked files
+MYPY_STATUS_PREFIXES = ("Success: no issues found", "Found ", "Daemon started",
+                        "Daemon stopped", "Restarting: ")
+
+# Import cycles between stub modules which can not be broken without losing
+# precision, ie QtGui.QActionEvent.action() returns a QtWidgets.QAction
+KNOWN_IMPORT_CYCLES = {
+    frozenset({'QtGui', 'QtWidgets'}),
+    frozenset({'QtMultimedia', 'QtMultimediaWidgets'}),
+    frozenset({'QtWebKit', 'QtWebKitWidgets'}),
+}
+
+# Set PYQT5_STUBS_DMYPY=1 to check the example files with a mypy daemon
+# using the stubs of this checkout. The stubs are analysed once per session
+# and only the example file is checked by each test.
+USE_DMYPY = os.environ.get('PYQT5_STUBS_DMYPY') == '1'
 
 
 @pytest.fixture(name="qapplication", scope="session")
@@ -28,34 +59,251 @@ def gen_abs_qflags_tests():
     yield from TESTS_DIR.joinpath('qflags').glob('test_*.py')
 
 
+def mypy_stubs_dir() -> Path:
+    """Directory of the PyQt5 stubs read by mypy.
+
+    Without the daemon, mypy reads the installed PyQt5-stubs package, which
+    is the checkout only if it was installed with pip install -e .
+    """
+    options = Options()
+    search_paths = modulefinder.compute_search_paths([], options, default_data_dir())
+    result = modulefinder.FindModuleCache(search_paths, None, options).find_module('PyQt5.QtCore')
+    if isinstance(result, str):
+        return Path(result).parent
+    # not found, mypy reports it in the tests
+    return STUBS_DIR
+
+
+def mypy_cache_key(stubs_dir: Path) -> str:
+    """Hash of the stubs and of the mypy version."""
+    sha256 = hashlib.sha256(mypy_version.encode('utf-8'))
+    for path in sorted(stubs_dir.glob('*.pyi')):
+        sha256.update(path.name.encode('utf-8'))
+        sha256.update(path.read_bytes())
+    return sha256.hexdigest()[:16]
+
+
+def mypy_cache_args(cache_dir: Path) -> List[str]:
+    # incremental mode is disabled in setup.cfg, it is needed for the cache
+    return ['--incremental', '--cache-dir', os.fspath(cache_dir)]
+
+
+@pytest.fixture(name="mypy_cache_dir", scope="session")
+def mypy_cache_dir_fixture() -> Path:
+    """mypy cache shared by all the sessions using the same stubs.
+
+    The cache is warmed with all the stub modules the first time. mypy
+    writes its cache files atomically and stores each Python version in its
+    own sub-directory, so the cache can be shared by pytest-xdist workers and
+    tox environments. mypy still validates the cached modules against their
+    sources, so a stale cache is only slower, never wrong.
+
+    The caches of the other stubs are removed when a new one is created.
+    """
+    stubs_dir = mypy_stubs_dir()
+    cache_dir = MYPY_CACHE_ROOT / f'pyqt5-stubs-{mypy_cache_key(stubs_dir)}'
+    if not cache_dir.exists():
+        for old_cache_dir in MYPY_CACHE_ROOT.glob('pyqt5-stubs-*'):
+            shutil.rmtree(old_cache_dir, ignore_errors=True)
+    python_version = '%d.%d' % sys.version_info[:2]
+    warm_marker = cache_dir / f'warm-{python_version}'
+    if not warm_marker.exists():
+        modules = sorted(path.stem for path in stubs_dir.glob('*.pyi')
+                         if path.stem != '__init__')
+        # errors in the stubs are reported by the tests using them
+        api.run([*mypy_cache_args(cache_dir), '-c',
+                 '\n'.join(f'import PyQt5.{module}' for module in modules)])
+        warm_marker.touch()
+    return cache_dir
+
+
+@pytest.fixture(name="mypy_messages", scope="session")
+def mypy_messages_fixture(mypy_cache_dir: Path) -> Dict[Optional[Path], List[str]]:
+    """Run mypy once over all example and qflags files.
+
+    The stubs are loaded and analysed only once. The messages are returned
+    per checked file, the other messages (ie about the stubs themselves)
+    are under the key None and make test_stubs_mypy_run fail.
+    """
+    paths = list(gen_tests()) + list(gen_abs_qflags_tests())
+    stdout, stderr, exitcode = api.run([*mypy_cache_args(mypy_cache_dir),
+                                        *[os.fspath(path) for path in paths]])
+    return parse_mypy_output(stdout, stderr, exitcode, paths)
+
+
+def parse_mypy_output(stdout: str, stderr: str, exitcode: int,
+                      paths: List[Path]) -> Dict[Optional[Path], List[str]]:
+    """Map the messages of mypy to the checked files."""
+    checked_paths = {Path(os.path.abspath(path)) for path in paths}
+    messages: Dict[Optional[Path], List[str]] = {}
+    for line in stdout.splitlines():
+        if line.startswith(MYPY_STATUS_PREFIXES):
+            continue
+        match = MYPY_MESSAGE_RE.match(line)
+        path = Path(os.path.abspath(match['path'])) if match else None
+        if path not in checked_paths:
+            path = None
+        messages.setdefault(path, []).append(line)
+    messages.setdefault(None, []).extend(stderr.splitlines())
+    if exitcode != 0 and not any(messages.values()):
+        messages[None].append(f"mypy exited with code {exitcode}")
+    return messages
+
+
+class DmypyDaemon:
+    """mypy daemon checking the files against the stubs of this checkout.
+
+    The daemon is restarted when a stub is modified.
+    """
+
+    def __init__(self, work_dir: Path) -> None:
+        self.status_file = work_dir / 'dmypy.json'
+        # PyQt5-stubs can not be put on the mypy path, it is exposed as PyQt5
+        self.mypy_path = work_dir / 'stubs'
+        self.mypy_path.mkdir()
+        (self.mypy_path / 'PyQt5').symlink_to(STUBS_DIR, target_is_directory=True)
+        self.stubs_signature = self.compute_stubs_signature()
+
+    @staticmethod
+    def compute_stubs_signature() -> List[Tuple[str, int, int]]:
+        """Modification time and size of every stub."""
+        signature = []
+        for path in sorted(STUBS_DIR.glob('*.pyi')):
+            stat = path.stat()
+            signature.append((path.name, stat.st_mtime_ns, stat.st_size))
+        return signature
+
+    def run(self, *args: str) -> Tuple[str, str, int]:
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            # inherited by the daemon when it is started
+            monkeypatch.setenv('MYPYPATH', os.fspath(self.mypy_path))
+            return api.run_dmypy(['--status-file', os.fspath(self.status_file),
+                                  *args])
+
+    def check(self, paths: List[Path]) -> Dict[Optional[Path], List[str]]:
+        """Check the files, starting the daemon if needed."""
+        stubs_signature = self.compute_stubs_signature()
+        if stubs_signature != self.stubs_signature:
+            self.stop()
+            self.stubs_signature = stubs_signature
+
+        stdout, stderr, exitcode = self.run(
+            'run', '--timeout', '3600', '--',
+            *[os.fspath(path) for path in paths])
+        return parse_mypy_output(stdout, stderr, exitcode, paths)
+
+    def stop(self) -> None:
+        if self.status_file.exists():
+            self.run('stop')
+
+
+@pytest.fixture(name="dmypy_daemon", scope="session")
+def dmypy_daemon_fixture(tmp_path_factory: pytest.TempPathFactory
+                         ) -> Iterator[DmypyDaemon]:
+    try:
+        daemon = DmypyDaemon(tmp_path_factory.mktemp('dmypy'))
+    except OSError as exc:
+        pytest.skip(f'Could not link the stubs for the mypy daemon: {exc}')
+    yield daemon
+    daemon.stop()
+
+
+def get_mypy_messages(request: pytest.FixtureRequest,
+                      paths: List[Path]) -> Dict[Optional[Path], List[str]]:
+    """Messages of mypy about the files, from the daemon or the single run."""
+    if USE_DMYPY:
+        daemon: DmypyDaemon = request.getfixturevalue('dmypy_daemon')
+        return daemon.check(paths)
+    messages: Dict[Optional[Path], List[str]] = request.getfixturevalue('mypy_messages')
+    return messages
+
+
+def check_mypy_messages(messages: Dict[Optional[Path], List[str]],
+                        paths: List[Path]) -> None:
+    """Check that mypy did not report anything about the given files.
+
+    The daemon checks the files of each test in its own run, which is also
+    blamed for the messages not about a checked file. Those of the single
+    run are checked by test_stubs_mypy_run.
+    """
+    file_messages = list(messages[None]) if USE_DMYPY else []
+    for path in paths:
+        file_messages += messages.get(Path(os.path.abspath(path)), [])
+    for message in file_messages:
+        print(message)
+
+    assert not file_messages
+
+
 @pytest.mark.parametrize('filepath',
                          list(gen_tests()),
                          ids=[v.relative_to(TESTS_DIR).as_posix() for v in gen_tests()]
                          )
-def test_stubs(filepath: Path) -> None:
+def test_stubs(filepath: Path, request: pytest.FixtureRequest) -> None:
     """Run mypy over example files."""
-    stdout, stderr, exitcode = api.run([os.fspath(filepath)])
-    if stdout:
-        print(stdout)
-    if stderr:
-        print(stderr)
+    check_mypy_messages(get_mypy_messages(request, [filepath]), [filepath])
 
-    assert stdout.startswith("Success: no issues found")
-    assert not stderr
-    assert exitcode == 0
 
-
-def test_stubs_qflags() -> None:
+def test_stubs_qflags(request: pytest.FixtureRequest) -> None:
     """Run mypy over qflags files."""
-    stdout, stderr, exitcode = api.run([os.fspath(path) for path in gen_abs_qflags_tests()])
-    if stdout:
-        print(stdout)
-    if stderr:
-        print(stderr)
-
-    assert stdout.startswith("Success: no issues found")
-    assert not stderr
-    assert exitcode == 0
+    paths = list(gen_abs_qflags_tests())
+    check_mypy_messages(get_mypy_messages(request, paths), paths)
+
+
+@pytest.mark.skipif(USE_DMYPY, reason="each test runs the daemon and checks its messages")
+def test_stubs_mypy_run(mypy_messages: Dict[Optional[Path], List[str]]) -> None:
+    """The single mypy run reports nothing outside the checked files."""
+    for message in mypy_messages[None]:
+        print(message)
+
+    assert not mypy_messages[None]
+
+
+def stub_imports(path: Path) -> Set[str]:
+    """Other stub modules imported by the stub."""
+    imports = set()
+    for node in ast.walk(ast.parse(path.read_text(encoding='utf-8'))):
+        if isinstance(node, ast.ImportFrom) and node.module == 'PyQt5':
+            imports.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module \
+                and node.module.startswith('PyQt5.'):
+            imports.add(node.module.split('.')[1])
+        elif isinstance(node, ast.Import):
+            imports.update(alias.name.split('.')[1] for alias in node.names
+                           if alias.name.startswith('PyQt5.'))
+    imports.discard(path.stem)
+    return imports
+
+
+def test_stubs_import_graph() -> None:
+    """QtCore is a leaf of the import graph and no new import cycle appears.
+
+    Every module of an import cycle is analysed together by mypy, so a
+    program using only QtCore would pay for the GUI stubs.
+    """
+    graph = {path.stem: stub_imports(path) for path in STUBS_DIR.glob('*.pyi')
+             if path.stem != '__init__'}
+
+    def reachable(module: str) -> Set[str]:
+        seen: Set[str] = set()
+        to_visit = [module]
+        while to_visit:
+            for imported in graph.get(to_visit.pop(), ()):
+                if imported not in seen:
+                    seen.add(imported)
+                    to_visit.append(imported)
+        return seen
+
+    assert reachable('QtCore') <= {'sip'}
+
+    reachable_from = {module: reachable(module) for module in graph}
+    cycles: Set[FrozenSet[str]] = set()
+    for module, modules in reachable_from.items():
+        cycle = frozenset({module} | {other for other in modules
+                                      if module in reachable_from[other]})
+        if len(cycle) > 1:
+            cycles.add(cycle)
+    assert cycles == KNOWN_IMPORT_CYCLES
 
 # note: no need to run explicitly pytest over qflags, because pytest finds them automatically
 